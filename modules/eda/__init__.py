@@ -0,0 +1,61 @@
+# Public names are imported lazily on first access (PEP 562), so
+# `import modules.eda` does not pull in pandas, NLTK, scikit-learn or matplotlib.
+import importlib
+
+_EXPORTS = {
+    # Data Loader
+    'load_news_data': '.data_loader',
+
+    # Preprocessing
+    'preprocess_news_dataframe': '.preprocessing',
+    'clean_text': '.preprocessing',
+    'clean_texts': '.preprocessing',
+
+    # Descriptive Statistics
+    'dataset_overview': '.descriptive_stats',
+    'analyze_headline_length': '.descriptive_stats',
+    'count_articles_per_publisher': '.descriptive_stats',
+
+    # Publisher Analysis
+    'get_top_publishers': '.publisher_analysis',
+    'extract_email_domains': '.publisher_analysis',
+    'publisher_content_summary': '.publisher_analysis',
+
+    # Text Analysis (NLP)
+    'extract_keywords': '.text_analysis',
+    'nlp_topic_modeling': '.text_analysis',
+
+    # Time Series Analysis
+    'daily_publication_count': '.time_series_analysis',
+    'detect_publication_spikes': '.time_series_analysis',
+    'hourly_publication_distribution': '.time_series_analysis',
+    'PublicationProfile': '.time_series_analysis',
+
+    # Online Spike Detection
+    'EWMASpikeDetector': '.spike_detection',
+    'MADSpikeDetector': '.spike_detection',
+    'PublicationSpikeMonitor': '.spike_detection',
+    'count_matrix': '.spike_detection',
+    'restore_detector': '.spike_detection',
+
+    # Plotting
+    'plot_headline_length_distribution': '.plot',
+    'plot_top_publishers': '.plot',
+    'plot_daily_publication': '.plot',
+    'plot_spikes': '.plot',
+    'plot_hourly_publication': '.plot',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
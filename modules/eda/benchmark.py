@@ -0,0 +1,235 @@
+import os
+import re
+import subprocess
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from .plot import plot_daily_publication, plot_spikes
+from .preprocessing import clean_texts
+from .time_series_analysis import daily_publication_count, detect_publication_spikes
+
+# Seconds `import modules.eda` (or `modules.eda.preprocessing`) may take in a fresh interpreter
+IMPORT_TIME_BUDGET = 0.25
+
+# Audit events (sys.addaudithook) that mean an import reached for the network
+NETWORK_AUDIT_EVENTS = ("socket.connect", "socket.getaddrinfo", "urllib.Request")
+
+# clean_texts must be at least this many times faster than the per-row apply path
+MIN_CLEAN_TEXT_SPEEDUP = 20
+
+# Project root (the directory containing `modules/`)
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Vocabulary for synthetic headlines: stopwords, inflected words, numbers and punctuation
+_WORDS = [
+    "the", "a", "of", "to", "in", "on", "for", "is", "are", "with", "and", "not",
+    "Stocks", "shares", "rising", "fell", "companies", "analysts", "earnings", "reports",
+    "markets", "Apple", "Tesla", "rates", "prices", "gains", "losses", "targets", "says",
+    "upgrades", "downgrades", "buying", "sells", "Q3", "2020", "$AAPL", "50%", "U.S.",
+    "mid-day", "movers", "highs", "lows", "dividends", "options", "traders", "week's",
+]
+
+
+def make_synthetic_headlines(n_rows, n_unique=None, seed=0):
+    """
+    Builds a Series of synthetic headlines (repeated, like syndicated news).
+
+    Args:
+        n_rows (int): Number of headlines
+        n_unique (int): Number of distinct headlines (default: n_rows // 5)
+        seed (int): Random seed
+
+    Returns:
+        pd.Series
+    """
+    rng = np.random.default_rng(seed)
+    n_unique = n_unique or max(1, n_rows // 5)
+    vocab = np.array(_WORDS, dtype=object)
+    lengths = rng.integers(5, 15, size=n_unique)
+    unique = np.array([" ".join(rng.choice(vocab, size=n)) for n in lengths], dtype=object)
+    return pd.Series(unique[rng.integers(0, n_unique, size=n_rows)], name='headline')
+
+
+def _apply_clean_text(text):
+    """
+    The original per-row clean_text: stopwords and lemmatizer rebuilt on every call.
+    Kept here only as the benchmark baseline.
+    """
+    from nltk.corpus import stopwords
+    from nltk.stem import WordNetLemmatizer
+
+    text = str(text).lower()
+    text = re.sub(r'[^a-z\s]', '', text)
+    tokens = text.split()
+
+    stop_words = set(stopwords.words('english'))
+    tokens = [w for w in tokens if w not in stop_words]
+
+    lemmatizer = WordNetLemmatizer()
+    tokens = [lemmatizer.lemmatize(w) for w in tokens]
+
+    return ' '.join(tokens)
+
+
+def benchmark_clean_text(n_rows=1_000_000, n_unique=None, seed=0):
+    """
+    Compares the original row-by-row clean_text apply path with clean_texts.
+
+    Args:
+        n_rows (int): Number of synthetic headlines
+        n_unique (int): Number of distinct headlines
+        seed (int): Random seed
+
+    Returns:
+        dict: Timings in seconds, speedup and whether the outputs are identical
+    """
+    headlines = make_synthetic_headlines(n_rows, n_unique, seed)
+
+    start = time.perf_counter()
+    expected = headlines.apply(_apply_clean_text)
+    apply_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = clean_texts(headlines)
+    batch_seconds = time.perf_counter() - start
+
+    return {
+        "rows": n_rows,
+        "apply_seconds": apply_seconds,
+        "batch_seconds": batch_seconds,
+        "speedup": apply_seconds / batch_seconds,
+        "identical": bool(expected.equals(result)),
+    }
+
+
+def check_clean_text(n_rows=1_000_000, min_speedup=MIN_CLEAN_TEXT_SPEEDUP, seed=0):
+    """
+    Runs benchmark_clean_text and fails unless the outputs are identical and
+    clean_texts is at least min_speedup times faster. The default size is the
+    million headlines the speedup target is stated for.
+
+    Args:
+        n_rows (int): Number of synthetic headlines
+        min_speedup (float): Required speedup over the per-row apply path
+        seed (int): Random seed
+
+    Returns:
+        dict: The benchmark result
+
+    Raises:
+        AssertionError: If the outputs differ or the speedup is below min_speedup
+    """
+    result = benchmark_clean_text(n_rows, seed=seed)
+    if not result["identical"]:
+        raise AssertionError("clean_texts output differs from the per-row clean_text path")
+    if result["speedup"] < min_speedup:
+        raise AssertionError(
+            f"clean_texts speedup {result['speedup']:.1f}x is below the required {min_speedup}x"
+        )
+    return result
+
+
+def benchmark_import_time(module="modules.eda", budget=IMPORT_TIME_BUDGET, repeat=5):
+    """
+    Measures how long importing a module takes in a fresh interpreter, and records
+    any network access made while importing it (nltk.download fetches its index
+    over urllib, so a download shows up here as well).
+
+    Args:
+        module (str): Dotted module name to import
+        budget (float): Allowed import time in seconds
+        repeat (int): Number of fresh interpreters to try (the best run is reported)
+
+    Returns:
+        dict: Best import time in seconds, the budget, whether it was met and the
+        network audit events seen in any run
+    """
+    code = (
+        "import sys, time; events = []; "
+        f"sys.addaudithook(lambda event, args: event in {NETWORK_AUDIT_EVENTS!r} and events.append(event)); "
+        f"start = time.perf_counter(); import {module}; seconds = time.perf_counter() - start; "
+        "print(seconds, *sorted(set(events)))"
+    )
+    timings, network = [], set()
+    for _ in range(repeat):
+        out = subprocess.run(
+            [sys.executable, "-c", code], cwd=_PROJECT_ROOT,
+            capture_output=True, text=True, check=True,
+        )
+        seconds, *events = out.stdout.strip().splitlines()[-1].split()
+        timings.append(float(seconds))
+        network.update(events)
+
+    seconds = min(timings)
+    return {
+        "module": module,
+        "seconds": seconds,
+        "budget": budget,
+        "within_budget": seconds <= budget,
+        "network_events": sorted(network),
+    }
+
+
+def check_import_time(module="modules.eda", budget=IMPORT_TIME_BUDGET):
+    """
+    Runs benchmark_import_time and fails if the import is over budget or
+    touches the network.
+
+    Returns:
+        dict: The benchmark result
+
+    Raises:
+        AssertionError: If the best import time exceeds the budget or the import
+        opened a connection, resolved a host or made a URL request
+    """
+    result = benchmark_import_time(module, budget)
+    if result["network_events"]:
+        raise AssertionError(
+            f"import {module} touched the network ({', '.join(result['network_events'])})"
+        )
+    if not result["within_budget"]:
+        raise AssertionError(f"import {module} took {result['seconds']:.3f}s (budget {budget}s)")
+    return result
+
+
+def check_publication_plots(n_rows=200_000, n_days=4000, seed=0):
+    """
+    Draws daily_publication_count output (a datetime.date index) with every
+    downsampling method, so the index types the plots really get are covered.
+
+    Args:
+        n_rows (int): Number of synthetic articles
+        n_days (int): Days the publication times are spread over
+        seed (int): Random seed
+
+    Returns:
+        dict: PNG size in bytes per plot and downsampling method
+
+    Raises:
+        AssertionError: If a plot does not produce an image
+    """
+    rng = np.random.default_rng(seed)
+    seconds = rng.integers(0, n_days * 86_400, size=n_rows)
+    df = pd.DataFrame({"date": pd.Timestamp("2010-01-01", tz="UTC") + pd.to_timedelta(seconds, unit="s")})
+    daily_counts = daily_publication_count(df)
+    spikes, _ = detect_publication_spikes(daily_counts)
+
+    sizes = {}
+    for method in ("minmax", "lttb", None):
+        sizes[f"daily_publication/{method}"] = len(plot_daily_publication(daily_counts, method, output="png"))
+        sizes[f"spikes/{method}"] = len(plot_spikes(daily_counts, spikes, method, output="png"))
+    empty = [name for name, size in sizes.items() if size == 0]
+    if empty:
+        raise AssertionError(f"no image produced for {', '.join(empty)}")
+    return sizes
+
+
+if __name__ == "__main__":
+    # Run from the project root as `python -m modules.eda.benchmark` (CI does)
+    print(check_publication_plots())
+    print(check_clean_text())
+    print(check_import_time("modules.eda"))
+    print(check_import_time("modules.eda.preprocessing"))
@@ -1,20 +1,35 @@
 import pandas as pd
 import os
 
-def load_news_data(file_path="../data/news_data/news.csv"):
+from .news_store import load_news, is_store_fresh
+
+
+def load_news_data(file_path="../data/news_data/news.csv", use_store=True,
+                   columns=None, tickers=None, start=None, end=None):
     """
-    Loads the news CSV file and returns a pandas DataFrame.
+    Loads the news data and returns a pandas DataFrame.
+    Reads the columnar store (see news_store.build_news_store) when it is newer
+    than the CSV, otherwise parses the CSV. Either way 'date' is parsed to UTC
+    (malformed dates become NaT), 'stock'/'publisher' are categorical and
+    'headline' is string-typed.
+    Column selection and ticker/date filters are pushed down into the reader,
+    so unneeded columns and rows are never decoded.
 
     Args:
         file_path (str): Relative or absolute path to the news CSV file.
+        use_store (bool): Set False to always parse the CSV.
+        columns (list of str): Columns to load (default: all).
+        tickers (list of str): Only load these tickers (case-insensitive).
+        start, end: Only load articles with start <= date < end (naive dates are UTC).
 
     Returns:
         pd.DataFrame
     """
-    if not os.path.exists(file_path):
+    if not os.path.exists(file_path) and not (use_store and is_store_fresh(file_path)):
         raise FileNotFoundError(f"❌ File not found: {file_path}")
 
-    df = pd.read_csv(file_path)
+    df = load_news(file_path, use_store=use_store, columns=columns,
+                   tickers=tickers, start=start, end=end)
 
     # Basic info
     print(f"📂 Loaded '{file_path}' successfully.")
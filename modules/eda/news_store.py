@@ -0,0 +1,401 @@
+import os
+import shutil
+import zlib
+
+import pandas as pd
+
+# Columnar copy of news.csv, written next to it as <name>.parquet/
+STORE_SUFFIX = ".parquet"
+
+# Hive partition keys: UTC year of publication and a stable hash bucket of the ticker
+PARTITION_COLUMNS = ["year", "ticker_bucket"]
+
+TICKER_BUCKETS = 16
+
+# Rows are sorted by (stock, date) inside each file; small row groups let
+# readers skip groups by their min/max statistics
+ROW_GROUP_SIZE = 16_384
+
+CATEGORICAL_COLUMNS = ["stock", "publisher"]
+STRING_COLUMNS = ["headline", "url"]
+
+
+def news_store_path(csv_path):
+    """
+    Returns the columnar store location for a news CSV (news.csv -> news.parquet/).
+
+    Args:
+        csv_path (str): Path to the news CSV file
+
+    Returns:
+        str
+    """
+    return os.path.splitext(csv_path)[0] + STORE_SUFFIX
+
+
+def ticker_bucket(tickers):
+    """
+    Maps tickers to their partition bucket (CRC32 of the upper-cased ticker).
+
+    Args:
+        tickers (iterable of str)
+
+    Returns:
+        list of int
+    """
+    return [zlib.crc32(str(t).upper().encode("utf-8")) % TICKER_BUCKETS for t in tickers]
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        raise ImportError(
+            "The columnar news store needs pyarrow. Install it with `pip install pyarrow`."
+        ) from None
+
+
+def has_pyarrow():
+    """
+    Returns True if pyarrow is installed (the store is optional without it).
+    """
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def string_dtype():
+    """
+    Returns the dtype used for text columns: Arrow-backed strings when pyarrow
+    is installed (zero-copy from the store), else the default string dtype.
+    """
+    return pd.StringDtype("pyarrow") if has_pyarrow() else pd.StringDtype()
+
+
+def _string_types_mapper(arrow_type):
+    import pyarrow as pa
+
+    if arrow_type in (pa.string(), pa.large_string()):
+        return pd.StringDtype("pyarrow")
+    return None
+
+
+def _utc_timestamp(value):
+    """Converts a date-like bound to a UTC Timestamp (naive values are taken as UTC)."""
+    if value is None:
+        return None
+    ts = pd.Timestamp(value)
+    return ts.tz_localize("UTC") if ts.tz is None else ts.tz_convert("UTC")
+
+
+def _parse_dates(values):
+    """
+    Parses the 'date' column to UTC; malformed values become NaT instead of raising.
+    The vectorized parse infers one format from the first value, so a column that mixes
+    formats (with and without a UTC offset) is re-parsed value by value rather than coerced,
+    which would turn every valid value in the other format into NaT.
+    """
+    try:
+        return pd.to_datetime(values, utc=True)
+    except (ValueError, TypeError):
+        return pd.to_datetime(values, utc=True, errors="coerce", format="mixed")
+
+
+def _upper_set(tickers):
+    if tickers is None:
+        return None
+    if isinstance(tickers, str):
+        tickers = [tickers]
+    return sorted({str(t).upper() for t in tickers})
+
+
+def _filter_frame(df, tickers=None, start=None, end=None):
+    """Applies ticker (case-insensitive) and [start, end) date filters to a loaded frame."""
+    mask = pd.Series(True, index=df.index)
+    if tickers is not None:
+        mask &= df["stock"].astype(str).str.upper().isin(tickers)
+    if start is not None:
+        mask &= df["date"] >= start
+    if end is not None:
+        mask &= df["date"] < end
+    return df[mask]
+
+
+def _csv_reader_args(csv_path, columns, tickers, start, end):
+    """Validates the requested columns and builds the typed read_csv arguments."""
+    header = list(pd.read_csv(csv_path, nrows=0).columns)
+    columns = header if columns is None else list(columns)
+    missing = [c for c in columns if c not in header]
+    if missing:
+        raise ValueError(f"Columns not found in {csv_path}: {missing}")
+
+    needed = list(columns)
+    if tickers is not None and "stock" not in needed:
+        needed.append("stock")
+    if (start is not None or end is not None) and "date" not in needed:
+        needed.append("date")
+
+    dtypes = {c: "category" for c in CATEGORICAL_COLUMNS}
+    dtypes.update({c: string_dtype() for c in STRING_COLUMNS})
+    read_kwargs = dict(
+        usecols=needed,
+        dtype={c: t for c, t in dtypes.items() if c in needed},
+    )
+    return columns, read_kwargs
+
+
+def iter_news_csv(csv_path, chunksize=100_000, columns=None, tickers=None, start=None, end=None):
+    """
+    Reads the news CSV in chunks of at most `chunksize` rows, typed and filtered
+    like read_news_csv. Chunks with no matching rows are skipped.
+
+    Args:
+        csv_path (str): Path to the news CSV file
+        chunksize (int): Rows read per chunk
+        columns, tickers, start, end: See read_news_csv
+
+    Yields:
+        pd.DataFrame
+    """
+    tickers, start, end = _upper_set(tickers), _utc_timestamp(start), _utc_timestamp(end)
+    columns, read_kwargs = _csv_reader_args(csv_path, columns, tickers, start, end)
+    for chunk in pd.read_csv(csv_path, chunksize=chunksize, **read_kwargs):
+        if "date" in chunk.columns:
+            chunk["date"] = _parse_dates(chunk["date"])
+        chunk = _filter_frame(chunk, tickers, start, end)
+        if len(chunk):
+            # usecols keeps file order; return the requested order
+            yield chunk[columns]
+
+
+def read_news_csv(csv_path, columns=None, tickers=None, start=None, end=None, chunksize=500_000):
+    """
+    Reads the news CSV with typed columns: UTC 'date', categorical 'stock'/'publisher'
+    and string-typed 'headline'/'url'.
+    Only the requested columns are parsed; with ticker/date filters the file is
+    read in chunks so rows outside the filter are never held in memory together.
+
+    Args:
+        csv_path (str): Path to the news CSV file
+        columns (list of str): Columns to return (default: all)
+        tickers (list of str): Keep only these tickers (case-insensitive)
+        start, end: Keep rows with start <= date < end (naive values are UTC)
+        chunksize (int): Rows per chunk when filtering
+
+    Returns:
+        pd.DataFrame
+    """
+    if tickers is None and start is None and end is None:
+        columns, read_kwargs = _csv_reader_args(csv_path, columns, None, None, None)
+        df = pd.read_csv(csv_path, **read_kwargs)
+        if "date" in df.columns:
+            df["date"] = _parse_dates(df["date"])
+        return df[columns]
+
+    chunks = list(iter_news_csv(csv_path, chunksize, columns, tickers, start, end))
+    if not chunks:
+        columns, read_kwargs = _csv_reader_args(csv_path, columns, tickers, start, end)
+        empty = pd.read_csv(csv_path, nrows=0, **read_kwargs)
+        if "date" in empty.columns:
+            empty["date"] = _parse_dates(empty["date"])
+        return empty[columns]
+    df = pd.concat(chunks, ignore_index=True)
+    for col in CATEGORICAL_COLUMNS:
+        if col in df.columns:
+            # Chunks infer their own categories; unify them
+            df[col] = df[col].astype("category")
+    return df
+
+
+def build_news_store(csv_path, store_path=None):
+    """
+    Converts the news CSV into a partitioned Parquet dataset (year / ticker bucket).
+    The dataset is written to a temporary directory and swapped in when complete.
+
+    Args:
+        csv_path (str): Path to the news CSV file
+        store_path (str): Output directory (default: next to the CSV)
+
+    Returns:
+        str: Path of the written store
+    """
+    _require_pyarrow()
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+
+    if not os.path.exists(csv_path):
+        raise FileNotFoundError(f"❌ File not found: {csv_path}")
+    store_path = store_path or news_store_path(csv_path)
+
+    df = read_news_csv(csv_path)
+    df["year"] = df["date"].dt.year.astype("Int16")
+    df["ticker_bucket"] = pd.Series(ticker_bucket(df["stock"].astype(str)), index=df.index, dtype="Int16")
+    df = df.sort_values(["year", "ticker_bucket", "stock", "date"], kind="stable")
+
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    tmp_path = store_path + ".tmp"
+    shutil.rmtree(tmp_path, ignore_errors=True)
+    ds.write_dataset(
+        table,
+        tmp_path,
+        format="parquet",
+        partitioning=ds.partitioning(table.select(PARTITION_COLUMNS).schema, flavor="hive"),
+        max_rows_per_group=ROW_GROUP_SIZE,
+        min_rows_per_group=min(ROW_GROUP_SIZE, 1024),
+        existing_data_behavior="overwrite_or_ignore",
+    )
+
+    shutil.rmtree(store_path, ignore_errors=True)
+    os.replace(tmp_path, store_path)
+    os.utime(store_path)  # freshness is judged by the directory mtime
+    return store_path
+
+
+def is_store_fresh(csv_path, store_path=None):
+    """
+    Returns True if the columnar store exists and is newer than the CSV.
+
+    Args:
+        csv_path (str): Path to the news CSV file
+        store_path (str): Store directory (default: next to the CSV)
+
+    Returns:
+        bool
+    """
+    store_path = store_path or news_store_path(csv_path)
+    if not os.path.isdir(store_path):
+        return False
+    if not os.path.exists(csv_path):
+        return True
+    return os.path.getmtime(store_path) >= os.path.getmtime(csv_path)
+
+
+def _store_scan_args(store_path, columns, tickers, start, end):
+    """Opens the dataset and turns ticker/date filters into a pushed-down expression."""
+    import pyarrow.compute as pc
+    import pyarrow.dataset as ds
+
+    tickers, start, end = _upper_set(tickers), _utc_timestamp(start), _utc_timestamp(end)
+    dataset = ds.dataset(store_path, format="parquet", partitioning="hive")
+    names = [c for c in dataset.schema.names if c not in PARTITION_COLUMNS]
+    columns = names if columns is None else list(columns)
+    missing = [c for c in columns if c not in names]
+    if missing:
+        raise ValueError(f"Columns not found in {store_path}: {missing}")
+
+    conditions = []
+    if tickers is not None:
+        conditions.append(ds.field("ticker_bucket").isin(sorted(set(ticker_bucket(tickers)))))
+        conditions.append(pc.utf8_upper(ds.field("stock").cast("string")).isin(tickers))
+    if start is not None:
+        conditions.append(ds.field("year") >= start.year)
+        conditions.append(ds.field("date") >= start)
+    if end is not None:
+        conditions.append(ds.field("year") <= end.year)
+        conditions.append(ds.field("date") < end)
+    expression = None
+    for condition in conditions:
+        expression = condition if expression is None else expression & condition
+    return dataset, columns, expression
+
+
+def _store_frame(table):
+    """Converts an Arrow table/batch from the store to the read_news_csv dtypes."""
+    df = table.to_pandas(types_mapper=_string_types_mapper)
+    for col in CATEGORICAL_COLUMNS:
+        if col in df.columns:
+            # Partitions carry their own dictionaries; sort categories like read_csv does
+            df[col] = df[col].astype("category")
+            df[col] = df[col].cat.reorder_categories(df[col].cat.categories.sort_values())
+    return df
+
+
+def read_news_store(store_path, columns=None, tickers=None, start=None, end=None):
+    """
+    Reads the columnar news store back into a DataFrame with the same
+    columns and dtypes as read_news_csv. Rows come back grouped by
+    year and ticker rather than in CSV order.
+    Column selection and ticker/date filters are pushed down to the Parquet
+    reader: partitions (year, ticker bucket) and row groups that cannot match
+    are skipped, and only the requested columns are decoded.
+
+    Args:
+        store_path (str): Store directory
+        columns (list of str): Columns to return (default: all)
+        tickers (list of str): Keep only these tickers (case-insensitive)
+        start, end: Keep rows with start <= date < end (naive values are UTC)
+
+    Returns:
+        pd.DataFrame
+    """
+    _require_pyarrow()
+    dataset, columns, expression = _store_scan_args(store_path, columns, tickers, start, end)
+    return _store_frame(dataset.to_table(columns=columns, filter=expression))
+
+
+def iter_news_store(store_path, chunksize=100_000, columns=None, tickers=None, start=None, end=None):
+    """
+    Streams the columnar news store in record batches of at most `chunksize` rows,
+    with the same pushdown as read_news_store.
+
+    Args:
+        store_path (str): Store directory
+        chunksize (int): Maximum rows per chunk
+        columns, tickers, start, end: See read_news_store
+
+    Yields:
+        pd.DataFrame
+    """
+    _require_pyarrow()
+    dataset, columns, expression = _store_scan_args(store_path, columns, tickers, start, end)
+    for batch in dataset.to_batches(columns=columns, filter=expression, batch_size=chunksize):
+        if batch.num_rows:
+            yield _store_frame(batch)
+
+
+def load_news(csv_path, use_store=True, columns=None, tickers=None, start=None, end=None):
+    """
+    Loads news data from the columnar store when it is newer than the CSV,
+    otherwise parses the CSV. Filters and column selection are applied by the reader.
+
+    Args:
+        csv_path (str): Path to the news CSV file
+        use_store (bool): Set False to always parse the CSV
+        columns (list of str): Columns to return (default: all)
+        tickers (list of str): Keep only these tickers (case-insensitive)
+        start, end: Keep rows with start <= date < end (naive values are UTC)
+
+    Returns:
+        pd.DataFrame
+    """
+    filters = dict(columns=columns, tickers=tickers, start=start, end=end)
+    if use_store and has_pyarrow() and is_store_fresh(csv_path):
+        return read_news_store(news_store_path(csv_path), **filters)
+    if not os.path.exists(csv_path):
+        raise FileNotFoundError(f"❌ File not found: {csv_path}")
+    return read_news_csv(csv_path, **filters)
+
+
+def iter_news(csv_path, chunksize=100_000, use_store=True, columns=None, tickers=None, start=None, end=None):
+    """
+    Streams news data in chunks of at most `chunksize` rows, from the columnar
+    store when it is newer than the CSV, otherwise from the CSV.
+
+    Args:
+        csv_path (str): Path to the news CSV file
+        chunksize (int): Maximum rows per chunk
+        use_store (bool): Set False to always read the CSV
+        columns, tickers, start, end: See load_news
+
+    Yields:
+        pd.DataFrame
+    """
+    filters = dict(columns=columns, tickers=tickers, start=start, end=end)
+    if use_store and has_pyarrow() and is_store_fresh(csv_path):
+        yield from iter_news_store(news_store_path(csv_path), chunksize, **filters)
+        return
+    if not os.path.exists(csv_path):
+        raise FileNotFoundError(f"❌ File not found: {csv_path}")
+    yield from iter_news_csv(csv_path, chunksize, **filters)
@@ -1,71 +1,83 @@
-import matplotlib.pyplot as plt
+from ..rendering import new_figure, finish_figure, downsample_indices
+
+# Every plot takes `output`: None shows the figure like plt.show(), 'figure' returns it, 'png'/'svg'/'pdf'
+# return the image bytes and a file path writes it (see modules/rendering.finish_figure).
+# Line plots take `downsample`: long series are reduced to about two points per pixel with
+# 'minmax' (keeps every extreme) or 'lttb' (keeps the shape); None draws every point.
 
 # -----------------------------
 # Headline Length Distribution
 # -----------------------------
-def plot_headline_length_distribution(df):
-    plt.figure(figsize=(10, 5))
-    df['headline_length'].hist(bins=30, color='skyblue', edgecolor='black')
-    plt.title("Headline Length Distribution")
-    plt.xlabel("Length of Headline")
-    plt.ylabel("Frequency")
-    plt.show()
+def plot_headline_length_distribution(df, output=None):
+    fig, ax = new_figure((10, 5))
+    # Same as Series.hist, without the pyplot figure it creates
+    ax.hist(df['headline_length'].dropna(), bins=30, color='skyblue', edgecolor='black')
+    ax.grid(True)
+    ax.set_title("Headline Length Distribution")
+    ax.set_xlabel("Length of Headline")
+    ax.set_ylabel("Frequency")
+    return finish_figure(fig, output)
 
 
 # -----------------------------
 # Top Publishers
 # -----------------------------
-def plot_top_publishers(publisher_counts):
-    plt.figure(figsize=(10, 5))
-    publisher_counts.plot(kind='bar', color='lightgreen', edgecolor='black')
-    plt.title("Top Publishers by Article Count")
-    plt.xlabel("Publisher")
-    plt.ylabel("Number of Articles")
-    plt.xticks(rotation=45, ha='right')
-    plt.tight_layout()
-    plt.show()
+def plot_top_publishers(publisher_counts, output=None):
+    fig, ax = new_figure((10, 5))
+    publisher_counts.plot(kind='bar', color='lightgreen', edgecolor='black', ax=ax)
+    ax.set_title("Top Publishers by Article Count")
+    ax.set_xlabel("Publisher")
+    ax.set_ylabel("Number of Articles")
+    for label in ax.get_xticklabels():
+        label.set(rotation=45, horizontalalignment='right')
+    fig.tight_layout()
+    return finish_figure(fig, output)
 
 
 # -----------------------------
 # Daily Publication Counts
 # -----------------------------
-def plot_daily_publication(daily_counts):
-    plt.figure(figsize=(12, 5))
-    daily_counts.plot(color='orange')
-    plt.title("Daily Article Publication Counts")
-    plt.xlabel("Date")
-    plt.ylabel("Number of Articles")
-    plt.xticks(rotation=45)
-    plt.tight_layout()
-    plt.show()
+def plot_daily_publication(daily_counts, downsample='minmax', output=None):
+    fig, ax = new_figure((12, 5))
+    rows = downsample_indices(ax, [daily_counts], daily_counts.index, downsample)
+    daily_counts.iloc[rows].plot(color='orange', ax=ax)
+    if len(rows) < len(daily_counts):
+        ax.margins(x=0)
+    ax.set_title("Daily Article Publication Counts")
+    ax.set_xlabel("Date")
+    ax.set_ylabel("Number of Articles")
+    ax.tick_params(axis='x', labelrotation=45)
+    fig.tight_layout()
+    return finish_figure(fig, output)
 
 
 # -----------------------------
 # Publication Spikes
 # -----------------------------
-def plot_spikes(daily_counts, spikes):
-    plt.figure(figsize=(12, 5))
-    plt.plot(daily_counts.index, daily_counts.values, label='Daily Counts', color='blue')
+def plot_spikes(daily_counts, spikes, downsample='minmax', output=None):
+    fig, ax = new_figure((12, 5))
+    rows = downsample_indices(ax, [daily_counts], daily_counts.index, downsample)
+    ax.plot(daily_counts.index[rows], daily_counts.values[rows], label='Daily Counts', color='blue')
     if not spikes.empty:
-        plt.scatter(spikes.index, spikes.values, color='red', label='Spikes', s=100, marker='o')
-    plt.title("Publication Frequency with Spikes Highlighted")
-    plt.xlabel("Date")
-    plt.ylabel("Number of Articles")
-    plt.xticks(rotation=45)
-    plt.legend()
-    plt.tight_layout()
-    plt.show()
+        ax.scatter(spikes.index, spikes.values, color='red', label='Spikes', s=100, marker='o')
+    ax.set_title("Publication Frequency with Spikes Highlighted")
+    ax.set_xlabel("Date")
+    ax.set_ylabel("Number of Articles")
+    ax.tick_params(axis='x', labelrotation=45)
+    ax.legend()
+    fig.tight_layout()
+    return finish_figure(fig, output)
 
 
 # -----------------------------
 # Hourly Publication Distribution
 # -----------------------------
-def plot_hourly_publication(hourly_counts):
-    plt.figure(figsize=(10, 5))
-    hourly_counts.plot(kind='bar', color='purple', edgecolor='black')
-    plt.title("Article Publication by Hour of Day")
-    plt.xlabel("Hour of Day")
-    plt.ylabel("Number of Articles")
-    plt.xticks(rotation=0)
-    plt.tight_layout()
-    plt.show()
+def plot_hourly_publication(hourly_counts, output=None):
+    fig, ax = new_figure((10, 5))
+    hourly_counts.plot(kind='bar', color='purple', edgecolor='black', ax=ax)
+    ax.set_title("Article Publication by Hour of Day")
+    ax.set_xlabel("Hour of Day")
+    ax.set_ylabel("Number of Articles")
+    ax.tick_params(axis='x', labelrotation=0)
+    fig.tight_layout()
+    return finish_figure(fig, output)
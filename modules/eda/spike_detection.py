@@ -0,0 +1,390 @@
+import numpy as np
+import pandas as pd
+
+from .time_series_analysis import _wall_clock_ns
+
+# Online counterparts of detect_publication_spikes. Instead of one mean + k * std over the
+# whole history, every series (a ticker, a publisher, ...) keeps its own running baseline and
+# each new count is compared with the baseline of the counts before it, so bursts are found
+# as the counts arrive and the threshold follows changes in volume. All keyed series are
+# updated together as one vector per period; a backfill feeds the rows of a count matrix
+# through the same step, so batch and live results are identical.
+
+# MAD of normally distributed data times this estimates its standard deviation
+MAD_SCALE = 1.4826
+
+
+class SpikeDetector:
+    """
+    Base class: per-key state in arrays, one vectorized step per period.
+
+    Usage:
+        detector = EWMASpikeDetector(halflife=14)
+        detector.update_many(history)                 # periods x keys count matrix (backfill)
+        spikes = detector.update({'AAPL': 42, 'MSFT': 7})   # one new period
+    """
+
+    method = None
+
+    def __init__(self, threshold_factor=3.0, min_periods=7, min_std=1.0):
+        """
+        Args:
+            threshold_factor (float): spike when count > baseline + threshold_factor * spread
+            min_periods (int): observations a key needs before it can report spikes
+            min_std (float): floor on the spread, so flat or sparse series (all zeros)
+                             don't flag every small change
+        """
+        self.params = {'threshold_factor': threshold_factor, 'min_periods': min_periods, 'min_std': min_std}
+        self.keys = []
+        self._positions = {}
+        self._count = np.zeros(0, dtype=np.int64)
+
+    # Keys
+    def _add_keys(self, keys):
+        new = [key for key in dict.fromkeys(keys) if key not in self._positions]
+        if new:
+            for key in new:
+                self._positions[key] = len(self.keys)
+                self.keys.append(key)
+            self._grow(len(new))
+
+    def _grow(self, n_new):
+        self._count = np.concatenate([self._count, np.zeros(n_new, dtype=np.int64)])
+
+    def _vector(self, counts, fill_missing):
+        """Counts of one period as a vector over self.keys (0 or NaN for keys without a count)."""
+        counts = pd.Series(counts, dtype=np.float64)
+        self._add_keys(counts.index)
+        x = np.zeros(len(self.keys)) if fill_missing else np.full(len(self.keys), np.nan)
+        x[[self._positions[key] for key in counts.index]] = counts.to_numpy()
+        return x
+
+    # Detection
+    def _baseline(self):
+        """(center, spread) per key from the state before the current period."""
+        raise NotImplementedError
+
+    def _observe(self, x, observed):
+        """Add the current period's counts (where observed) to the state."""
+        raise NotImplementedError
+
+    def _step(self, x):
+        observed = ~np.isnan(x)
+        center, spread = self._baseline()
+        threshold = center + self.params['threshold_factor'] * np.fmax(spread, self.params['min_std'])
+        threshold[self._count < max(self.params['min_periods'], 1)] = np.nan
+        spike = observed & (x > threshold)
+        self._observe(x, observed)
+        self._count += observed
+        return spike, threshold
+
+    def update(self, counts, fill_missing=True):
+        """
+        Add the counts of one period (a day or an intraday bucket).
+
+        Args:
+            counts (dict or pd.Series): {key: count}; new keys start their own baseline
+            fill_missing (bool): known keys without a count had 0 articles (False: skip them)
+
+        Returns:
+            pd.DataFrame: the spikes, one row per key with 'key', 'count' and 'threshold'
+        """
+        x = self._vector(counts, fill_missing)
+        spike, threshold = self._step(x)
+        rows = np.flatnonzero(spike)
+        return self._spike_table(rows, x[rows], threshold[rows])
+
+    def _spike_table(self, rows, counts, thresholds):
+        return pd.DataFrame({'key': [self.keys[i] for i in rows], 'count': counts, 'threshold': thresholds})
+
+    def update_many(self, matrix, fill_missing=True):
+        """
+        Batch mode: add many periods for many keys at once, e.g. to backfill history.
+
+        Args:
+            matrix (pd.DataFrame): periods (index, in time order) x keys (columns) of counts;
+                                   NaN means no observation for that key and period
+            fill_missing (bool): known keys that are not columns of matrix had 0 articles
+
+        Returns:
+            pd.DataFrame: the spikes with 'period', 'key', 'count' and 'threshold'
+        """
+        self._add_keys(matrix.columns)
+        columns = np.array([self._positions[key] for key in matrix.columns], dtype=np.int64)
+        values = matrix.to_numpy(dtype=np.float64)
+        x = np.zeros(len(self.keys)) if fill_missing else np.full(len(self.keys), np.nan)
+        periods, rows = [np.zeros(0, dtype=np.int64)], [np.zeros(0, dtype=np.int64)]
+        counts, thresholds = [np.zeros(0)], [np.zeros(0)]
+        for t in range(len(values)):
+            x[columns] = values[t]
+            spike, threshold = self._step(x)
+            found = np.flatnonzero(spike)
+            periods.append(np.full(len(found), t))
+            rows.append(found)
+            counts.append(x[found])
+            thresholds.append(threshold[found])
+        spikes = self._spike_table(np.concatenate(rows), np.concatenate(counts), np.concatenate(thresholds))
+        spikes.insert(0, 'period', matrix.index[np.concatenate(periods)])
+        return spikes
+
+    # Snapshots are plain dicts of lists, so they can be stored as JSON
+    def _state(self):
+        return {}
+
+    def _load(self, state):
+        pass
+
+    def snapshot(self):
+        """
+        Copy of the full state.
+
+        Returns:
+            dict: {'method', 'params', 'keys', 'count', 'state'}
+        """
+        return {'method': self.method, 'params': dict(self.params), 'keys': list(self.keys),
+                'count': self._count.tolist(), 'state': self._state()}
+
+    @classmethod
+    def restore(cls, snapshot):
+        """Rebuild a detector from snapshot()."""
+        if snapshot['method'] != cls.method:
+            raise ValueError(f"Snapshot of a {snapshot['method']!r} detector cannot restore a {cls.method!r} one")
+        obj = cls(**snapshot['params'])
+        obj._add_keys(snapshot['keys'])
+        obj._count = np.array(snapshot['count'], dtype=np.int64)
+        obj._load(snapshot['state'])
+        return obj
+
+
+class EWMASpikeDetector(SpikeDetector):
+    """
+    Exponentially weighted mean and variance per key: O(1) state (three numbers) per series.
+    A count is a spike when it exceeds mean + threshold_factor * std of the counts before it.
+    """
+
+    method = 'ewma'
+
+    def __init__(self, halflife=None, alpha=None, threshold_factor=3.0, min_periods=7, min_std=1.0):
+        """
+        Args:
+            halflife / alpha: decay of the baseline, as in DataFrame.ewm (default halflife=14 periods)
+            threshold_factor, min_periods, min_std: see SpikeDetector
+        """
+        if halflife is not None and alpha is not None:
+            raise ValueError("Pass only one of halflife or alpha.")
+        if alpha is None:
+            alpha = 1.0 - np.exp(np.log(0.5) / (14 if halflife is None else halflife))
+        if not 0.0 < alpha <= 1.0:
+            raise ValueError("alpha must be in (0, 1].")
+        super().__init__(threshold_factor, min_periods, min_std)
+        self.params['alpha'] = float(alpha)
+        self._mean = np.zeros(0)
+        self._var = np.zeros(0)
+
+    def _grow(self, n_new):
+        super()._grow(n_new)
+        self._mean = np.concatenate([self._mean, np.zeros(n_new)])
+        self._var = np.concatenate([self._var, np.zeros(n_new)])
+
+    def _baseline(self):
+        return self._mean, np.sqrt(self._var)
+
+    def _observe(self, x, observed):
+        alpha = self.params['alpha']
+        first = observed & (self._count == 0)
+        later = observed & ~first
+        deviation = np.where(later, x - self._mean, 0.0)
+        self._var = np.where(later, (1.0 - alpha) * (self._var + alpha * deviation * deviation), self._var)
+        self._mean = np.where(first, x, np.where(later, self._mean + alpha * deviation, self._mean))
+
+    def _state(self):
+        return {'mean': self._mean.tolist(), 'var': self._var.tolist()}
+
+    def _load(self, state):
+        self._mean = np.array(state['mean'], dtype=np.float64)
+        self._var = np.array(state['var'], dtype=np.float64)
+
+
+def _median_and_mad(ordered, size):
+    """
+    Median and median absolute deviation of every row of sorted windows of `size` values.
+    The k values closest to the median are k consecutive sorted values, so the k-th smallest
+    deviation is the smallest, over all runs of k, of the run's largest distance from the median.
+    """
+    values = ordered[:, :size]
+    median = (values[:, (size - 1) // 2] + values[:, size // 2]) / 2
+    center = median[:, None]
+
+    def kth_deviation(k):
+        return np.maximum(center - values[:, :size - k + 1], values[:, k - 1:] - center).min(axis=1)
+
+    low, high = (size + 1) // 2, size // 2 + 1
+    first = kth_deviation(low)
+    mad = first if low == high else (first + kth_deviation(high)) / 2
+    return median, mad
+
+
+class MADSpikeDetector(SpikeDetector):
+    """
+    Rolling median and median absolute deviation of the last `window` counts per key:
+    robust to the spikes themselves, at O(window) state per series.
+    A count is a spike when it exceeds median + threshold_factor * 1.4826 * MAD.
+    """
+
+    method = 'mad'
+
+    def __init__(self, window=28, threshold_factor=3.5, min_periods=7, min_std=1.0):
+        """
+        Args:
+            window (int): counts kept per key
+            threshold_factor, min_periods, min_std: see SpikeDetector
+        """
+        if int(window) != window or window < 2:
+            raise ValueError(f"window must be an integer >= 2, got {window!r}")
+        super().__init__(threshold_factor, min_periods, min_std)
+        self.params['window'] = int(window)
+        self._buffer = np.full((0, int(window)), np.nan)
+
+    def _grow(self, n_new):
+        super()._grow(n_new)
+        self._buffer = np.concatenate([self._buffer, np.full((n_new, self.params['window']), np.nan)])
+
+    def _baseline(self):
+        window = self.params['window']
+        # Sorting each window once gives the median and MAD by position (unused slots are NaN, sorted last)
+        ordered = np.sort(self._buffer, axis=1)
+        n = np.minimum(self._count, window)
+        center = np.full(len(n), np.nan)
+        mad = np.full(len(n), np.nan)
+        # Keys are grouped by how full their window is: after warm-up that is a single group
+        for size in np.unique(n[n > 0]):
+            rows = n == size
+            if rows.all():
+                center, mad = _median_and_mad(ordered, size)
+            else:
+                center[rows], mad[rows] = _median_and_mad(ordered[rows], size)
+        return center, MAD_SCALE * mad
+
+    def _observe(self, x, observed):
+        rows = np.flatnonzero(observed)
+        self._buffer[rows, self._count[rows] % self.params['window']] = x[rows]
+
+    def _state(self):
+        return {'buffer': np.where(np.isnan(self._buffer), None, self._buffer).tolist()}
+
+    def _load(self, state):
+        self._buffer = np.array(state['buffer'], dtype=np.float64).reshape(-1, self.params['window'])
+
+
+DETECTORS = {detector.method: detector for detector in (EWMASpikeDetector, MADSpikeDetector)}
+
+
+def restore_detector(snapshot):
+    """
+    Rebuild any spike detector from its snapshot().
+    """
+    if snapshot.get('method') not in DETECTORS:
+        raise ValueError(f"Unknown detector in snapshot: {snapshot.get('method')!r}")
+    return DETECTORS[snapshot['method']].restore(snapshot)
+
+
+def count_matrix(df, by, date_column='date', freq='D'):
+    """
+    Article counts per period and key (e.g. per day and ticker) from one pass over the dates,
+    the input for SpikeDetector.update_many.
+
+    Args:
+        df (pd.DataFrame): news articles
+        by (str): key column, e.g. 'stock' or 'publisher'
+        date_column (str): datetime (or date string) column
+        freq (str): period length as a fixed pandas frequency ('D', 'h', '15min', ...)
+
+    Returns:
+        pd.DataFrame: every period from the first to the last article (index) x keys (columns)
+    """
+    step = pd.Timedelta(pd.tseries.frequencies.to_offset(freq)).value
+    ns = _wall_clock_ns(df[date_column])
+    codes, keys = pd.factorize(df[by], sort=True)
+    valid = (ns != np.iinfo(np.int64).min) & (codes >= 0)
+    periods = ns[valid] // step
+    first = int(periods.min()) if len(periods) else 0
+    periods -= first
+    n_periods = int(periods.max()) + 1 if len(periods) else 0
+    counts = np.bincount(periods * len(keys) + codes[valid], minlength=n_periods * len(keys))
+    index = pd.DatetimeIndex((np.arange(n_periods) + first) * step, name=date_column)
+    return pd.DataFrame(counts.reshape(n_periods, len(keys)), index=index,
+                        columns=pd.Index(np.asarray(keys), name=by))
+
+
+class PublicationSpikeMonitor:
+    """
+    Live publication-burst detection per ticker and per publisher: one detector per key column.
+
+    Usage:
+        monitor = PublicationSpikeMonitor(by=('stock', 'publisher'), method='ewma', halflife=14)
+        monitor.backfill(archive_df)                     # history, all tickers at once
+        spikes = monitor.update(todays_articles, period=today)
+    """
+
+    def __init__(self, by=('stock', 'publisher'), method='ewma', date_column='date', **params):
+        """
+        Args:
+            by (tuple of str): key columns to monitor
+            method (str): 'ewma' (O(1) state per series) or 'mad' (rolling median / MAD)
+            date_column (str): datetime column (used by backfill)
+            params: detector parameters (see EWMASpikeDetector / MADSpikeDetector)
+        """
+        if method not in DETECTORS:
+            raise ValueError(f"Unknown method {method!r}; use one of {sorted(DETECTORS)}.")
+        self.date_column = date_column
+        self.detectors = {column: DETECTORS[method](**params) for column in by}
+
+    def update(self, articles, period=None):
+        """
+        Add the articles of one period; keys without articles in it count as 0.
+
+        Args:
+            articles (pd.DataFrame): the period's articles, with the key columns
+            period: label stored in the 'period' column of the result
+
+        Returns:
+            pd.DataFrame: spikes with 'by', 'period', 'key', 'count' and 'threshold'
+        """
+        tables = []
+        for column, detector in self.detectors.items():
+            counts = articles[column].value_counts(sort=False)
+            spikes = detector.update(counts[counts > 0])
+            spikes.insert(0, 'period', period)
+            spikes.insert(0, 'by', column)
+            tables.append(spikes)
+        return pd.concat(tables, ignore_index=True)
+
+    def backfill(self, articles, freq='D'):
+        """
+        Feed a history of articles, period by period, through every detector (batch mode).
+
+        Args:
+            articles (pd.DataFrame): articles with the date and key columns
+            freq (str): period length (see count_matrix)
+
+        Returns:
+            pd.DataFrame: spikes with 'by', 'period', 'key', 'count' and 'threshold'
+        """
+        tables = []
+        for column, detector in self.detectors.items():
+            spikes = detector.update_many(count_matrix(articles, column, self.date_column, freq))
+            spikes.insert(0, 'by', column)
+            tables.append(spikes)
+        return pd.concat(tables, ignore_index=True)
+
+    def snapshot(self):
+        """Snapshots of every detector, keyed by column."""
+        return {'date_column': self.date_column,
+                'detectors': {column: detector.snapshot() for column, detector in self.detectors.items()}}
+
+    @classmethod
+    def restore(cls, snapshot):
+        """Rebuild a monitor from snapshot()."""
+        obj = cls(by=(), date_column=snapshot['date_column'])
+        obj.detectors = {column: restore_detector(state) for column, state in snapshot['detectors'].items()}
+        return obj
@@ -1,5 +1,175 @@
+import numpy as np
 import pandas as pd
 
+NS_PER_HOUR = 3_600_000_000_000
+NS_PER_DAY = 24 * NS_PER_HOUR
+
+WEEKDAYS = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+
+_NAT = np.iinfo(np.int64).min
+
+
+def _wall_clock_ns(dates):
+    """
+    Timestamps as int64 nanoseconds of their wall-clock time (what .dt.date and .dt.hour see).
+    Strings are parsed once, as UTC like load_news_data; invalid dates become NaT (int64 min).
+
+    Args:
+        dates (pd.Series): datetime or string column
+
+    Returns:
+        np.ndarray: int64 nanoseconds
+    """
+    if not pd.api.types.is_datetime64_any_dtype(dates):
+        dates = pd.to_datetime(dates, utc=True, errors='coerce')
+    if dates.dt.tz is not None:
+        dates = dates.dt.tz_localize(None)
+    return dates.astype('datetime64[ns]').to_numpy().view(np.int64)
+
+
+def _spike_threshold(counts, threshold_factor):
+    """Mean + threshold_factor * sample std of the counts, as detect_publication_spikes."""
+    if len(counts) < 2:
+        return np.nan
+    return counts.mean() + threshold_factor * counts.std(ddof=1)
+
+
+class PublicationProfile:
+    """
+    Daily, hourly, weekday and publisher-by-day article counts from one pass over the dates.
+    The date column is converted once to int64 nanoseconds and every table is a single
+    np.bincount over integer day / hour codes; the input DataFrame is not modified.
+
+    Usage:
+        profile = PublicationProfile(df)
+        daily = profile.daily_counts()                  # = daily_publication_count(df)
+        spikes, threshold = profile.spikes()            # = detect_publication_spikes(daily)
+        bursts = profile.publisher_spikes()             # the same rule for every publisher at once
+    """
+
+    def __init__(self, df, date_column='date', publisher_column='publisher'):
+        """
+        Args:
+            df (pd.DataFrame): news articles
+            date_column (str): datetime (or date string) column
+            publisher_column (str): publisher column for the publisher x day matrix
+                                    (None, or a missing column, skips it)
+        """
+        self.date_column = date_column
+        ns = _wall_clock_ns(df[date_column])
+        valid = ns != _NAT
+        ns = ns[valid]
+        days = ns // NS_PER_DAY
+
+        self.first_day = int(days.min()) if len(days) else 0
+        day_codes = days - self.first_day
+        n_days = int(day_codes.max()) + 1 if len(days) else 0
+        # Every calendar day from the first to the last article, empty days included
+        self.days = np.arange(self.first_day, self.first_day + n_days).astype('datetime64[D]')
+        self.daily = np.bincount(day_codes, minlength=n_days)
+        self.hourly = np.bincount((ns // NS_PER_HOUR) % 24, minlength=24)
+        # 1970-01-01 was a Thursday (weekday 3, Monday = 0)
+        self.weekday = np.bincount((days + 3) % 7, minlength=7)
+
+        self.publishers = None
+        self.publisher_daily = None
+        if publisher_column is not None and publisher_column in df.columns:
+            codes, publishers = pd.factorize(df[publisher_column][valid], sort=True)
+            known = codes >= 0
+            n_publishers = len(publishers)
+            self.publishers = pd.Index(np.asarray(publishers), name=publisher_column)
+            self.publisher_daily = np.bincount(
+                codes[known] * n_days + day_codes[known], minlength=n_publishers * n_days
+            ).reshape(n_publishers, n_days)
+
+    def _date_index(self, mask):
+        return pd.Index(self.days[mask].astype(object), name=self.date_column)
+
+    def daily_counts(self, include_empty=False):
+        """
+        Articles per calendar day.
+
+        Args:
+            include_empty (bool): also list days without articles (daily_publication_count does not)
+
+        Returns:
+            pd.Series: counts indexed by date
+        """
+        mask = np.ones(len(self.daily), dtype=bool) if include_empty else self.daily > 0
+        return pd.Series(self.daily[mask], index=self._date_index(mask))
+
+    def hourly_counts(self):
+        """
+        Articles per hour of the day (hours without articles are left out).
+
+        Returns:
+            pd.Series: counts indexed by hour (0-23)
+        """
+        hours = np.flatnonzero(self.hourly)
+        return pd.Series(self.hourly[hours], index=pd.Index(hours.astype(np.int32), name=self.date_column))
+
+    def weekday_counts(self):
+        """
+        Articles per day of the week.
+
+        Returns:
+            pd.Series: counts indexed by weekday name (Monday first)
+        """
+        return pd.Series(self.weekday, index=pd.Index(WEEKDAYS, name='weekday'))
+
+    def publisher_daily_counts(self):
+        """
+        Articles per publisher and calendar day.
+
+        Returns:
+            pd.DataFrame: publishers x days (empty days included)
+        """
+        if self.publisher_daily is None:
+            raise ValueError("The profile was built without a publisher column.")
+        return pd.DataFrame(self.publisher_daily, index=self.publishers,
+                            columns=pd.DatetimeIndex(self.days, name=self.date_column))
+
+    def spikes(self, threshold_factor=2):
+        """
+        Days whose count is above mean + threshold_factor * std of the days with articles
+        (the same rule as detect_publication_spikes).
+
+        Returns:
+            pd.Series: spike counts indexed by date
+            float: threshold used
+        """
+        active = self.daily > 0
+        threshold = _spike_threshold(self.daily[active].astype(np.float64), threshold_factor)
+        mask = active & (self.daily > threshold)
+        return pd.Series(self.daily[mask], index=self._date_index(mask)), threshold
+
+    def publisher_spikes(self, threshold_factor=2):
+        """
+        The spikes rule applied to every publisher's own daily counts at once
+        (mean and std over the days that publisher has articles).
+
+        Returns:
+            pd.DataFrame: one row per spike with 'publisher', date, 'count' and 'threshold'
+        """
+        if self.publisher_daily is None:
+            raise ValueError("The profile was built without a publisher column.")
+        counts = self.publisher_daily.astype(np.float64)
+        active = counts > 0
+        n_active = active.sum(axis=1)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = counts.sum(axis=1) / n_active
+            centered = np.where(active, counts - mean[:, None], 0.0)
+            std = np.sqrt((centered * centered).sum(axis=1) / (n_active - 1))
+        threshold = np.where(n_active >= 2, mean + threshold_factor * std, np.nan)
+        rows, cols = np.nonzero(active & (counts > threshold[:, None]))
+        return pd.DataFrame({
+            'publisher': self.publishers[rows],
+            self.date_column: self.days[cols].astype('datetime64[ns]'),
+            'count': self.publisher_daily[rows, cols],
+            'threshold': threshold[rows],
+        })
+
+
 def daily_publication_count(df, date_column='date'):
     """
     Returns daily publication counts.
@@ -11,9 +181,7 @@ def daily_publication_count(df, date_column='date'):
     Returns:
         pd.Series: Daily counts indexed by date
     """
-    df[date_column] = pd.to_datetime(df[date_column])
-    daily_counts = df.groupby(df[date_column].dt.date).size()
-    return daily_counts
+    return PublicationProfile(df, date_column, publisher_column=None).daily_counts()
 
 
 def detect_publication_spikes(daily_counts, threshold_factor=2):
@@ -46,6 +214,4 @@ def hourly_publication_distribution(df, date_column='date'):
     Returns:
         pd.Series: Counts indexed by hour (0-23)
     """
-    df[date_column] = pd.to_datetime(df[date_column])
-    hourly_counts = df.groupby(df[date_column].dt.hour).size()
-    return hourly_counts
+    return PublicationProfile(df, date_column, publisher_column=None).hourly_counts()
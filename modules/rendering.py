@@ -0,0 +1,315 @@
+# modules/rendering.py
+
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import matplotlib
+import numpy as np
+import pandas as pd
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+# Rendering layer shared by the plot modules (stock/plotting.py, stock/eda.py, eda/plot.py,
+# sentiment_correlation/plot.py). Figures are built with the object-oriented API on their
+# own Agg canvas instead of pyplot, so plotting works without a display, does not add to
+# pyplot's global figure list (unless shown in a window), and is safe in worker processes. Every plot function takes
+# an `output` argument and hands its figure to finish_figure, which closes it. Long line
+# series are cut down to what the axes can show (downsample_indices) before drawing.
+
+# Formats finish_figure can return as bytes
+IMAGE_FORMATS = ('png', 'svg', 'pdf')
+
+# Tasks per worker in render_batch, so a few slow charts don't leave workers idle
+TASKS_PER_WORKER = 4
+
+# Line charts are downsampled to about this many points per horizontal pixel of their axes
+POINTS_PER_PIXEL = 2
+
+# LTTB first keeps the min/max of this many times its output size, so its loop stays short
+_LTTB_PRESELECT = 4
+
+
+# ---------- Figures ----------
+def new_figure(figsize=(12, 5), nrows=1, ncols=1, **kwargs):
+    """
+    Create a figure on an Agg canvas, outside pyplot.
+
+    Parameters:
+    - figsize: figure size in inches
+    - nrows, ncols: subplot grid
+    - kwargs: passed to Figure.subplots (e.g. sharex=True)
+
+    Returns:
+    - (fig, ax): the Figure and its Axes (an array of Axes for a grid)
+    """
+    fig = Figure(figsize=figsize)
+    FigureCanvasAgg(fig)
+    return fig, fig.subplots(nrows, ncols, **kwargs)
+
+
+def close_figure(fig):
+    """
+    Release a figure. Figures from new_figure only need their artists cleared; figures
+    that some library created through pyplot are also removed from pyplot's figure list.
+    """
+    if getattr(fig.canvas, 'manager', None) is not None:
+        import matplotlib.pyplot as plt
+        plt.close(fig)
+    fig.clear()
+
+
+def _window_backend():
+    """True if pyplot's backend opens windows (Qt, Tk, GTK, wx, macOS), not Agg or inline."""
+    from matplotlib.backends import backend_registry
+    module = backend_registry.load_backend_module(matplotlib.get_backend())
+    return getattr(module.FigureCanvas, 'required_interactive_framework', None) is not None
+
+
+def show_figure(fig):
+    """
+    Display a figure the way plt.show() would: in a window when pyplot uses a GUI backend
+    (e.g. a plain python script on a desktop), inline under IPython (e.g. in a notebook),
+    otherwise (headless, Agg backend) not at all.
+
+    Returns:
+    - True if the figure is still on screen (interactive mode) and must not be closed yet
+    """
+    if _window_backend():
+        import matplotlib.pyplot as plt
+        # Hand the finished figure to pyplot, which gives it a window of the active backend
+        plt.figure(FigureClass=lambda *args, **kwargs: fig)
+        plt.show()
+        return matplotlib.is_interactive()
+    try:
+        from IPython import get_ipython
+        from IPython.display import display
+    except ImportError:
+        return False
+    if get_ipython() is not None:
+        display(fig)
+    return False
+
+
+def finish_figure(fig, output=None, dpi=None):
+    """
+    Common last step of every plot function.
+
+    Parameters:
+    - fig: Figure
+    - output:
+        None       -> show the figure (see show_figure), then close it (returns None)
+        'figure'   -> return the open Figure; the caller closes it with close_figure
+        'png' / 'svg' / 'pdf' -> return the encoded image as bytes
+        a path     -> write the image (format from the extension) and return the path
+    - dpi: resolution for raster output (default: the rcParams value)
+
+    Returns:
+    - None, Figure, bytes or the path, depending on output
+    """
+    if isinstance(output, str) and output == 'figure':
+        return fig
+    if output is None:
+        if not show_figure(fig):
+            close_figure(fig)
+        return None
+    try:
+        if isinstance(output, str) and output in IMAGE_FORMATS:
+            buffer = io.BytesIO()
+            fig.savefig(buffer, format=output, dpi=dpi)
+            return buffer.getvalue()
+        path = os.fspath(output)
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        fig.savefig(path, dpi=dpi)
+        return path
+    finally:
+        close_figure(fig)
+
+
+# ---------- Downsampling ----------
+def _as_float(x):
+    """x positions as float64 (datetimes as nanoseconds)."""
+    values = pd.Index(x)
+    if values.inferred_type in ('date', 'datetime', 'datetime64'):
+        # Object indexes of datetime.date / Timestamp objects (e.g. daily_publication_count)
+        values = pd.DatetimeIndex(pd.to_datetime(values, utc=True))
+    if values.dtype.kind in 'mM':
+        # Also covers timezone-aware dates, which np.asarray would turn into objects
+        return values.as_unit('ns').asi8.astype(np.float64)
+    return values.to_numpy(dtype=np.float64)
+
+
+def minmax_indices(y, n_out):
+    """
+    Indices of the minimum and maximum of each of n_out / 2 equal-count buckets (plus the
+    first and last point), in order. Every local extreme that would be visible survives.
+
+    Parameters:
+    - y: 1-D values (NaN allowed; an all-NaN bucket keeps one NaN so line gaps stay visible)
+    - n_out: target number of points
+
+    Returns:
+    - np.ndarray: sorted int64 indices (all indices if len(y) <= n_out)
+    """
+    y = np.asarray(y, dtype=np.float64)
+    n = len(y)
+    if n <= max(n_out, 2):
+        return np.arange(n)
+    size = -(-n // max(n_out // 2, 1))
+    n_buckets = -(-n // size)
+    blocks = np.full(n_buckets * size, np.nan)
+    blocks[:n] = y
+    blocks = blocks.reshape(n_buckets, size)
+    missing = np.isnan(blocks)
+    low = np.where(missing, np.inf, blocks).argmin(axis=1)
+    high = np.where(missing, -np.inf, blocks).argmax(axis=1)
+    starts = np.arange(n_buckets) * size
+    return np.unique(np.concatenate([[0, n - 1], starts + low, starts + high]))
+
+
+def lttb_indices(x, y, n_out):
+    """
+    Largest-Triangle-Three-Buckets: keep the first and last point and, from each of
+    n_out - 2 buckets, the point forming the largest triangle with the previously kept
+    point and the mean of the next bucket. Long inputs are first reduced with
+    minmax_indices, so the cost of the loop depends only on n_out.
+
+    Parameters:
+    - x: 1-D positions (numbers or datetimes)
+    - y: 1-D values (NaN points are only kept where a whole bucket is NaN)
+    - n_out: target number of points
+
+    Returns:
+    - np.ndarray: sorted int64 indices (all indices if len(y) <= n_out)
+    """
+    y = np.asarray(y, dtype=np.float64)
+    n = len(y)
+    if n <= max(n_out, 3):
+        return np.arange(n)
+    keep = minmax_indices(y, _LTTB_PRESELECT * n_out) if n > _LTTB_PRESELECT * n_out else np.arange(n)
+    m = len(keep)
+    if m <= n_out:
+        return keep
+    xs, ys = _as_float(x)[keep], y[keep]
+
+    # Bucket means from prefix sums over the non-NaN points
+    valid = ~np.isnan(ys)
+    x_sums = np.concatenate([[0.0], np.cumsum(np.where(valid, xs, 0.0))])
+    y_sums = np.concatenate([[0.0], np.cumsum(np.where(valid, ys, 0.0))])
+    counts = np.concatenate([[0], np.cumsum(valid)])
+    edges = np.linspace(1, m - 1, n_out - 1).astype(np.int64)
+
+    chosen = np.empty(n_out, dtype=np.int64)
+    chosen[0], chosen[-1] = 0, m - 1
+    previous = 0
+    for i in range(n_out - 2):
+        begin, end = edges[i], edges[i + 1]
+        if i + 2 < len(edges):
+            next_begin, next_end = end, edges[i + 2]
+            count = counts[next_end] - counts[next_begin]
+        else:
+            count = 0
+        if count > 0:
+            mean_x = (x_sums[next_end] - x_sums[next_begin]) / count
+            mean_y = (y_sums[next_end] - y_sums[next_begin]) / count
+        else:
+            mean_x, mean_y = xs[m - 1], ys[m - 1]
+        px, py = xs[previous], ys[previous]
+        area = np.abs((px - mean_x) * (ys[begin:end] - py) - (px - xs[begin:end]) * (mean_y - py))
+        area = np.where(np.isnan(area), -1.0, area)
+        previous = begin + int(area.argmax())
+        chosen[i + 1] = previous
+    return keep[np.unique(chosen)]
+
+
+def pixel_budget(ax, points_per_pixel=POINTS_PER_PIXEL):
+    """Number of points worth drawing across the width of an Axes."""
+    fig = ax.get_figure()
+    width = ax.get_position().width * fig.get_figwidth() * fig.dpi
+    return max(int(width * points_per_pixel), 4)
+
+
+def downsample_indices(ax, series, x=None, method='minmax'):
+    """
+    Rows of one or more series sharing x that are worth drawing on ax: the union of
+    every series' downsampled indices, or all rows when they already fit.
+
+    Parameters:
+    - ax: Axes the series will be drawn on (sets the point budget)
+    - series: list of 1-D value arrays / Series, all the same length
+    - x: shared positions (needed for 'lttb'; default 0..n-1)
+    - method: 'minmax' (keeps every extreme), 'lttb' (keeps the shape) or None (no downsampling)
+
+    Returns:
+    - np.ndarray: sorted int64 row indices
+    """
+    if method not in ('minmax', 'lttb', None):
+        raise ValueError(f"Unknown downsampling method {method!r}; use 'minmax', 'lttb' or None.")
+    n = len(series[0]) if series else 0
+    budget = pixel_budget(ax)
+    if method is None or n <= budget:
+        return np.arange(n)
+    if method == 'minmax':
+        parts = [minmax_indices(values, budget) for values in series]
+    else:
+        x = np.arange(n) if x is None else x
+        parts = [lttb_indices(x, values, budget) for values in series]
+    return np.unique(np.concatenate(parts))
+
+
+# ---------- Batches ----------
+def _init_render_worker():
+    # Anything in a worker that still goes through pyplot must not try to open a window
+    matplotlib.use('Agg', force=True)
+
+
+def _render_task(task):
+    function, args, kwargs = task
+    return function(*args, **kwargs)
+
+
+def render_batch(tasks, n_jobs=-1):
+    """
+    Run many plot calls, across a process pool when n_jobs > 1.
+    Each task is (function, args, kwargs); the function must be importable (a module-level
+    plot function) and kwargs should set `output` to a file path or an image format.
+
+    Parameters:
+    - tasks: iterable of (function, args, kwargs)
+    - n_jobs: worker processes (None or 1 = this process, -1 = all CPUs)
+
+    Returns:
+    - list: each call's result (paths or bytes), in task order
+    """
+    tasks = [(function, tuple(args), dict(kwargs)) for function, args, kwargs in tasks]
+    workers = min((os.cpu_count() or 1) if n_jobs == -1 else (n_jobs or 1), len(tasks))
+    if workers <= 1:
+        return [_render_task(task) for task in tasks]
+    chunksize = max(1, len(tasks) // (workers * TASKS_PER_WORKER))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_render_worker) as pool:
+        return list(pool.map(_render_task, tasks, chunksize=chunksize))
+
+
+def render_ticker_charts(plot_function, frames, output_dir, fmt='png', n_jobs=-1, **kwargs):
+    """
+    One chart per ticker written to output_dir/<ticker>.<fmt>, e.g. the nightly chart pack:
+        render_ticker_charts(plot_bollinger_bands, frames_with_bbands, 'charts/bbands')
+
+    Parameters:
+    - plot_function: plot function taking the ticker's DataFrame first and an `output` argument
+    - frames: dict {ticker: df}
+    - output_dir: folder for the images (created if needed)
+    - fmt: 'png', 'svg' or 'pdf'
+    - n_jobs: worker processes (None or 1 = this process, -1 = all CPUs)
+    - kwargs: passed to plot_function for every ticker
+
+    Returns:
+    - dict: {ticker: image path}
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    tickers = list(frames)
+    tasks = [(plot_function, (frames[ticker],),
+              {**kwargs, 'output': os.path.join(output_dir, f"{ticker}.{fmt}")}) for ticker in tickers]
+    return dict(zip(tickers, render_batch(tasks, n_jobs=n_jobs)))
@@ -0,0 +1,316 @@
+# aggregate_store.py
+import os
+import sqlite3
+from contextlib import nullcontext
+
+import numpy as np
+import pandas as pd
+
+from .data_loader import iter_news_data
+from .scoring import SCORER_VERSION, resolve_n_jobs, scoring_pool
+from .sentiment_analysis import score_news_chunks
+
+# Default on-disk location, next to the polarity cache
+AGGREGATE_PATH = os.path.join("data", "cache", "daily_sentiment.sqlite")
+
+# Days before the watermark that are re-read on every refresh, so articles
+# that show up late (published earlier than the newest article) still land in their day.
+# Older days are checked by article count (see late_days) and re-read only if they changed.
+DEFAULT_ALLOWED_LATENESS_DAYS = 3
+
+# Polarity sums are kept as integers in units of 2**-40 (~1e-12). Integer addition
+# is exact and order-independent, so incremental updates, chunk sizes and row order
+# can never change a stored sum and a full rebuild gives identical results.
+SUM_SCALE = 2 ** 40
+
+_DAY_FORMAT = "%Y-%m-%d"
+
+
+# -----------------------------
+# Per-Day Partial Sums
+# -----------------------------
+def daily_partials(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Per-(day, stock) count, polarity sum and sum of squares for a scored news chunk.
+    Days are UTC calendar days; sums are fixed-point integers (see SUM_SCALE).
+    Args:
+        df (pd.DataFrame): scored news with 'date', 'stock', 'polarity'
+    Returns:
+        pd.DataFrame: 'day', 'stock', 'n', 'sum_q', 'sumsq_q'
+    """
+    polarity = df['polarity'].to_numpy(dtype=np.float64)
+    parts = pd.DataFrame({
+        'day': pd.to_datetime(df['date'], utc=True).dt.strftime(_DAY_FORMAT).to_numpy(),
+        'stock': df['stock'].astype(str).to_numpy(),
+        'n': np.ones(len(df), dtype=np.int64),
+        'sum_q': np.rint(polarity * SUM_SCALE).astype(np.int64),
+        'sumsq_q': np.rint(polarity * polarity * SUM_SCALE).astype(np.int64),
+    })
+    return parts.groupby(['day', 'stock'], sort=False).sum().reset_index()
+
+
+def _utc(value):
+    # Naive timestamps are UTC, as in the news loaders' start / end
+    ts = pd.Timestamp(value)
+    return ts.tz_localize('UTC') if ts.tz is None else ts.tz_convert('UTC')
+
+
+def _day_starts(days):
+    """'YYYY-MM-DD' strings as a UTC DatetimeIndex of midnights."""
+    return pd.DatetimeIndex(pd.to_datetime(pd.Index(days, dtype=object), format=_DAY_FORMAT, utc=True))
+
+
+# -----------------------------
+# Daily Sentiment Store
+# -----------------------------
+class DailySentimentStore:
+    """
+    Persistent per-(day, stock) sentiment aggregates with a high-water mark.
+
+    rebuild() scores the whole news history; refresh() re-reads articles
+    published on or after (watermark day - allowed lateness), plus any older
+    day whose article count in the source no longer matches the store (late
+    arrivals past the lateness window), replaces those days and advances the
+    watermark. Days are always recomputed from every article they contain, so
+    refreshing is idempotent and matches a rebuild.
+
+    Usage:
+        with DailySentimentStore() as store:
+            store.refresh(cache=cache)
+            news_daily = store.daily_sentiment()
+    """
+
+    def __init__(self, path: str = AGGREGATE_PATH,
+                 allowed_lateness_days: int = DEFAULT_ALLOWED_LATENESS_DAYS,
+                 scorer_version: str = SCORER_VERSION):
+        """
+        Args:
+            path (str): SQLite file (created if missing)
+            allowed_lateness_days (int): days before the watermark re-read by refresh()
+            scorer_version (str): scorer the stored sums were computed with
+        """
+        if allowed_lateness_days < 0:
+            raise ValueError("allowed_lateness_days must be >= 0.")
+        self.path = path
+        self.allowed_lateness_days = allowed_lateness_days
+        self.scorer_version = scorer_version
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS daily ("
+            "day TEXT NOT NULL, stock TEXT NOT NULL, n INTEGER NOT NULL, "
+            "sum_q INTEGER NOT NULL, sumsq_q INTEGER NOT NULL, PRIMARY KEY (day, stock)"
+            ") WITHOUT ROWID"
+        )
+        self._conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        self._conn.commit()
+
+    # Metadata
+    def _get_meta(self, key):
+        row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return None if row is None else row[0]
+
+    def _set_meta(self, key, value) -> None:
+        self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    @property
+    def watermark(self):
+        """Publication time of the newest ingested article (pd.Timestamp, UTC), or None."""
+        value = self._get_meta('watermark')
+        return None if value is None else pd.Timestamp(value)
+
+    def is_current(self) -> bool:
+        """True if the store has been built with the current scorer version."""
+        return self.watermark is not None and self._get_meta('scorer_version') == self.scorer_version
+
+    def refresh_start(self):
+        """
+        First day re-read by refresh(): the watermark's day minus the allowed lateness.
+        Returns:
+            pd.Timestamp or None: UTC midnight, or None if a full rebuild is needed
+        """
+        if not self.is_current():
+            return None
+        return self.watermark.floor('D') - pd.Timedelta(days=self.allowed_lateness_days)
+
+    # Ingestion
+    def late_days(self, since=None, chunksize: int = 100_000, use_store: bool = True) -> list:
+        """
+        Days before `since` whose article count in the news source differs from the store,
+        i.e. days that gained (or lost) articles after they were ingested. Reads only the
+        date column. Edits that keep a day's count unchanged are not detected; rebuild() for those.
+        Args:
+            since (pd.Timestamp): only check days before this one (default: refresh_start())
+            chunksize, use_store: see data_loader.iter_news_data
+        Returns:
+            list: 'YYYY-MM-DD' UTC days to re-aggregate, in order
+        """
+        since = self.refresh_start() if since is None else _utc(since)
+        if since is None:
+            return []
+        source = pd.Series(0, index=pd.DatetimeIndex([], tz='UTC'), dtype=np.int64)
+        for chunk in iter_news_data(chunksize=chunksize, use_store=use_store, columns=['date'], end=since):
+            counts = chunk['date'].dropna().dt.floor('D').value_counts()
+            source = source.add(counts, fill_value=0)
+        source.index = source.index.strftime(_DAY_FORMAT)
+
+        stored = pd.Series(dict(self._conn.execute(
+            "SELECT day, SUM(n) FROM daily WHERE day < ? GROUP BY day", (since.strftime(_DAY_FORMAT),)
+        ).fetchall()), dtype=np.int64)
+        source, stored = source.align(stored, fill_value=0)
+        return sorted(source.index[source.to_numpy() != stored.to_numpy()])
+
+    def ingest(self, chunks, since=None, days=None, n_jobs=None, executor=None, cache=None) -> int:
+        """
+        Replace every stored day on or after `since`, and every day in `days`, with aggregates
+        of the given news chunks. Chunks must contain all articles of those days (other rows
+        are ignored, before scoring). Runs in one transaction, so a failed run leaves the store unchanged.
+        Args:
+            chunks (iterable of pd.DataFrame): raw news with 'date', 'stock', 'headline'
+            since (pd.Timestamp): midnight to replace from (naive = UTC; None = replace everything)
+            days (list): further 'YYYY-MM-DD' UTC days to replace, e.g. late_days()
+            n_jobs, executor, cache: see compute_sentiment
+        Returns:
+            int: number of articles ingested
+        """
+        since = None if since is None else _utc(since)
+        if since is not None and since != since.floor('D'):
+            raise ValueError("since must be a day boundary (midnight UTC).")
+        days = [] if since is None or days is None else sorted(set(days))
+        day_starts = _day_starts(days)
+        watermark = None if since is None else self.watermark
+        n_rows = 0
+
+        def selected(raw_chunks):
+            for chunk in raw_chunks:
+                chunk = chunk.dropna(subset=['date'])
+                if since is not None:
+                    keep = (chunk['date'] >= since).to_numpy()
+                    if days:
+                        keep |= chunk['date'].dt.floor('D').isin(day_starts).to_numpy()
+                    chunk = chunk[keep]
+                if not chunk.empty:
+                    yield chunk
+
+        own_pool = executor is None and resolve_n_jobs(n_jobs) > 1
+        with scoring_pool(n_jobs) if own_pool else nullcontext(executor) as pool, self._conn:
+            if since is None:
+                self._conn.execute("DELETE FROM daily")
+            else:
+                self._conn.execute("DELETE FROM daily WHERE day >= ?", (since.strftime(_DAY_FORMAT),))
+                self._conn.executemany("DELETE FROM daily WHERE day = ?", [(day,) for day in days])
+
+            jobs = None if pool is None else n_jobs
+            for chunk in score_news_chunks(selected(chunks), n_jobs=jobs, executor=pool, cache=cache):
+                partials = daily_partials(chunk)
+                self._conn.executemany(
+                    "INSERT INTO daily (day, stock, n, sum_q, sumsq_q) VALUES (?, ?, ?, ?, ?) "
+                    "ON CONFLICT (day, stock) DO UPDATE SET n = n + excluded.n, "
+                    "sum_q = sum_q + excluded.sum_q, sumsq_q = sumsq_q + excluded.sumsq_q",
+                    partials.itertuples(index=False, name=None),
+                )
+                newest = chunk['date'].max()
+                watermark = newest if watermark is None else max(watermark, newest)
+                n_rows += len(chunk)
+
+            if watermark is not None:
+                self._set_meta('watermark', watermark.isoformat())
+            self._set_meta('scorer_version', self.scorer_version)
+        return n_rows
+
+    def rebuild(self, chunksize: int = 100_000, use_store: bool = True, n_jobs=None, cache=None) -> int:
+        """
+        Recompute every day from the full news history.
+        Returns:
+            int: number of articles ingested
+        """
+        chunks = iter_news_data(chunksize=chunksize, use_store=use_store)
+        return self.ingest(chunks, since=None, n_jobs=n_jobs, cache=cache)
+
+    def refresh(self, chunksize: int = 100_000, use_store: bool = True, n_jobs=None, cache=None,
+                check_late: bool = True) -> int:
+        """
+        Ingest news published since refresh_start() and replace the affected days, together
+        with older days that received late articles (late_days()).
+        Falls back to rebuild() on an empty store or after a scorer version change.
+        Args:
+            check_late (bool): set False to skip the date-column scan behind late_days()
+        Returns:
+            int: number of articles ingested
+        """
+        since = self.refresh_start()
+        if since is None:
+            return self.rebuild(chunksize=chunksize, use_store=use_store, n_jobs=n_jobs, cache=cache)
+        days = self.late_days(since, chunksize=chunksize, use_store=use_store) if check_late else []
+        start = _day_starts(days[:1])[0] if days else since
+        chunks = iter_news_data(chunksize=chunksize, use_store=use_store, start=start)
+        return self.ingest(chunks, since=since, days=days, n_jobs=n_jobs, cache=cache)
+
+    # Results
+    def daily_sentiment(self, tickers=None, start=None, end=None) -> pd.DataFrame:
+        """
+        Aggregated daily sentiment per stock.
+        Args:
+            tickers (list): only these stock symbols (case-insensitive)
+            start, end: only days with start <= day < end
+        Returns:
+            pd.DataFrame: 'date' (UTC midnight), 'stock', 'avg_daily_sentiment',
+                          'sentiment_std' (sample std, NaN for one article), 'n_articles'
+        """
+        query, params = "SELECT day, stock, n, sum_q, sumsq_q FROM daily", []
+        clauses = []
+        if tickers is not None:
+            tickers = sorted({str(t).upper() for t in tickers})
+            clauses.append(f"stock IN ({', '.join('?' * len(tickers))})")
+            params += tickers
+        if start is not None:
+            clauses.append("day >= ?")
+            params.append(pd.Timestamp(start).strftime(_DAY_FORMAT))
+        if end is not None:
+            clauses.append("day < ?")
+            params.append(pd.Timestamp(end).strftime(_DAY_FORMAT))
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        query += " ORDER BY day, stock"
+
+        rows = pd.DataFrame(
+            self._conn.execute(query, params).fetchall(),
+            columns=['day', 'stock', 'n', 'sum_q', 'sumsq_q'],
+        )
+        n = rows['n'].to_numpy(dtype=np.float64)
+        total = rows['sum_q'].to_numpy(dtype=np.float64) / SUM_SCALE
+        total_sq = rows['sumsq_q'].to_numpy(dtype=np.float64) / SUM_SCALE
+        mean = total / n if len(rows) else total
+        with np.errstate(invalid='ignore', divide='ignore'):
+            variance = np.clip(total_sq - total * mean, 0.0, None) / (n - 1)
+
+        return pd.DataFrame({
+            'date': pd.to_datetime(rows['day'], format=_DAY_FORMAT, utc=True),
+            'stock': rows['stock'].astype(object),
+            'avg_daily_sentiment': mean,
+            'sentiment_std': np.where(n > 1, np.sqrt(variance), np.nan),
+            'n_articles': rows['n'].astype(np.int64),
+        })
+
+    def clear(self) -> None:
+        """Remove every aggregate and the watermark."""
+        with self._conn:
+            self._conn.execute("DELETE FROM daily")
+            self._conn.execute("DELETE FROM meta")
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM daily").fetchone()[0]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,230 @@
+# benchmark.py
+import time
+
+import numpy as np
+import pandas as pd
+from scipy.stats import pearsonr
+from textblob import TextBlob
+
+from .correlation import compute_cross_sectional_correlation, sentiment_matrix
+from .scoring import score_polarity, label_polarity
+from .sentiment_analysis import preprocess_news_data, preprocess_news_stream
+
+# Vocabulary for synthetic financial headlines: neutral words, lexicon words,
+# negations/modifiers and punctuation so every scoring rule gets exercised.
+_NEUTRAL_WORDS = [
+    "stocks", "shares", "company", "earnings", "report", "quarter", "market", "analyst",
+    "price", "target", "revenue", "guidance", "update", "trading", "session", "sector",
+    "AAPL", "NVDA", "MSFT", "Q3", "2020", "FY", "EPS", "vs", "est", "on", "to", "for",
+]
+_LEXICON_WORDS = [
+    "good", "bad", "strong", "weak", "great", "poor", "best", "worst", "higher", "lower",
+    "positive", "negative", "top", "big", "new", "surprising", "disappointing", "record",
+]
+_MODIFIERS = ["not", "never", "very", "really", "extremely", "isn't", "n't"]
+_PUNCTUATION = ["!", "?", ",", ".", ":", ":)", ":(", "(!)", "..."]
+
+
+# -----------------------------
+# Synthetic Headlines
+# -----------------------------
+def make_synthetic_headlines(n_rows: int, n_unique: int, seed: int = 0) -> pd.Series:
+    """
+    Build a Series of synthetic headlines with repeated (syndicated) entries.
+    Args:
+        n_rows (int): number of rows to return
+        n_unique (int): number of distinct headlines to sample from
+        seed (int): random seed
+    Returns:
+        pd.Series: headline strings
+    """
+    rng = np.random.default_rng(seed)
+    vocab = np.array(_NEUTRAL_WORDS * 3 + _LEXICON_WORDS + _MODIFIERS + _PUNCTUATION, dtype=object)
+    lengths = rng.integers(4, 14, size=n_unique)
+    unique = [" ".join(rng.choice(vocab, size=n)) for n in lengths]
+    picks = rng.integers(0, n_unique, size=n_rows)
+    return pd.Series(np.asarray(unique, dtype=object)[picks], name='headline')
+
+
+# -----------------------------
+# Sentiment Scoring Throughput
+# -----------------------------
+def benchmark_sentiment_scoring(n_rows: int = 100_000, n_unique: int = 20_000, seed: int = 0) -> dict:
+    """
+    Compare the per-row TextBlob path with the batched scoring engine.
+    Args:
+        n_rows (int): number of headlines
+        n_unique (int): number of distinct headlines
+        seed (int): random seed
+    Returns:
+        dict: timings (seconds), rows/second for both paths, speedup and an exact-match flag
+    """
+    headlines = make_synthetic_headlines(n_rows, n_unique, seed)
+
+    start = time.perf_counter()
+    baseline = headlines.apply(lambda x: TextBlob(x).sentiment.polarity).to_numpy()
+    baseline_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    polarity = score_polarity(headlines)
+    label_polarity(polarity)
+    engine_seconds = time.perf_counter() - start
+
+    return {
+        'rows': n_rows,
+        'unique_headlines': n_unique,
+        'textblob_seconds': baseline_seconds,
+        'engine_seconds': engine_seconds,
+        'textblob_rows_per_sec': n_rows / baseline_seconds,
+        'engine_rows_per_sec': n_rows / engine_seconds,
+        'speedup': baseline_seconds / engine_seconds,
+        'exact_match': bool(np.array_equal(baseline, polarity)),
+    }
+
+
+# -----------------------------
+# Parallel Scoring Scaling
+# -----------------------------
+def benchmark_parallel_scoring(n_rows: int = 400_000, n_unique: int = 200_000, n_jobs=(1, 2, 4), seed: int = 0) -> pd.DataFrame:
+    """
+    Measure how sharded process-pool scoring scales with the number of workers.
+    Args:
+        n_rows (int): number of headlines
+        n_unique (int): number of distinct headlines
+        n_jobs (iterable): worker counts to try
+        seed (int): random seed
+    Returns:
+        pd.DataFrame: seconds, speedup over one worker and exact-match flag per worker count
+    """
+    headlines = make_synthetic_headlines(n_rows, n_unique, seed)
+    reference = None
+    rows = []
+    for jobs in n_jobs:
+        start = time.perf_counter()
+        polarity = score_polarity(headlines, n_jobs=jobs)
+        seconds = time.perf_counter() - start
+        if reference is None:
+            reference, base_seconds = polarity, seconds
+        rows.append({
+            'n_jobs': jobs,
+            'seconds': seconds,
+            'speedup': base_seconds / seconds,
+            'exact_match': bool(np.array_equal(reference, polarity)),
+        })
+    return pd.DataFrame(rows)
+
+
+# -----------------------------
+# Cross-Sectional Correlation
+# -----------------------------
+def make_synthetic_universe(n_tickers: int, n_days: int, coverage: float = 0.1, seed: int = 0):
+    """
+    Build a long daily sentiment table and a wide returns matrix with missing days.
+    Args:
+        n_tickers (int): number of tickers
+        n_days (int): number of trading days
+        coverage (float): share of (day, ticker) pairs with news
+        seed (int): random seed
+    Returns:
+        tuple: (news_daily, returns)
+    """
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range('2012-01-02', periods=n_days, tz='UTC')
+    tickers = [f"T{i}" for i in range(n_tickers)]
+    values = rng.normal(0, 0.02, size=(n_days, n_tickers))
+    values[rng.random(values.shape) < 0.02] = np.nan
+    returns = pd.DataFrame(values, index=dates, columns=tickers)
+
+    day, ticker = np.nonzero(rng.random((n_days, n_tickers)) < coverage)
+    news_daily = pd.DataFrame({
+        'date': dates[day],
+        'stock': np.asarray(tickers, dtype=object)[ticker],
+        'avg_daily_sentiment': rng.uniform(-1, 1, size=len(day)),
+    })
+    return news_daily, returns
+
+
+def benchmark_cross_sectional_correlation(n_tickers: int = 6000, n_days: int = 2500,
+                                          n_loop: int = 500, seed: int = 0) -> dict:
+    """
+    Compare the vectorized all-ticker engine with a per-ticker pearsonr loop.
+    Args:
+        n_tickers (int): universe size for the engine
+        n_days (int): number of trading days
+        n_loop (int): tickers timed through the per-ticker loop (extrapolated to n_tickers)
+        seed (int): random seed
+    Returns:
+        dict: engine seconds, estimated loop seconds, speedup and the largest |r| difference
+    """
+    news_daily, returns = make_synthetic_universe(n_tickers, n_days, seed=seed)
+
+    start = time.perf_counter()
+    result = compute_cross_sectional_correlation(news_daily, returns).set_index('stock')
+    engine_seconds = time.perf_counter() - start
+
+    sentiment = sentiment_matrix(news_daily)
+    tickers = returns.columns[:n_loop]
+    start = time.perf_counter()
+    loop_r = []
+    for ticker in tickers:
+        pairs = pd.concat([sentiment[ticker], returns[ticker]], axis=1).dropna()
+        loop_r.append(pearsonr(pairs.iloc[:, 0], pairs.iloc[:, 1])[0])
+    loop_seconds = (time.perf_counter() - start) * n_tickers / len(tickers)
+
+    return {
+        'tickers': n_tickers,
+        'days': n_days,
+        'engine_seconds': engine_seconds,
+        'loop_seconds_estimate': loop_seconds,
+        'speedup': loop_seconds / engine_seconds,
+        'max_abs_r_diff': float(np.nanmax(np.abs(result.loc[tickers, 'r'].to_numpy() - np.asarray(loop_r)))),
+    }
+
+
+# -----------------------------
+# Streaming vs In-Memory Aggregation
+# -----------------------------
+def make_synthetic_news(n_rows: int, n_tickers: int = 50, n_days: int = 180, seed: int = 0) -> pd.DataFrame:
+    """
+    Build raw news ('date', 'stock', 'headline') with intraday publication times.
+    Args:
+        n_rows (int): number of articles
+        n_tickers (int): number of tickers
+        n_days (int): days the publication times are spread over
+        seed (int): random seed
+    Returns:
+        pd.DataFrame: news articles in publication order
+    """
+    rng = np.random.default_rng(seed)
+    seconds = np.sort(rng.integers(0, n_days * 86_400, size=n_rows))
+    return pd.DataFrame({
+        'date': pd.Timestamp('2020-01-01', tz='UTC') + pd.to_timedelta(seconds, unit='s'),
+        'stock': pd.Categorical(np.asarray([f"T{i}" for i in range(n_tickers)], dtype=object)[
+            rng.integers(0, n_tickers, size=n_rows)]),
+        'headline': make_synthetic_headlines(n_rows, max(1, n_rows // 5), seed).to_numpy(),
+    })
+
+
+def check_streaming_aggregation(n_rows: int = 50_000, chunksize: int = 7_000, seed: int = 0) -> pd.DataFrame:
+    """
+    Check that preprocess_news_stream gives the same daily table as preprocess_news_data.
+    Args:
+        n_rows (int): number of synthetic articles
+        chunksize (int): rows per streamed chunk
+        seed (int): random seed
+    Returns:
+        pd.DataFrame: the (identical) daily sentiment table
+    Raises:
+        AssertionError: if the two outputs differ beyond floating-point summation order
+    """
+    news = make_synthetic_news(n_rows, seed=seed)
+    in_memory = preprocess_news_data(news.copy())
+    streamed = preprocess_news_stream(news.iloc[start:start + chunksize].copy()
+                                      for start in range(0, n_rows, chunksize))
+    pd.testing.assert_frame_equal(streamed, in_memory, check_exact=False, rtol=1e-12, atol=1e-12)
+    return in_memory
+
+
+if __name__ == '__main__':
+    # Run from the project root as `python -m modules.sentiment_correlation.benchmark` (CI does)
+    print(check_streaming_aggregation())
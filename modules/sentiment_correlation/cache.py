@@ -0,0 +1,172 @@
+# cache.py
+import hashlib
+import os
+import re
+import sqlite3
+import time
+
+import numpy as np
+
+from .scoring import SCORER_VERSION
+
+# Default on-disk location, next to the news and stock data
+CACHE_PATH = os.path.join("data", "cache", "polarity.sqlite")
+
+# Default size limit (entries); least recently used entries are evicted beyond this
+DEFAULT_MAX_ENTRIES = 5_000_000
+
+# Runs of spaces/tabs are collapsed by the pattern tokenizer anyway,
+# so folding them here does not change the score
+_SPACES = re.compile(r"[ \t]+")
+
+
+# -----------------------------
+# Cache Keys
+# -----------------------------
+def normalize_headline(text) -> str:
+    """
+    Normalize a headline for cache lookups without changing its polarity.
+    Case is preserved because the pattern tokenizer is case-sensitive for contractions.
+    """
+    return _SPACES.sub(" ", str(text)).strip()
+
+
+def headline_key(text, scorer_version: str = SCORER_VERSION) -> bytes:
+    """
+    Content-addressed cache key: SHA-1 of the scorer version and the normalized headline.
+    """
+    payload = f"{scorer_version}\x00{normalize_headline(text)}".encode("utf-8")
+    return hashlib.sha1(payload).digest()
+
+
+# -----------------------------
+# Polarity Cache
+# -----------------------------
+class PolarityCache:
+    """
+    Persistent SQLite cache of headline polarity scores with LRU eviction.
+
+    Usage:
+        with PolarityCache() as cache:
+            news_df = compute_sentiment(news_df, cache=cache)
+    """
+
+    def __init__(self, path: str = CACHE_PATH, max_entries: int = DEFAULT_MAX_ENTRIES,
+                 scorer_version: str = SCORER_VERSION):
+        """
+        Args:
+            path (str): SQLite file (created if missing)
+            max_entries (int): maximum number of cached scores
+            scorer_version (str): scorer version baked into every key
+        """
+        if max_entries <= 0:
+            raise ValueError("max_entries must be a positive integer.")
+        self.path = path
+        self.max_entries = max_entries
+        self.scorer_version = scorer_version
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS polarity ("
+            "key BLOB PRIMARY KEY, score REAL NOT NULL, last_used INTEGER NOT NULL"
+            ") WITHOUT ROWID"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS polarity_last_used ON polarity(last_used)")
+        self._conn.commit()
+
+    def keys(self, texts) -> list:
+        """Cache keys for the given headlines."""
+        return [headline_key(t, self.scorer_version) for t in texts]
+
+    def get_many(self, texts) -> np.ndarray:
+        """
+        Look up scores for many headlines at once and mark the hits as recently used.
+        Args:
+            texts (array-like): headline strings
+        Returns:
+            np.ndarray: float64 scores, NaN where the headline is not cached
+        """
+        keys = self.keys(texts)
+        scores = np.full(len(keys), np.nan, dtype=np.float64)
+        if not keys:
+            return scores
+
+        position = {key: i for i, key in enumerate(keys)}
+        now = time.time_ns()
+        with self._conn:
+            # Bulk lookup: stage the keys in a temp table and join once
+            self._conn.execute("CREATE TEMP TABLE IF NOT EXISTS lookup (key BLOB PRIMARY KEY) WITHOUT ROWID")
+            self._conn.execute("DELETE FROM lookup")
+            self._conn.executemany("INSERT INTO lookup (key) VALUES (?)", ((key,) for key in position))
+            rows = self._conn.execute(
+                "SELECT p.key, p.score FROM polarity p JOIN lookup l ON p.key = l.key"
+            ).fetchall()
+            self._conn.execute(
+                "UPDATE polarity SET last_used = ? WHERE key IN (SELECT key FROM lookup)", (now,)
+            )
+            self._conn.execute("DELETE FROM lookup")
+        for key, score in rows:
+            scores[position[key]] = score
+
+        # Duplicate headlines share a key; copy the score to every occurrence
+        if len(position) != len(keys):
+            index = np.array([position[key] for key in keys])
+            scores = scores[index]
+        return scores
+
+    def put_many(self, texts, scores) -> None:
+        """
+        Store scores for many headlines, then evict least recently used entries over the size limit.
+        Args:
+            texts (array-like): headline strings
+            scores (array-like): polarity per headline
+        """
+        keys = self.keys(texts)
+        if not keys:
+            return
+        now = time.time_ns()
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO polarity (key, score, last_used) VALUES (?, ?, ?)",
+                zip(keys, (float(s) for s in scores), (now for _ in keys)),
+            )
+        self.evict()
+
+    def evict(self) -> int:
+        """
+        Drop least recently used entries until the cache fits max_entries.
+        Returns:
+            int: number of evicted entries
+        """
+        excess = len(self) - self.max_entries
+        if excess <= 0:
+            return 0
+        with self._conn:
+            self._conn.execute(
+                "DELETE FROM polarity WHERE key IN "
+                "(SELECT key FROM polarity ORDER BY last_used LIMIT ?)",
+                (excess,),
+            )
+        return excess
+
+    def clear(self) -> None:
+        """Remove every cached score."""
+        with self._conn:
+            self._conn.execute("DELETE FROM polarity")
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM polarity").fetchone()[0]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
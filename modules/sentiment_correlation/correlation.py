@@ -1,23 +1,130 @@
 # correlation.py
+import numpy as np
 import pandas as pd
+from scipy import fft, stats
 from scipy.stats import pearsonr
 
+# Tickers per block in the cross-sectional engine; bounds temporaries to block x days floats
+CORRELATION_BLOCK = 512
+
+# Exchange calendar used to map articles to trading sessions (US equities)
+EXCHANGE_TZ = 'America/New_York'
+MARKET_CLOSE = '16:00'
+
+# compute_lag_profile switches from direct per-lag sums to FFT cross-correlation above this many lags
+FFT_MIN_LAGS = 64
+
+# -----------------------------
+# Trading Session Alignment
+# -----------------------------
+def _upper_symbols(values) -> np.ndarray:
+    """
+    Upper-cased ticker strings, converting each distinct symbol once.
+    """
+    codes, uniques = pd.factorize(pd.Series(values).astype(str))
+    return pd.Index(uniques).str.upper().to_numpy(dtype=object)[codes]
+
+def session_dates(timestamps, sessions, stocks=None, session_stocks=None,
+                  tz: str = EXCHANGE_TZ, close: str = MARKET_CLOSE) -> pd.DatetimeIndex:
+    """
+    Map publication times to their effective trading session with one sorted as-of join.
+    An article published before the close on a trading day belongs to that day's session;
+    after the close, on a weekend or on a holiday it belongs to the next session.
+    Args:
+        timestamps (array-like): publication times (naive values are UTC)
+        sessions (array-like): trading dates (e.g. the stock 'Date' column)
+        stocks (array-like): ticker of each article; with session_stocks, sessions are looked up per ticker
+        session_stocks (array-like): ticker of each session date
+        tz (str): exchange time zone
+        close (str): exchange close time ('HH:MM', local); articles at or after it roll to the next session
+    Returns:
+        pd.DatetimeIndex: session date (UTC midnight) per article, NaT if no later session exists
+    """
+    # Local wall-clock time, so the close cutoff holds on DST change days too
+    wall = pd.DatetimeIndex(pd.to_datetime(timestamps, utc=True)).tz_convert(tz).tz_localize(None)
+    day = wall.normalize()
+    after_close = (wall - day) >= pd.Timedelta(close + ':00')
+    # Earliest session date each article can belong to (local calendar date)
+    earliest = day + pd.to_timedelta(after_close.astype(np.int64), unit='D')
+
+    by = None if stocks is None or session_stocks is None else 'stock'
+    left = pd.DataFrame({'earliest': earliest, 'row': np.arange(len(earliest))})
+    right = pd.DataFrame({'session': pd.DatetimeIndex(_utc_days(sessions)).tz_localize(None)})
+    if by:
+        left[by] = _upper_symbols(stocks)
+        right[by] = _upper_symbols(session_stocks)
+    right = right.dropna().drop_duplicates().sort_values('session', kind='stable')
+    left = left.dropna(subset=['earliest']).sort_values('earliest', kind='stable')
+
+    matched = pd.merge_asof(left, right, left_on='earliest', right_on='session', by=by, direction='forward')
+    result = np.full(len(earliest), np.datetime64('NaT'), dtype='datetime64[ns]')
+    result[matched['row'].to_numpy()] = matched['session'].to_numpy(dtype='datetime64[ns]')
+    return pd.DatetimeIndex(result).tz_localize('UTC')
+
 # -----------------------------
 # Merge News & Stock Data
 # -----------------------------
-def merge_news_stock(news_df: pd.DataFrame, stock_df: pd.DataFrame) -> pd.DataFrame:
+def merge_news_stock(news_df: pd.DataFrame, stock_df: pd.DataFrame, symbol: str = None,
+                     tz: str = EXCHANGE_TZ, close: str = MARKET_CLOSE) -> pd.DataFrame:
     """
-    Merge daily aggregated news sentiment with stock daily returns by date and stock symbol.
+    Merge news sentiment with stock daily returns by trading session (and stock symbol).
+    Every article is mapped to its effective trading session (see session_dates), so
+    weekend and after-hours news counts towards the next session instead of being dropped;
+    sentiment is then averaged per (session, stock).
     Args:
         news_df (pd.DataFrame): Aggregated daily sentiment ('date', 'stock', 'avg_daily_sentiment')
-        stock_df (pd.DataFrame): Stock DataFrame with 'Date', 'Close', 'Daily_Return'
+                                or scored articles ('date', 'stock', 'polarity')
+        stock_df (pd.DataFrame): Stock DataFrame with 'Date', 'Close', 'Daily_Return'; with a 'stock'
+                                 column (many tickers) news is joined on (stock, session)
+        symbol (str): ticker of a single-stock stock_df; only that ticker's news is kept. Required
+                      when stock_df has no 'stock' column and news_df covers several tickers
+        tz (str): exchange time zone
+        close (str): exchange close time ('HH:MM', local)
     Returns:
-        pd.DataFrame: merged DataFrame
+        pd.DataFrame: merged DataFrame ('date' is the session date)
+    Raises:
+        ValueError: if stock_df is a single stock, symbol is None and news_df has several tickers
     """
     # Ensure consistent column names
     stock_df = stock_df.rename(columns={'Date': 'date'})
-    
-    merged_df = pd.merge(news_df, stock_df, on='date', how='inner')
+    news_stocks = _upper_symbols(news_df['stock'])
+    if symbol is None and 'stock' not in stock_df.columns:
+        # A single-stock price table can only be matched with that stock's news
+        tickers = pd.unique(news_stocks)
+        if len(tickers) > 1:
+            raise ValueError(
+                f"news_df has {len(tickers)} tickers but stock_df has no 'stock' column; "
+                "pass symbol= to select the stock's news"
+            )
+        symbol = tickers[0] if len(tickers) else None
+    if symbol is not None:
+        news_df, news_stocks = news_df[news_stocks == symbol.upper()], news_stocks[news_stocks == symbol.upper()]
+        stock_df = stock_df.assign(stock=symbol.upper())
+    keys = ['date', 'stock'] if 'stock' in stock_df.columns else ['date']
+
+    by_stock = keys == ['date', 'stock']
+    sessions = session_dates(
+        news_df['date'], stock_df['date'],
+        stocks=news_stocks if by_stock else None,
+        session_stocks=stock_df['stock'] if by_stock else None,
+        tz=tz, close=close,
+    )
+    value = 'avg_daily_sentiment' if 'avg_daily_sentiment' in news_df.columns else 'polarity'
+    news_daily = (
+        pd.DataFrame({
+            'date': sessions,
+            'stock': news_stocks,
+            'avg_daily_sentiment': news_df[value].to_numpy(),
+        })
+        .dropna(subset=['date'])
+        .groupby(['date', 'stock'], sort=True)['avg_daily_sentiment'].mean()
+        .reset_index()
+    )
+
+    stock_df = stock_df.assign(date=_utc_days(stock_df['date']))
+    if by_stock:
+        stock_df['stock'] = _upper_symbols(stock_df['stock'])
+    merged_df = pd.merge(news_daily, stock_df, on=keys, how='inner')
     return merged_df
 
 # -----------------------------
@@ -52,3 +159,373 @@ def compute_lag_correlation(merged_df: pd.DataFrame, lag_days: int = 1) -> float
     
     corr, _ = pearsonr(merged_df['lagged_sentiment'], merged_df['Daily_Return'])
     return corr
+
+# -----------------------------
+# Wide Sentiment / Returns Matrices
+# -----------------------------
+def _utc_days(values) -> pd.DatetimeIndex:
+    """
+    UTC calendar days for datetime-like values (naive values are treated as UTC).
+    """
+    return pd.DatetimeIndex(pd.to_datetime(values, utc=True)).floor('D')
+
+def sentiment_matrix(news_df: pd.DataFrame, value: str = 'avg_daily_sentiment') -> pd.DataFrame:
+    """
+    Pivot aggregated news sentiment into a wide (UTC day x ticker) matrix.
+    Dates are floored to the UTC day; several rows for the same day and ticker are averaged.
+    Args:
+        news_df (pd.DataFrame): long table with 'date', 'stock' and the value column
+        value (str): column to pivot
+    Returns:
+        pd.DataFrame: dates as rows, upper-case tickers as columns, NaN where there is no news
+    """
+    days = _utc_days(news_df['date'])
+    values = news_df[value].to_numpy(dtype=np.float64)
+
+    # Scatter into a dense day x ticker grid with bincount instead of groupby/unstack;
+    # tickers are upper-cased per distinct symbol, not per row
+    day_codes, day_index = pd.factorize(days, sort=True)
+    raw_codes, raw_stocks = pd.factorize(news_df['stock'].astype(str))
+    upper_codes, stock_index = pd.factorize(pd.Index(raw_stocks).str.upper(), sort=True)
+    stock_codes = upper_codes[raw_codes]
+    keep = (day_codes >= 0) & ~np.isnan(values)
+    cells = day_codes[keep] * len(stock_index) + stock_codes[keep]
+    size = len(day_index) * len(stock_index)
+    sums = np.bincount(cells, weights=values[keep], minlength=size)
+    counts = np.bincount(cells, minlength=size)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        grid = np.where(counts > 0, sums / counts, np.nan)
+    return pd.DataFrame(
+        grid.reshape(len(day_index), len(stock_index)),
+        index=pd.DatetimeIndex(day_index, name='date'),
+        columns=pd.Index(stock_index, dtype=object),
+    )
+
+def align_matrices(sentiment: pd.DataFrame, returns: pd.DataFrame):
+    """
+    Restrict a sentiment matrix and a returns matrix to their common UTC days and tickers.
+    Args:
+        sentiment (pd.DataFrame): wide sentiment (see sentiment_matrix)
+        returns (pd.DataFrame): wide daily returns, dates as rows, tickers as columns
+    Returns:
+        tuple: (sentiment, returns) with identical index and columns
+    """
+    returns = returns.set_axis(_utc_days(returns.index), axis=0)
+    returns = returns.set_axis(returns.columns.astype(str).str.upper(), axis=1)
+    sentiment = sentiment.set_axis(_utc_days(sentiment.index), axis=0)
+    dates = sentiment.index.intersection(returns.index).sort_values()
+    tickers = sentiment.columns.intersection(returns.columns).sort_values()
+
+    def restrict(frame):
+        if frame.index.equals(dates) and frame.columns.equals(tickers):
+            return frame
+        return frame.reindex(index=dates, columns=tickers)
+
+    return restrict(sentiment), restrict(returns)
+
+# -----------------------------
+# Vectorized Pearson Correlation
+# -----------------------------
+def pearson_pvalue(r, n):
+    """
+    Two-sided p-value of Pearson r under the null of no correlation (as in scipy.stats.pearsonr).
+    Args:
+        r (array-like): correlation coefficients
+        n (array-like): number of observations behind each r
+    Returns:
+        np.ndarray: p-values (NaN where r is NaN or n < 2)
+    """
+    r = np.asarray(r, dtype=np.float64)
+    dof = np.asarray(n, dtype=np.float64) - 2
+    with np.errstate(invalid='ignore', divide='ignore'):
+        t = np.abs(r) * np.sqrt(dof / ((1.0 - r) * (1.0 + r)))
+        p = 2.0 * stats.t.sf(t, np.where(dof > 0, dof, np.nan))
+    # Two points always lie on a line: pearsonr reports p = 1
+    p = np.where(dof == 0, 1.0, p)
+    return np.where(np.isnan(r) | (dof < 0), np.nan, p)
+
+def masked_pearson(x: np.ndarray, y: np.ndarray, min_periods: int = 3):
+    """
+    Column-wise Pearson r over the rows where both x and y are present.
+    Uses centered masked sums, so every column is handled in the same array pass.
+    Args:
+        x, y (np.ndarray): 2-D arrays of the same shape (rows = days, columns = tickers), NaN = missing
+        min_periods (int): minimum paired observations for a result
+    Returns:
+        tuple: (r, n) arrays with one entry per column
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    mask = ~(np.isnan(x) | np.isnan(y))
+    n = mask.sum(axis=0)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean_x = np.where(mask, x, 0.0).sum(axis=0) / n
+        mean_y = np.where(mask, y, 0.0).sum(axis=0) / n
+        dx = np.where(mask, x - mean_x, 0.0)
+        dy = np.where(mask, y - mean_y, 0.0)
+        r = (dx * dy).sum(axis=0) / np.sqrt((dx * dx).sum(axis=0) * (dy * dy).sum(axis=0))
+    r = np.clip(r, -1.0, 1.0)
+    r[n < max(min_periods, 2)] = np.nan
+    return r, n
+
+# -----------------------------
+# Cross-Sectional Correlation (All Tickers)
+# -----------------------------
+def compute_cross_sectional_correlation(news_df: pd.DataFrame, returns: pd.DataFrame,
+                                        min_periods: int = 3, value: str = 'avg_daily_sentiment') -> pd.DataFrame:
+    """
+    Per-ticker Pearson correlation between daily sentiment and daily returns for a whole universe at once.
+    Each ticker's sentiment is paired with its own returns on the days where both exist.
+    Args:
+        news_df (pd.DataFrame): aggregated daily sentiment ('date', 'stock', 'avg_daily_sentiment'),
+                                or an already wide sentiment matrix
+        returns (pd.DataFrame): wide daily returns, dates as rows, tickers as columns
+                                (e.g. data_loader.load_returns_matrix())
+        min_periods (int): minimum paired days for a correlation
+        value (str): sentiment column to correlate
+    Returns:
+        pd.DataFrame: 'stock', 'r', 'p_value', 'n' (one row per ticker present in both inputs)
+    """
+    sentiment = news_df if 'stock' not in news_df.columns else sentiment_matrix(news_df, value)
+    sentiment, returns = align_matrices(sentiment, returns)
+    x = sentiment.to_numpy(dtype=np.float64)
+    y = returns.to_numpy(dtype=np.float64)
+
+    r = np.full(x.shape[1], np.nan)
+    n = np.zeros(x.shape[1], dtype=np.int64)
+    for start in range(0, x.shape[1], CORRELATION_BLOCK):
+        block = slice(start, start + CORRELATION_BLOCK)
+        r[block], n[block] = masked_pearson(x[:, block], y[:, block], min_periods)
+
+    return pd.DataFrame({
+        'stock': sentiment.columns.to_numpy(dtype=object),
+        'r': r,
+        'p_value': pearson_pvalue(r, n),
+        'n': n,
+    })
+
+# -----------------------------
+# Lag Profile (All Lags, Many Tickers)
+# -----------------------------
+def _ticker_matrix(merged_df: pd.DataFrame, columns, by):
+    """
+    Lay out each ticker's rows (in their original order) as one column of a
+    row-position x ticker matrix, padded with NaN.
+    Returns:
+        tuple: (tickers, [matrix per column], (valid rows, row positions, ticker codes))
+    """
+    if by is None:
+        codes = np.zeros(len(merged_df), dtype=np.intp)
+        tickers = pd.Index(['all'])
+    else:
+        codes, tickers = pd.factorize(merged_df[by], sort=True)
+        tickers = pd.Index(tickers)
+    valid = codes >= 0
+    codes = codes[valid]
+    # Position of every row within its ticker, keeping row order
+    position = pd.Series(codes).groupby(codes).cumcount().to_numpy()
+    depth = position.max() + 1 if len(position) else 0
+
+    matrices = []
+    for col in columns:
+        grid = np.full((depth, len(tickers)), np.nan)
+        grid[position, codes] = merged_df[col].to_numpy(dtype=np.float64)[valid]
+        matrices.append(grid)
+    return tickers, matrices, (valid, position, codes)
+
+def _centered_block(values: np.ndarray):
+    """
+    Transpose a days x tickers block to one ticker per row, center each ticker
+    on its own mean and zero-fill missing days.
+    Returns:
+        tuple: (centered values, presence mask as float)
+    """
+    values = np.ascontiguousarray(values.T)
+    mask = ~np.isnan(values)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = np.where(mask, values, 0.0).sum(axis=1, keepdims=True) / mask.sum(axis=1, keepdims=True)
+        centered = np.where(mask, values - mean, 0.0)
+    return centered, mask.astype(np.float64)
+
+def _pearson_from_sums(count, sx, sy, sxx, syy, sxy):
+    """
+    Pearson r from paired-observation sums. Inputs are centered beforehand, which
+    keeps the formula well conditioned.
+    """
+    with np.errstate(invalid='ignore', divide='ignore'):
+        var_x = count * sxx - sx * sx
+        var_y = count * syy - sy * sy
+        # Values that are constant over the overlap leave only round-off behind
+        var_x = np.where(var_x > 1e-10 * count * sxx, var_x, np.nan)
+        var_y = np.where(var_y > 1e-10 * count * syy, var_y, np.nan)
+        return np.clip((count * sxy - sx * sy) / np.sqrt(var_x * var_y), -1.0, 1.0)
+
+def _lag_sums_direct(x: np.ndarray, mask_x: np.ndarray, y: np.ndarray, mask_y: np.ndarray, lags):
+    """
+    Paired-observation sums per ticker and lag from overlapping slices (no shifted copies).
+    Returns:
+        tuple: (count, sx, sy, sxx, syy, sxy), each tickers x lags
+    """
+    depth = x.shape[1]
+    xx, yy = x * x, y * y
+    sums = np.zeros((6, x.shape[0], len(lags)))
+    for j, lag in enumerate(lags):
+        if abs(lag) >= depth:
+            continue
+        if lag >= 0:
+            past, now = slice(0, depth - lag), slice(lag, depth)
+        else:
+            past, now = slice(-lag, depth), slice(0, depth + lag)
+        xs, mxs, ys, mys = x[:, past], mask_x[:, past], y[:, now], mask_y[:, now]
+        pairs = ((mxs, mys), (xs, mys), (mxs, ys), (xx[:, past], mys), (mxs, yy[:, now]), (xs, ys))
+        for k, (a, b) in enumerate(pairs):
+            sums[k, :, j] = np.einsum('ij,ij->i', a, b)
+    return tuple(sums)
+
+def _lag_sums_fft(x: np.ndarray, mask_x: np.ndarray, y: np.ndarray, mask_y: np.ndarray, lags):
+    """
+    Paired-observation sums for every lag at once from FFT cross-correlations
+    of the centered values, their squares and the presence masks.
+    Returns:
+        tuple: (count, sx, sy, sxx, syy, sxy), each tickers x lags
+    """
+    size = fft.next_fast_len(2 * x.shape[1])
+    index = np.asarray(lags) % size
+    spectra = {
+        name: fft.rfft(values, n=size, axis=1, workers=-1)
+        for name, values in (('x', x), ('xx', x * x), ('mx', mask_x),
+                             ('y', y), ('yy', y * y), ('my', mask_y))
+    }
+
+    def xcorr(a, b):
+        # sum_t a[t - lag] * b[t] for every requested lag
+        return fft.irfft(np.conj(spectra[a]) * spectra[b], n=size, axis=1, workers=-1)[:, index]
+
+    return (np.rint(xcorr('mx', 'my')), xcorr('x', 'my'), xcorr('mx', 'y'),
+            xcorr('xx', 'my'), xcorr('mx', 'yy'), xcorr('x', 'y'))
+
+def compute_lag_profile(merged_df: pd.DataFrame, lags=range(-10, 11), by: str = 'stock',
+                        min_periods: int = 3, method: str = 'auto') -> pd.DataFrame:
+    """
+    Correlation between lagged sentiment and stock returns for every lag and ticker at once.
+    Each ticker's series is laid out and centered once; per-lag sums come from
+    overlapping slices ('direct') or from FFT cross-correlations ('fft'). A lag shifts sentiment by that many rows within each ticker, exactly like
+    compute_lag_correlation(merged_df, lag_days=lag): positive lags pair today's
+    return with earlier sentiment, negative lags with later sentiment.
+    Args:
+        merged_df (pd.DataFrame): merged DataFrame with 'avg_daily_sentiment' and 'Daily_Return'
+        lags (iterable of int): lags to evaluate
+        by (str): ticker column; each ticker is lagged separately (None = treat all rows as one series)
+        min_periods (int): minimum paired observations for a correlation
+        method (str): 'direct', 'fft' (all lags from FFT cross-correlations) or 'auto'
+                      (fft when there are more than FFT_MIN_LAGS lags)
+    Returns:
+        pd.DataFrame: one row per ticker; columns ('r', lag), ('n', lag) and ('p_value', lag),
+                      so profile['r'] is the ticker x lag correlation matrix
+    """
+    lags = [int(lag) for lag in lags]
+    if method == 'auto':
+        method = 'fft' if len(lags) > FFT_MIN_LAGS else 'direct'
+    if method not in ('direct', 'fft'):
+        raise ValueError("method must be 'direct', 'fft' or 'auto'.")
+    if by is not None and by not in merged_df.columns:
+        by = None
+
+    tickers, (x, y), _ = _ticker_matrix(merged_df, ['avg_daily_sentiment', 'Daily_Return'], by)
+    lag_sums = _lag_sums_fft if method == 'fft' else _lag_sums_direct
+    r = np.full((len(tickers), len(lags)), np.nan)
+    n = np.zeros((len(tickers), len(lags)), dtype=np.int64)
+    # Ticker blocks keep the temporaries cache-sized
+    for start in range(0, len(tickers), CORRELATION_BLOCK):
+        block = slice(start, start + CORRELATION_BLOCK)
+        sums = lag_sums(*_centered_block(x[:, block]), *_centered_block(y[:, block]), lags)
+        r[block] = _pearson_from_sums(*sums)
+        n[block] = np.rint(sums[0])
+    outside = np.abs(np.asarray(lags)) >= x.shape[0]
+    n[:, outside] = 0
+    r[n < max(min_periods, 2)] = np.nan
+
+    lag_index = pd.Index(lags, name='lag')
+    return pd.concat(
+        {
+            'r': pd.DataFrame(r, index=tickers, columns=lag_index),
+            'n': pd.DataFrame(n, index=tickers, columns=lag_index),
+            'p_value': pd.DataFrame(pearson_pvalue(r, n), index=tickers, columns=lag_index),
+        },
+        axis=1,
+    ).rename_axis(by or None)
+
+# -----------------------------
+# Rolling Correlation (Many Tickers)
+# -----------------------------
+def _window_sums(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Trailing-window sums along the last axis in O(1) per row.
+    The axis is cut into blocks of `window` rows with running prefix and suffix
+    sums inside each block; every window is one suffix plus one prefix, so
+    round-off stays bounded by the window instead of growing with the series.
+    """
+    length = values.shape[-1]
+    padded = -(-length // window) * window
+    blocks = np.zeros(values.shape[:-1] + (padded,))
+    blocks[..., :length] = values
+    blocks = blocks.reshape(values.shape[:-1] + (padded // window, window))
+    prefix = np.cumsum(blocks, axis=-1).reshape(values.shape[:-1] + (padded,))
+    suffix = np.cumsum(blocks[..., ::-1], axis=-1)[..., ::-1].reshape(values.shape[:-1] + (padded,))
+
+    end = np.arange(length)
+    begin = end - window + 1
+    # The suffix part is only needed when the window starts in the previous block
+    spans = (begin >= 0) & (begin // window != end // window)
+    sums = prefix[..., end]
+    sums[..., spans] += suffix[..., begin[spans]]
+    return sums
+
+def compute_rolling_correlation(merged_df: pd.DataFrame, window: int = 60, min_periods: int = None,
+                                by: str = 'stock') -> pd.DataFrame:
+    """
+    Trailing rolling Pearson correlation between sentiment and returns, per ticker.
+    The window covers the last `window` rows of each ticker (like pandas .rolling(window));
+    rows where either value is missing are skipped inside the window.
+    Args:
+        merged_df (pd.DataFrame): merged DataFrame with 'avg_daily_sentiment' and 'Daily_Return'
+        window (int): window length in rows (e.g. 60 trading days)
+        min_periods (int): minimum paired observations in a window (default: window)
+        by (str): ticker column; each ticker has its own windows (None = treat all rows as one series)
+    Returns:
+        pd.DataFrame: same index as merged_df with 'date' and `by` (when present),
+                      'rolling_corr' and 'rolling_n'; pass it to plot_sentiment_vs_returns(..., rolling_df=...)
+    """
+    if window < 1:
+        raise ValueError("window must be a positive integer.")
+    min_periods = window if min_periods is None else min_periods
+    if by is not None and by not in merged_df.columns:
+        by = None
+
+    tickers, (x, y), (valid, position, codes) = _ticker_matrix(
+        merged_df, ['avg_daily_sentiment', 'Daily_Return'], by
+    )
+    r = np.full(x.shape, np.nan)
+    n = np.zeros(x.shape, dtype=np.int64)
+    # Ticker blocks keep the temporaries cache-sized
+    for start in range(0, len(tickers), CORRELATION_BLOCK):
+        block = slice(start, start + CORRELATION_BLOCK)
+        (xb, mask_x), (yb, mask_y) = _centered_block(x[:, block]), _centered_block(y[:, block])
+        # Only pairs where both values are present enter the sums
+        pairs = np.stack([mask_x * mask_y, xb * mask_y, yb * mask_x, xb * xb * mask_y, yb * yb * mask_x, xb * yb])
+        sums = _window_sums(pairs, window)
+        count = np.rint(sums[0])
+        rolling = _pearson_from_sums(count, *sums[1:])
+        rolling[count < max(min_periods, 2)] = np.nan
+        r[:, block], n[:, block] = rolling.T, count.T
+
+    rolling_corr = np.full(len(merged_df), np.nan)
+    rolling_n = np.zeros(len(merged_df), dtype=np.int64)
+    rolling_corr[valid] = r[position, codes]
+    rolling_n[valid] = n[position, codes]
+
+    result = merged_df[[c for c in ('date', by) if c is not None and c in merged_df.columns]].copy()
+    result['rolling_corr'] = rolling_corr
+    result['rolling_n'] = rolling_n
+    return result
+
@@ -2,6 +2,9 @@
 import pandas as pd
 import os
 
+from ..eda.news_store import load_news, iter_news
+from ..stock.price_store import open_price_store, find_stock_file
+
 # Base paths
 NEWS_PATH = os.path.join("data", "news_data", "news.csv")
 STOCK_PATH = os.path.join("data", "stock_data")
@@ -9,38 +12,80 @@ STOCK_PATH = os.path.join("data", "stock_data")
 # -----------------------------
 # Load News Data
 # -----------------------------
-def load_news_data():
+def load_news_data(use_store: bool = True, columns=None, tickers=None, start=None, end=None):
     """
-    Load news CSV and normalize date column to datetime with UTC.
+    Load news data with the date column normalized to datetime with UTC.
+    Reads the columnar store (modules/eda/news_store.py) when it is newer than
+    the CSV, otherwise parses the CSV. Column selection and ticker/date filters
+    are pushed down into the reader.
+    Args:
+        use_store (bool): set False to always parse the CSV
+        columns (list): columns to load, e.g. ['date', 'stock', 'headline'] (default: all)
+        tickers (list): only load these stock symbols (case-insensitive)
+        start, end: only load articles with start <= date < end (naive dates are UTC)
     Returns:
         pd.DataFrame: news data with 'date', 'headline', 'stock', etc.
     """
-    df = pd.read_csv(NEWS_PATH)
-    
-    # Ensure date column is datetime with UTC
-    df['date'] = pd.to_datetime(df['date'], utc=True)
+    df = load_news(NEWS_PATH, use_store=use_store, columns=columns, tickers=tickers, start=start, end=end)
     
     # Clean stock symbols if necessary
-    df['stock'] = df['stock'].str.upper()
+    if 'stock' in df.columns:
+        df['stock'] = _upper_categories(df['stock'])
     
     return df
 
+# -----------------------------
+# Stream News Data in Chunks
+# -----------------------------
+def iter_news_data(chunksize: int = 100_000, use_store: bool = True, columns=('date', 'stock', 'headline'),
+                   tickers=None, start=None, end=None):
+    """
+    Stream news data in chunks of at most `chunksize` rows (same normalization as load_news_data).
+    Args:
+        chunksize (int): maximum rows per chunk
+        use_store (bool): set False to always read the CSV
+        columns (list): columns to load (default: what the sentiment pipeline needs)
+        tickers (list): only load these stock symbols (case-insensitive)
+        start, end: only load articles with start <= date < end (naive dates are UTC)
+    Yields:
+        pd.DataFrame: news chunk
+    """
+    columns = list(columns) if columns is not None else None
+    for chunk in iter_news(NEWS_PATH, chunksize=chunksize, use_store=use_store, columns=columns,
+                           tickers=tickers, start=start, end=end):
+        if 'stock' in chunk.columns:
+            chunk['stock'] = _upper_categories(chunk['stock'])
+        yield chunk
+
+def _upper_categories(stock: pd.Series) -> pd.Series:
+    """
+    Upper-case a categorical column by mapping its categories, not every row.
+    """
+    upper = stock.cat.categories.str.upper()
+    if upper.is_unique:
+        return stock.cat.rename_categories(upper)
+    return stock.astype(object).str.upper().astype('category')
+
 # -----------------------------
 # Load Stock Data
 # -----------------------------
-def load_stock_data(symbol: str):
+def load_stock_data(symbol: str, use_store: bool = True):
     """
-    Load stock CSV by symbol and normalize Date column.
+    Load stock data by symbol and normalize Date column.
+    Reads the memory-mapped price store (modules/stock/price_store.py), opened once
+    per session and rebuilt if the CSVs changed.
     Args:
-        symbol (str): Stock symbol (e.g., 'AAPL')
+        symbol (str): Stock symbol (e.g., 'AAPL', any case)
+        use_store (bool): set False to always parse the CSV
     Returns:
         pd.DataFrame: Stock data with 'Date', 'Close', etc.
     """
-    filename = f"{symbol.lower()}.csv"
-    path = os.path.join(STOCK_PATH, filename)
-    
-    if not os.path.exists(path):
-        raise FileNotFoundError(f"Stock file for {symbol} not found at {path}")
+    if use_store:
+        df = open_price_store(STOCK_PATH).frame(symbol).reset_index()
+        df['Date'] = df['Date'].dt.tz_localize('UTC')
+        return df
+
+    path = find_stock_file(symbol, STOCK_PATH)
     
     df = pd.read_csv(path)
     
@@ -49,6 +94,25 @@ def load_stock_data(symbol: str):
     
     return df
 
+# -----------------------------
+# Load Returns Matrix
+# -----------------------------
+def load_returns_matrix(symbols=None, price_col: str = 'Close'):
+    """
+    Wide daily returns for many stocks from the price store: dates (UTC) as rows, symbols as columns.
+    Each return is relative to the stock's previous trading day, as in compute_daily_returns.
+    Args:
+        symbols (list): stock symbols (default: all)
+        price_col (str): price column to compute returns from
+    Returns:
+        pd.DataFrame: daily returns, NaN where a stock has no price or no previous price
+    """
+    prices = open_price_store(STOCK_PATH).panel(price_col, symbols)
+    previous = prices.ffill().shift(1)
+    returns = (prices / previous - 1).where(prices.notna())
+    returns.index = returns.index.tz_localize('UTC')
+    return returns
+
 # -----------------------------
 # List Available Stocks
 # -----------------------------
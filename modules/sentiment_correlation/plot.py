@@ -1,62 +1,86 @@
 # plot.py
-import matplotlib.pyplot as plt
 import seaborn as sns
 import pandas as pd
 
+from ..rendering import new_figure, finish_figure, downsample_indices
+
 sns.set_style("whitegrid")
 
 # -----------------------------
 # Plot Sentiment vs Returns Over Time
 # -----------------------------
-def plot_sentiment_vs_returns(df: pd.DataFrame, stock_symbol: str):
+def plot_sentiment_vs_returns(df: pd.DataFrame, stock_symbol: str, rolling_df: pd.DataFrame = None,
+                              downsample='minmax', output=None):
     """
     Plot average daily sentiment and stock returns over time.
     Args:
         df (pd.DataFrame): Merged DataFrame with 'date', 'avg_daily_sentiment', 'Daily_Return'
         stock_symbol (str): Stock symbol for title
+        rolling_df (pd.DataFrame): optional output of compute_rolling_correlation,
+                                   overlaid as rolling correlation on a secondary axis
+        downsample (str): long series are reduced to about two points per pixel before drawing:
+                          'minmax' (keeps every extreme), 'lttb' (keeps the shape) or None
+        output: None (show, like plt.show()), 'figure', 'png'/'svg'/'pdf' bytes or a file path
+                (see modules/rendering.finish_figure)
     """
-    plt.figure(figsize=(12,5))
-    plt.plot(df['date'], df['avg_daily_sentiment'], label='Avg Daily Sentiment', marker='o')
-    plt.plot(df['date'], df['Daily_Return'], label='Daily Return', marker='x')
-    plt.title(f"{stock_symbol} - Sentiment vs Daily Returns Over Time")
-    plt.xlabel("Date")
-    plt.ylabel("Value")
-    plt.legend()
-    plt.xticks(rotation=45)
-    plt.tight_layout()
-    plt.show()
+    fig, ax = new_figure((12,5))
+    rows = downsample_indices(ax, [df['avg_daily_sentiment'], df['Daily_Return']], df['date'], downsample)
+    shown = df.iloc[rows]
+    ax.plot(shown['date'], shown['avg_daily_sentiment'], label='Avg Daily Sentiment', marker='o')
+    ax.plot(shown['date'], shown['Daily_Return'], label='Daily Return', marker='x')
+    ax.set_title(f"{stock_symbol} - Sentiment vs Daily Returns Over Time")
+    ax.set_xlabel("Date")
+    ax.set_ylabel("Value")
+    ax.legend(loc='upper left')
+    ax.tick_params(axis='x', labelrotation=45)
+
+    if rolling_df is not None:
+        if 'stock' in rolling_df.columns and (rolling_df['stock'] == stock_symbol).any():
+            rolling_df = rolling_df[rolling_df['stock'] == stock_symbol]
+        ax2 = ax.twinx()
+        rows = downsample_indices(ax2, [rolling_df['rolling_corr']], rolling_df['date'], downsample)
+        rolling_df = rolling_df.iloc[rows]
+        ax2.plot(rolling_df['date'], rolling_df['rolling_corr'], color='tab:green', label='Rolling Correlation')
+        ax2.set_ylabel("Rolling Correlation")
+        ax2.set_ylim(-1, 1)
+        ax2.legend(loc='upper right')
+
+    fig.tight_layout()
+    return finish_figure(fig, output)
 
 # -----------------------------
 # Scatter Plot: Sentiment vs Returns
 # -----------------------------
-def plot_scatter_correlation(df: pd.DataFrame, stock_symbol: str):
+def plot_scatter_correlation(df: pd.DataFrame, stock_symbol: str, output=None):
     """
     Scatter plot between avg daily sentiment and daily returns.
     Args:
         df (pd.DataFrame): Merged DataFrame
         stock_symbol (str): Stock symbol for title
+        output: see plot_sentiment_vs_returns
     """
-    plt.figure(figsize=(8,6))
-    sns.scatterplot(x='avg_daily_sentiment', y='Daily_Return', data=df)
-    sns.regplot(x='avg_daily_sentiment', y='Daily_Return', data=df, scatter=False, color='red')
-    plt.title(f"{stock_symbol} - Sentiment vs Daily Returns")
-    plt.xlabel("Avg Daily Sentiment")
-    plt.ylabel("Daily Return")
-    plt.tight_layout()
-    plt.show()
+    fig, ax = new_figure((8,6))
+    sns.scatterplot(x='avg_daily_sentiment', y='Daily_Return', data=df, ax=ax)
+    sns.regplot(x='avg_daily_sentiment', y='Daily_Return', data=df, scatter=False, color='red', ax=ax)
+    ax.set_title(f"{stock_symbol} - Sentiment vs Daily Returns")
+    ax.set_xlabel("Avg Daily Sentiment")
+    ax.set_ylabel("Daily Return")
+    fig.tight_layout()
+    return finish_figure(fig, output)
 
 # -----------------------------
 # Correlation Heatmap
 # -----------------------------
-def plot_correlation_heatmap(df: pd.DataFrame):
+def plot_correlation_heatmap(df: pd.DataFrame, output=None):
     """
     Plot correlation heatmap for all numeric columns in DataFrame.
     Args:
         df (pd.DataFrame): DataFrame containing numeric columns (avg_daily_sentiment, Daily_Return)
+        output: see plot_sentiment_vs_returns
     """
-    plt.figure(figsize=(6,5))
+    fig, ax = new_figure((6,5))
     corr_matrix = df[['avg_daily_sentiment', 'Daily_Return']].corr()
-    sns.heatmap(corr_matrix, annot=True, cmap='viridis', fmt=".2f")
-    plt.title("Correlation Heatmap")
-    plt.tight_layout()
-    plt.show()
+    sns.heatmap(corr_matrix, annot=True, cmap='viridis', fmt=".2f", ax=ax)
+    ax.set_title("Correlation Heatmap")
+    fig.tight_layout()
+    return finish_figure(fig, output)
@@ -0,0 +1,201 @@
+# scoring.py
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from importlib.metadata import version, PackageNotFoundError
+
+import numpy as np
+import pandas as pd
+from textblob._text import EMOTICONS
+from textblob.en import sentiment as pattern_sentiment
+
+# Sentiment label thresholds (same as the original get_label)
+POSITIVE_THRESHOLD = 0.05
+NEGATIVE_THRESHOLD = -0.05
+
+# Bump when the scoring logic changes so cached scores are invalidated
+ENGINE_VERSION = "1"
+
+try:
+    SCORER_VERSION = f"textblob-{version('textblob')}/engine-{ENGINE_VERSION}"
+except PackageNotFoundError:
+    SCORER_VERSION = f"textblob-unknown/engine-{ENGINE_VERSION}"
+
+_PIECE_SPLIT = r"[^a-z0-9]+"
+
+# Shards per worker, so slow shards don't leave other workers idle
+SHARDS_PER_WORKER = 4
+
+_lexicon_pieces = None
+_emoticon_pattern = None
+
+
+# -----------------------------
+# Lexicon Index
+# -----------------------------
+def _load_lexicon_index():
+    """
+    Load the pattern lexicon once and build the lookup structures used to
+    find headlines that cannot score anything.
+    Returns:
+        tuple: (set of alphanumeric lexicon pieces, emoticon regex)
+    """
+    global _lexicon_pieces, _emoticon_pattern
+    if _lexicon_pieces is None:
+        # len() forces the lazy XML lexicon to load
+        if len(pattern_sentiment) == 0:
+            raise RuntimeError("TextBlob sentiment lexicon (en-sentiment.xml) could not be loaded.")
+        pieces = set()
+        for word in dict.keys(pattern_sentiment):
+            pieces.update(p for p in re.split(_PIECE_SPLIT, word.lower()) if p)
+        emoticons = sorted({e.lower() for group in EMOTICONS.values() for e in group} | {"(!)"},
+                           key=len, reverse=True)
+        _emoticon_pattern = "|".join(re.escape(e) for e in emoticons)
+        _lexicon_pieces = pieces
+    return _lexicon_pieces, _emoticon_pattern
+
+
+def _lexicon_candidates(texts: pd.Series) -> np.ndarray:
+    """
+    Flag texts that contain at least one lexicon word or emoticon.
+    Texts without any can only score 0.0, so they skip the pattern scorer.
+    The check is a superset of the tokens the pattern tokenizer produces.
+    Args:
+        texts (pd.Series): unique headline strings
+    Returns:
+        np.ndarray: boolean mask
+    """
+    pieces, emoticon_pattern = _load_lexicon_index()
+    # The pattern tokenizer splits "n't" off before lowercasing; mirror it
+    lowered = texts.str.replace("n't", " n't", regex=False).str.lower()
+    tokens = lowered.str.split(_PIECE_SPLIT, regex=True).explode()
+    has_word = tokens.isin(pieces).groupby(level=0).any()
+    # The tokenizer re-joins spaced-out emoticons (": )" -> ":)"), so match without whitespace
+    has_emoticon = lowered.str.replace(r"\s+", "", regex=True).str.contains(emoticon_pattern, regex=True)
+    return (has_word | has_emoticon).to_numpy(dtype=bool)
+
+
+# -----------------------------
+# Batch Polarity Scoring
+# -----------------------------
+def score_unique(texts) -> np.ndarray:
+    """
+    Score already-deduplicated texts with the pattern lexicon.
+    Args:
+        texts (array-like): unique headline strings
+    Returns:
+        np.ndarray: float64 polarity per text, identical to TextBlob(text).sentiment.polarity
+    """
+    texts = pd.Series(texts, dtype=object).astype(str).reset_index(drop=True)
+    scores = np.zeros(len(texts), dtype=np.float64)
+    if texts.empty:
+        return scores
+
+    candidates = np.flatnonzero(_lexicon_candidates(texts))
+    values = texts.to_numpy()
+    for i in candidates:
+        scores[i] = pattern_sentiment(values[i])[0]
+    return scores
+
+
+def _init_worker():
+    """Load the lexicon once per worker process."""
+    _load_lexicon_index()
+
+
+def resolve_n_jobs(n_jobs) -> int:
+    """
+    Turn an n_jobs argument into a worker count (None -> 1, -1 -> all CPUs).
+    """
+    if n_jobs is None:
+        return 1
+    if n_jobs < 0:
+        return max(1, (os.cpu_count() or 1) + 1 + n_jobs)
+    if n_jobs == 0:
+        raise ValueError("n_jobs must be a non-zero integer or None.")
+    return n_jobs
+
+
+def scoring_pool(n_jobs=-1) -> ProcessPoolExecutor:
+    """
+    Create a process pool whose workers load the lexicon once at start-up.
+    Reuse it (executor=...) across calls to avoid re-spawning workers.
+    """
+    return ProcessPoolExecutor(max_workers=resolve_n_jobs(n_jobs), initializer=_init_worker)
+
+
+def score_unique_parallel(texts, n_jobs=None, executor=None) -> np.ndarray:
+    """
+    Score unique texts across a process pool. Texts are split into contiguous
+    shards and the shard results are concatenated in submission order, so the
+    output is identical to score_unique(texts).
+    Args:
+        texts (array-like): unique headline strings
+        n_jobs (int): number of worker processes (-1 = all CPUs)
+        executor (concurrent.futures.Executor): existing pool to use instead of creating one
+    Returns:
+        np.ndarray: float64 polarity per text
+    """
+    texts = np.asarray(pd.Series(texts, dtype=object).astype(str), dtype=object)
+    workers = resolve_n_jobs(n_jobs) if executor is None else resolve_n_jobs(n_jobs or -1)
+    if executor is None and (workers == 1 or len(texts) < workers):
+        return score_unique(texts)
+
+    shards = np.array_split(texts, workers * SHARDS_PER_WORKER)
+    shards = [shard for shard in shards if len(shard)]
+    if executor is not None:
+        results = list(executor.map(score_unique, shards))
+    else:
+        with scoring_pool(workers) as pool:
+            results = list(pool.map(score_unique, shards))
+    return np.concatenate(results) if results else np.zeros(0, dtype=np.float64)
+
+
+def score_polarity(headlines, n_jobs=None, executor=None, cache=None) -> np.ndarray:
+    """
+    Compute TextBlob polarity for every headline, scoring each unique headline once.
+    Args:
+        headlines (array-like): headline strings
+        n_jobs (int): number of worker processes (None = score in this process, -1 = all CPUs)
+        executor (concurrent.futures.Executor): existing pool to score in
+        cache (PolarityCache): persistent cache; only cache misses are scored and then stored
+    Returns:
+        np.ndarray: float64 polarity aligned with the input
+    """
+    codes, uniques = pd.factorize(pd.Series(headlines, dtype=object), use_na_sentinel=False)
+    uniques = np.asarray(pd.Series(uniques, dtype=object).astype(str), dtype=object)
+
+    if cache is None:
+        scores = _score(uniques, n_jobs, executor)
+    else:
+        scores = cache.get_many(uniques)
+        missing = np.flatnonzero(np.isnan(scores))
+        if len(missing):
+            scores[missing] = _score(uniques[missing], n_jobs, executor)
+            cache.put_many(uniques[missing], scores[missing])
+    return scores[codes]
+
+
+def _score(texts, n_jobs, executor) -> np.ndarray:
+    if n_jobs is None and executor is None:
+        return score_unique(texts)
+    return score_unique_parallel(texts, n_jobs=n_jobs, executor=executor)
+
+
+# -----------------------------
+# Vectorized Sentiment Labels
+# -----------------------------
+def label_polarity(polarity) -> np.ndarray:
+    """
+    Map polarity scores to 'positive', 'negative' or 'neutral'.
+    Args:
+        polarity (array-like): polarity scores
+    Returns:
+        np.ndarray: sentiment labels
+    """
+    polarity = np.asarray(polarity, dtype=np.float64)
+    return np.select(
+        [polarity > POSITIVE_THRESHOLD, polarity < NEGATIVE_THRESHOLD],
+        ['positive', 'negative'],
+        default='neutral',
+    ).astype(object)
@@ -1,6 +1,8 @@
 # sentiment_analysis.py
+from contextlib import nullcontext
+
 import pandas as pd
-from textblob import TextBlob
+from .scoring import score_polarity, label_polarity, resolve_n_jobs, scoring_pool
 
 # -----------------------------
 # Clean News Headlines
@@ -19,43 +21,53 @@ def clean_headlines(df: pd.DataFrame) -> pd.DataFrame:
 # -----------------------------
 # Compute Sentiment
 # -----------------------------
-def compute_sentiment(df: pd.DataFrame) -> pd.DataFrame:
+def compute_sentiment(df: pd.DataFrame, n_jobs=None, executor=None, cache=None) -> pd.DataFrame:
     """
-    Compute polarity using TextBlob and assign sentiment labels.
+    Compute polarity using the TextBlob pattern lexicon and assign sentiment labels.
+    Each unique headline is scored once; labels are assigned with vectorized thresholds.
     Args:
         df (pd.DataFrame): News DataFrame with 'headline' column
+        n_jobs (int): score in a process pool with this many workers (None = single process, -1 = all CPUs)
+        executor (concurrent.futures.Executor): existing process pool to score in
+        cache (PolarityCache): persistent polarity cache; only uncached headlines are scored
     Returns:
         pd.DataFrame: DataFrame with 'polarity' and 'sentiment_label'
     """
-    # Polarity: -1 to 1
-    df['polarity'] = df['headline'].apply(lambda x: TextBlob(x).sentiment.polarity)
-    
+    # Polarity: -1 to 1 (identical to TextBlob(x).sentiment.polarity)
+    df['polarity'] = score_polarity(df['headline'], n_jobs=n_jobs, executor=executor, cache=cache)
+
     # Assign sentiment labels based on thresholds
-    def get_label(p):
-        if p > 0.05:
-            return 'positive'
-        elif p < -0.05:
-            return 'negative'
-        else:
-            return 'neutral'
-    
-    df['sentiment_label'] = df['polarity'].apply(get_label)
+    df['sentiment_label'] = label_polarity(df['polarity'])
     return df
 
 # -----------------------------
 # Aggregate Daily Sentiment
 # -----------------------------
+def news_day(dates: pd.Series) -> pd.Series:
+    """
+    Calendar day (midnight) of every publication time: the date key of the daily aggregates,
+    shared by aggregate_daily_sentiment and DailySentimentAccumulator.
+    Args:
+        dates (pd.Series): datetime column (strings are parsed as UTC)
+    Returns:
+        pd.Series: dates floored to the day
+    """
+    if not pd.api.types.is_datetime64_any_dtype(dates):
+        dates = pd.to_datetime(dates, utc=True)
+    return dates.dt.floor('D')
+
 def aggregate_daily_sentiment(df: pd.DataFrame) -> pd.DataFrame:
     """
     Aggregate multiple headlines per day per stock into average daily sentiment.
     Args:
         df (pd.DataFrame): News DataFrame with 'date', 'stock', 'polarity'
     Returns:
-        pd.DataFrame: aggregated daily sentiment per stock
+        pd.DataFrame: aggregated daily sentiment per stock ('date' at midnight)
     """
     daily_sentiment = (
-        df.groupby(['date', 'stock'])
-        .agg(avg_daily_sentiment=('polarity', 'mean'))
+        df['polarity'].groupby([news_day(df['date']), df['stock'].astype(object)])
+        .mean()
+        .rename('avg_daily_sentiment')
         .reset_index()
     )
     return daily_sentiment
@@ -79,15 +91,116 @@ def compute_daily_returns(df: pd.DataFrame) -> pd.DataFrame:
 # -----------------------------
 # Full News Preprocessing
 # -----------------------------
-def preprocess_news_data(news_df: pd.DataFrame) -> pd.DataFrame:
+def preprocess_news_data(news_df: pd.DataFrame, n_jobs=None, executor=None, cache=None) -> pd.DataFrame:
     """
     Full preprocessing for news: clean headlines, compute sentiment, aggregate daily.
+    Pass n_jobs (or an executor) to score sentiment in a process pool,
+    and a PolarityCache to reuse scores from previous runs.
     """
     news_df = clean_headlines(news_df)
-    news_df = compute_sentiment(news_df)
+    news_df = compute_sentiment(news_df, n_jobs=n_jobs, executor=executor, cache=cache)
     news_daily = aggregate_daily_sentiment(news_df)
     return news_daily
 
+# -----------------------------
+# Streaming News Preprocessing
+# -----------------------------
+class DailySentimentAccumulator:
+    """
+    Running per-(day, stock) polarity sum and count, folded in one chunk at a time.
+    Dates are floored to the calendar day (news_day), so the state holds one row per day and
+    ticker however many articles arrive. result() matches aggregate_daily_sentiment
+    (up to floating-point summation order) without holding all rows in memory.
+    """
+
+    KEYS = ['date', 'stock']
+
+    def __init__(self, compact_rows: int = 1_000_000):
+        """
+        Args:
+            compact_rows (int): merge pending per-chunk partials once they exceed this many rows
+        """
+        self.compact_rows = compact_rows
+        self._state = None
+        self._partials = []
+        self._pending_rows = 0
+
+    def update(self, df: pd.DataFrame) -> None:
+        """
+        Fold a scored chunk ('date', 'stock', 'polarity') into the running per-day totals.
+        """
+        partial = (
+            df['polarity'].groupby([news_day(df['date']), df['stock'].astype(object)])
+            .agg(['sum', 'count'])
+        )
+        self._partials.append(partial)
+        self._pending_rows += len(partial)
+        if self._pending_rows >= self.compact_rows:
+            self._compact()
+
+    def _compact(self) -> None:
+        frames = ([self._state] if self._state is not None else []) + self._partials
+        if frames:
+            self._state = pd.concat(frames).groupby(level=[0, 1]).sum()
+        self._partials = []
+        self._pending_rows = 0
+
+    def totals(self) -> pd.DataFrame:
+        """
+        Returns:
+            pd.DataFrame: 'sum' and 'count' indexed by (date, stock), date at midnight
+        """
+        self._compact()
+        if self._state is None:
+            index = pd.MultiIndex.from_arrays([[], []], names=self.KEYS)
+            return pd.DataFrame({'sum': pd.Series(dtype=float), 'count': pd.Series(dtype='int64')}, index=index)
+        return self._state
+
+    def result(self) -> pd.DataFrame:
+        """
+        Returns:
+            pd.DataFrame: aggregated daily sentiment per stock ('date' at midnight), like aggregate_daily_sentiment
+        """
+        totals = self.totals()
+        totals = totals[totals['count'] > 0]
+        daily_sentiment = (totals['sum'] / totals['count']).rename('avg_daily_sentiment').reset_index()
+        return daily_sentiment
+
+def score_news_chunks(chunks, n_jobs=None, executor=None, cache=None):
+    """
+    Clean and score news chunks lazily, one at a time.
+    Args:
+        chunks (iterable of pd.DataFrame): news chunks with 'headline'
+        n_jobs, executor, cache: see compute_sentiment
+    Yields:
+        pd.DataFrame: chunk with 'polarity' and 'sentiment_label'
+    """
+    for chunk in chunks:
+        chunk = clean_headlines(chunk)
+        yield compute_sentiment(chunk, n_jobs=n_jobs, executor=executor, cache=cache)
+
+def preprocess_news_stream(chunks, n_jobs=None, executor=None, cache=None) -> pd.DataFrame:
+    """
+    Streaming version of preprocess_news_data for archives larger than memory:
+    chunks are cleaned and scored one at a time and folded into running
+    per-(day, stock) sums and counts, so peak memory is bounded by the chunk size
+    plus one row per day and ticker.
+    Args:
+        chunks (iterable of pd.DataFrame): e.g. data_loader.iter_news_data(chunksize=...)
+        n_jobs (int): score in a process pool shared by all chunks
+        executor (concurrent.futures.Executor): existing process pool to score in
+        cache (PolarityCache): persistent polarity cache
+    Returns:
+        pd.DataFrame: aggregated daily sentiment per stock ('date' at midnight)
+    """
+    accumulator = DailySentimentAccumulator()
+    own_pool = executor is None and resolve_n_jobs(n_jobs) > 1
+    with scoring_pool(n_jobs) if own_pool else nullcontext(executor) as pool:
+        jobs = None if pool is None else n_jobs
+        for chunk in score_news_chunks(chunks, n_jobs=jobs, executor=pool, cache=cache):
+            accumulator.update(chunk)
+    return accumulator.result()
+
 # -----------------------------
 # Full Stock Preprocessing
 # -----------------------------
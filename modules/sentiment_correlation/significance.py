@@ -0,0 +1,230 @@
+# significance.py
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+from scipy.stats import pearsonr
+
+from .scoring import resolve_n_jobs
+
+# Resamples are drawn and evaluated in batches of at most this many array entries,
+# which bounds memory to a few hundred MB
+RESAMPLE_BATCH_ELEMENTS = 4_000_000
+
+
+# -----------------------------
+# Resample Indices
+# -----------------------------
+def default_block_size(n: int) -> int:
+    """
+    Block length for block resampling: n ** (1/3), the usual rule of thumb for daily series.
+    """
+    return max(1, int(round(n ** (1 / 3))))
+
+def block_bootstrap_starts(n: int, n_resamples: int, block_size: int, rng) -> np.ndarray:
+    """
+    Circular moving-block bootstrap: each resample concatenates ceil(n / block_size)
+    randomly placed blocks of consecutive observations (wrapping around the end);
+    the last block is cut so every resample has n observations.
+    Args:
+        n (int): number of observations
+        n_resamples (int): number of resamples
+        block_size (int): block length (1 = ordinary bootstrap)
+        rng (np.random.Generator): random generator
+    Returns:
+        np.ndarray: (n_resamples, n_blocks) start index of every block
+    """
+    return rng.integers(0, n, size=(n_resamples, -(-n // block_size)))
+
+def block_permutation_orders(n_blocks: int, n_resamples: int, rng) -> np.ndarray:
+    """
+    Block permutation: the series is cut into consecutive blocks whose order is
+    shuffled, keeping the autocorrelation inside each block.
+    Args:
+        n_blocks (int): number of whole blocks
+        n_resamples (int): number of permutations
+        rng (np.random.Generator): random generator
+    Returns:
+        np.ndarray: (n_resamples, n_blocks) source block for every block position
+    """
+    return rng.permuted(np.broadcast_to(np.arange(n_blocks), (n_resamples, n_blocks)), axis=1)
+
+def _batches(n_per_resample: int, n_resamples: int):
+    """Resample counts per batch so a batch holds about RESAMPLE_BATCH_ELEMENTS entries."""
+    size = max(1, RESAMPLE_BATCH_ELEMENTS // max(n_per_resample, 1))
+    return [min(size, n_resamples - start) for start in range(0, n_resamples, size)]
+
+def _centered(x, y):
+    x, y = np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64)
+    return x - x.mean(), y - y.mean()
+
+
+# -----------------------------
+# Batched Correlations
+# -----------------------------
+def bootstrap_correlations(x, y, n_resamples: int = 10_000, block_size: int = None, seed=None) -> np.ndarray:
+    """
+    Pearson r for every block-bootstrap resample of the (x, y) pairs.
+    Resamples are never materialized: each one's sums are added up from
+    prefix-sum differences of its blocks, so a resample costs n_blocks lookups.
+    Args:
+        x, y (array-like): paired observations in time order
+        n_resamples (int): number of resamples
+        block_size (int): block length (default: default_block_size(n))
+        seed (int or np.random.Generator): random seed
+    Returns:
+        np.ndarray: n_resamples bootstrap correlations (NaN for degenerate resamples)
+    """
+    # Centering keeps the raw-sum formula well conditioned
+    x, y = _centered(x, y)
+    n = len(x)
+    rng = np.random.default_rng(seed)
+    block_size = min(block_size or default_block_size(n), max(n, 1))
+    n_blocks = -(-n // block_size)
+    lengths = np.full(n_blocks, block_size)
+    lengths[-1] = n - (n_blocks - 1) * block_size
+
+    # Prefix sums of x, y, x^2, y^2, xy over the series extended circularly by one block
+    wrap = np.r_[np.arange(n), np.arange(block_size) % n]
+    terms = np.stack([x[wrap], y[wrap], x[wrap] ** 2, y[wrap] ** 2, x[wrap] * y[wrap]])
+    prefix = np.concatenate([np.zeros((5, 1)), np.cumsum(terms, axis=1)], axis=1)
+
+    results = []
+    for batch in _batches(n_blocks * 5, n_resamples):
+        starts = block_bootstrap_starts(n, batch, block_size, rng)
+        sx, sy, sxx, syy, sxy = (prefix[:, starts + lengths] - prefix[:, starts]).sum(axis=2)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            r = (n * sxy - sx * sy) / np.sqrt((n * sxx - sx * sx) * (n * syy - sy * sy))
+        results.append(np.clip(r, -1.0, 1.0))
+    return np.concatenate(results) if results else np.zeros(0)
+
+def permutation_correlations(x, y, n_resamples: int = 10_000, block_size: int = None, seed=None) -> np.ndarray:
+    """
+    Pearson r under the null of no association: the whole blocks of x are permuted
+    against a fixed y (a trailing partial block stays in place).
+    Permuting keeps x's mean and variance, so a permutation's r is the sum of one
+    entry per block position from the block cross-product matrix.
+    Args:
+        x, y (array-like): paired observations in time order
+        n_resamples (int): number of permutations
+        block_size (int): block length (default: default_block_size(n))
+        seed (int or np.random.Generator): random seed
+    Returns:
+        np.ndarray: n_resamples null correlations
+    """
+    x, y = _centered(x, y)
+    n = len(x)
+    rng = np.random.default_rng(seed)
+    block_size = block_size or default_block_size(n)
+    n_blocks = n // block_size
+    whole = n_blocks * block_size
+    with np.errstate(invalid='ignore', divide='ignore'):
+        scale = 1.0 / np.sqrt((x @ x) * (y @ y))
+
+    # cross[a, j]: dot product of x block a with y block j
+    cross = x[:whole].reshape(n_blocks, block_size) @ y[:whole].reshape(n_blocks, block_size).T
+    fixed = x[whole:] @ y[whole:]
+    positions = np.arange(n_blocks)
+
+    results = []
+    for batch in _batches(n_blocks, n_resamples):
+        orders = block_permutation_orders(n_blocks, batch, rng)
+        results.append(np.clip((cross[orders, positions].sum(axis=1) + fixed) * scale, -1.0, 1.0))
+    return np.concatenate(results) if results else np.zeros(0)
+
+
+# -----------------------------
+# Significance of compute_correlation / compute_lag_correlation
+# -----------------------------
+def correlation_pairs(merged_df: pd.DataFrame, lag_days: int = 0):
+    """
+    The (sentiment, return) pairs that compute_correlation (lag 0) or
+    compute_lag_correlation(merged_df, lag_days) correlate; rows with a
+    missing value are dropped.
+    Returns:
+        tuple: (x, y) float64 arrays in row order
+    """
+    sentiment = merged_df['avg_daily_sentiment']
+    if lag_days:
+        sentiment = sentiment.shift(lag_days)
+    pairs = pd.DataFrame({'x': sentiment.to_numpy(), 'y': merged_df['Daily_Return'].to_numpy()}).dropna()
+    return pairs['x'].to_numpy(dtype=np.float64), pairs['y'].to_numpy(dtype=np.float64)
+
+def correlation_significance(merged_df: pd.DataFrame, lag_days: int = 0, n_resamples: int = 10_000,
+                             block_size: int = None, confidence: float = 0.95, seed=None) -> dict:
+    """
+    Block-bootstrap confidence interval and block-permutation p-value for the
+    correlation reported by compute_correlation / compute_lag_correlation.
+    Blocks keep the autocorrelation of daily series that the pearsonr p-value ignores.
+    Args:
+        merged_df (pd.DataFrame): merged DataFrame
+        lag_days (int): sentiment lag, as in compute_lag_correlation (0 = compute_correlation)
+        n_resamples (int): bootstrap resamples and permutations
+        block_size (int): block length (default: n ** (1/3))
+        confidence (float): confidence level of the interval
+        seed (int or np.random.Generator): random seed
+    Returns:
+        dict: r, n, pearson_p, ci_low, ci_high, bootstrap_se, permutation_p, block_size
+    """
+    x, y = correlation_pairs(merged_df, lag_days)
+    rng = np.random.default_rng(seed)
+    n = len(x)
+    block_size = block_size or default_block_size(n)
+    if n < 3:
+        r, p = (pearsonr(x, y) if n == 2 else (np.nan, np.nan))
+        return {'r': float(r), 'n': n, 'pearson_p': float(p), 'ci_low': np.nan, 'ci_high': np.nan,
+                'bootstrap_se': np.nan, 'permutation_p': np.nan, 'block_size': block_size}
+
+    r, pearson_p = pearsonr(x, y)
+    boot = bootstrap_correlations(x, y, n_resamples, block_size, rng)
+    null = permutation_correlations(x, y, n_resamples, block_size, rng)
+
+    alpha = (1.0 - confidence) / 2.0
+    ci_low, ci_high = (np.nanquantile(boot, [alpha, 1.0 - alpha]) if np.isfinite(boot).any() else (np.nan, np.nan))
+    # Two-sided p-value with the +1 correction so it is never exactly 0
+    permutation_p = (1 + np.count_nonzero(np.abs(null) >= abs(r) - 1e-12)) / (len(null) + 1)
+    return {
+        'r': float(r),
+        'n': n,
+        'pearson_p': float(pearson_p),
+        'ci_low': float(ci_low),
+        'ci_high': float(ci_high),
+        'bootstrap_se': float(np.nanstd(boot, ddof=1)),
+        'permutation_p': float(permutation_p),
+        'block_size': block_size,
+    }
+
+def _ticker_significance(args):
+    ticker, frame, kwargs = args
+    return {'stock': ticker, **correlation_significance(frame, **kwargs)}
+
+def correlation_significance_by_ticker(merged_df: pd.DataFrame, by: str = 'stock', lag_days: int = 0,
+                                       n_resamples: int = 10_000, block_size: int = None,
+                                       confidence: float = 0.95, seed=None, n_jobs=None) -> pd.DataFrame:
+    """
+    correlation_significance for every ticker of a merged DataFrame, optionally in a process pool.
+    Each ticker gets its own random stream spawned from `seed`, so results do not
+    depend on n_jobs or on the order in which tickers finish.
+    Args:
+        merged_df (pd.DataFrame): merged DataFrame with a ticker column
+        by (str): ticker column
+        lag_days, n_resamples, block_size, confidence: see correlation_significance
+        seed (int): random seed
+        n_jobs (int): worker processes (None = this process, -1 = all CPUs)
+    Returns:
+        pd.DataFrame: one row per ticker
+    """
+    groups = list(merged_df.groupby(by, sort=True, observed=True))
+    streams = np.random.SeedSequence(seed).spawn(len(groups))
+    tasks = [
+        (ticker, frame, dict(lag_days=lag_days, n_resamples=n_resamples, block_size=block_size,
+                             confidence=confidence, seed=np.random.default_rng(stream)))
+        for (ticker, frame), stream in zip(groups, streams)
+    ]
+    workers = resolve_n_jobs(n_jobs)
+    if workers == 1 or len(tasks) < 2:
+        rows = [_ticker_significance(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            rows = list(pool.map(_ticker_significance, tasks))
+    return pd.DataFrame(rows)
@@ -0,0 +1,180 @@
+# modules/stock/benchmark.py
+
+import time
+
+import numpy as np
+import pandas as pd
+
+from . import data_loader
+from .data_loader import load_stocks
+from .indicators import BACKENDS, compute_indicator_panel, resolve_indicator_specs
+from .price_store import PriceStore, build_price_store, open_price_store, price_store_path
+
+
+# ---------- Price loading ----------
+def benchmark_price_loading(repeat=3):
+    """
+    Compare loading every stock in the stock_data folder from CSV with
+    loading it from the memory-mapped price store.
+
+    Parameters:
+    - repeat: timing repetitions (best run is reported)
+
+    Returns:
+    - dict: seconds for CSV loading, building the store, opening it, zero-copy views
+      and DataFrames for every symbol, plus the speedup and an exact-match flag
+    """
+    def best(fn):
+        times = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            result = fn()
+            times.append(time.perf_counter() - start)
+        return min(times), result
+
+    data_path = data_loader.DATA_PATH
+    csv_seconds, csv_frames = best(lambda: load_stocks(use_store=False))
+
+    start = time.perf_counter()
+    build_price_store(data_path)
+    build_seconds = time.perf_counter() - start
+
+    open_seconds, store = best(lambda: PriceStore(price_store_path(data_path)))
+    views_seconds, _ = best(lambda: {s: store.arrays(s) for s in store.symbols})
+    frames_seconds, store_frames = best(lambda: load_stocks())
+
+    csv_frames = {symbol.upper(): df for symbol, df in csv_frames.items()}
+    return {
+        'symbols': len(store),
+        'csv_seconds': csv_seconds,
+        'build_seconds': build_seconds,
+        'open_seconds': open_seconds,
+        'views_seconds': views_seconds,
+        'frames_seconds': frames_seconds,
+        'speedup': csv_seconds / frames_seconds,
+        'exact_match': all(csv_frames[s].equals(df) for s, df in store_frames.items()),
+    }
+
+
+# ---------- Indicator backends ----------
+DEFAULT_INDICATOR_SPECS = [('sma', {'window': 20}), ('sma', {'window': 50}), ('ema', {'window': 20}),
+                           'rsi', 'macd', 'bbands']
+
+
+def compare_indicator_backends(prices=None, specs=None, rtol=1e-9, atol=1e-9):
+    """
+    Check the NumPy indicator backend against TA-Lib on every symbol.
+    A value passes when |numpy - talib| <= atol + rtol * |talib|; the absolute term covers
+    indicators that hover around 0 (MACD, its histogram), where a relative error means nothing.
+    Warm-up NaNs must be in the same places.
+
+    Parameters:
+    - prices: dict {symbol: df} or PriceStore (default: the price store of DATA_PATH)
+    - specs: indicator specs (default: DEFAULT_INDICATOR_SPECS)
+    - rtol, atol: allowed relative and absolute difference
+
+    Returns:
+    - df: one row per indicator column with 'max_abs_error', 'max_rel_error', 'nan_mismatches' and 'ok'
+    """
+    if 'talib' not in BACKENDS:
+        raise ImportError("TA-Lib is not installed; nothing to compare the NumPy backend against.")
+    prices = open_price_store(data_loader.DATA_PATH) if prices is None else prices
+    specs = DEFAULT_INDICATOR_SPECS if specs is None else specs
+
+    reference = compute_indicator_panel(prices, specs, backend='talib').to_numpy()
+    fallback = compute_indicator_panel(prices, specs, backend='numpy').to_numpy()
+    missing = np.isnan(reference)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        abs_error = np.where(missing, 0.0, np.abs(fallback - reference))
+        rel_error = np.where(missing, 0.0, abs_error / np.abs(reference))
+        excess = np.where(missing, 0.0, abs_error - (atol + rtol * np.abs(reference)))
+    # A value NaN in one backend only counts as an infinite error
+    abs_error, rel_error, excess = (np.nan_to_num(e, nan=np.inf) for e in (abs_error, rel_error, excess))
+
+    columns = [col for _, _, cols in resolve_indicator_specs(specs) for col in cols]
+    result = pd.DataFrame({
+        'max_abs_error': abs_error.max(axis=0, initial=0.0),
+        'max_rel_error': rel_error.max(axis=0, initial=0.0),
+        'nan_mismatches': (missing != np.isnan(fallback)).sum(axis=0),
+    }, index=pd.Index(columns, name='indicator'))
+    result['ok'] = (excess.max(axis=0, initial=-np.inf) <= 0) & (result['nan_mismatches'] == 0)
+    return result
+
+
+def check_indicator_backends(prices=None, specs=None, rtol=1e-9, atol=1e-9):
+    """
+    compare_indicator_backends that fails when any indicator is out of tolerance.
+
+    Returns:
+    - df: the comparison (all rows ok)
+
+    Raises:
+    - AssertionError: listing the indicators that differ
+    """
+    result = compare_indicator_backends(prices, specs, rtol=rtol, atol=atol)
+    failed = result[~result['ok']]
+    if len(failed):
+        raise AssertionError(f"NumPy indicator backend differs from TA-Lib:\n{failed.to_string()}")
+    return result
+
+
+def make_synthetic_prices(n_symbols=50, n_rows=2500, seed=0):
+    """
+    Random-walk daily prices shaped like load_stocks(), for running the checks without stock_data.
+
+    Returns:
+    - dict: {symbol: df} with OHLC, 'Adj Close', 'Volume' and 'Price' on a business-day 'Date' index
+    """
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range('2010-01-04', periods=n_rows, name='Date')
+    frames = {}
+    for i in range(n_symbols):
+        close = 50.0 * np.exp(np.cumsum(rng.normal(0.0, 0.02, n_rows)))
+        spread = close * rng.uniform(0.0, 0.02, n_rows)
+        frames[f'SYM{i}'] = pd.DataFrame({
+            'Open': close + rng.uniform(-1.0, 1.0, n_rows) * spread,
+            'High': close + spread,
+            'Low': close - spread,
+            'Close': close,
+            'Adj Close': close,
+            'Volume': rng.integers(10_000, 1_000_000, n_rows).astype(np.float64),
+            'Price': close,
+        }, index=dates)
+    return frames
+
+
+def benchmark_indicator_backends(prices=None, specs=None, repeat=3):
+    """
+    Time the batch indicator engine with each available backend.
+
+    Parameters:
+    - prices: dict {symbol: df} or PriceStore (default: the price store of DATA_PATH)
+    - specs: indicator specs (default: DEFAULT_INDICATOR_SPECS)
+    - repeat: timing repetitions (best run is reported)
+
+    Returns:
+    - dict: rows, seconds per backend and the NumPy slowdown relative to TA-Lib
+    """
+    prices = open_price_store(data_loader.DATA_PATH) if prices is None else prices
+    specs = DEFAULT_INDICATOR_SPECS if specs is None else specs
+
+    result = {}
+    for name in sorted(BACKENDS):
+        times = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            panel = compute_indicator_panel(prices, specs, backend=name)
+            times.append(time.perf_counter() - start)
+        result[f'{name}_seconds'] = min(times)
+    result['rows'] = len(panel)
+    if 'talib_seconds' in result:
+        result['numpy_slowdown'] = result['numpy_seconds'] / result['talib_seconds']
+    return result
+
+
+if __name__ == '__main__':
+    # Run from the project root as `python -m modules.stock.benchmark` (CI does);
+    # uses synthetic prices when the stock_data folder is not there
+    import os
+    prices = None if os.path.isdir(data_loader.DATA_PATH) else make_synthetic_prices()
+    print(check_indicator_backends(prices))
@@ -0,0 +1,246 @@
+# modules/stock/covariance.py
+
+import numpy as np
+import pandas as pd
+
+from .optimizer import TRADING_DAYS
+from .portfolio import prepare_portfolio_data
+
+
+# ---------- Returns matrix ----------
+def returns_matrix(df_dict, price_col='Price'):
+    """
+    Daily returns of many stocks on the union of their dates, keeping NaN where a
+    stock has no return (see prepare_portfolio_data with dropna=False).
+
+    Parameters:
+    - df_dict: dictionary of {symbol: df}
+    - price_col: column used for returns calculation
+
+    Returns:
+    - returns_df: DataFrame (dates x symbols)
+    """
+    return prepare_portfolio_data(df_dict, price_col=price_col, dropna=False)
+
+
+def _masked(returns_df):
+    """Column-demeaned returns with NaN replaced by 0, and the observation mask as float."""
+    values = np.asarray(returns_df, dtype=np.float64)
+    mask = ~np.isnan(values)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        means = np.where(mask, values, 0.0).sum(axis=0) / mask.sum(axis=0)
+    centered = np.where(mask, values - means, 0.0)
+    return centered, mask.astype(np.float64)
+
+
+# ---------- Pairwise-complete covariance ----------
+def pairwise_covariance(returns_df, min_periods=2):
+    """
+    Sample covariance where every pair of stocks uses all dates on which both have a
+    return (like DataFrame.cov), computed with a few matrix products instead of a
+    loop over pairs.
+
+    Parameters:
+    - returns_df: DataFrame of returns with NaN for missing values
+    - min_periods: minimum overlapping observations (NaN below that)
+
+    Returns:
+    - cov: DataFrame (symbols x symbols)
+    """
+    centered, mask = _masked(returns_df)
+    counts = mask.T @ mask
+    # Sums of each stock over the dates it shares with the other one
+    sums = centered.T @ mask
+    cross = centered.T @ centered
+    with np.errstate(invalid='ignore', divide='ignore'):
+        cov = (cross - sums * sums.T / counts) / (counts - 1)
+    cov[counts < max(min_periods, 2)] = np.nan
+    return pd.DataFrame(cov, index=returns_df.columns, columns=returns_df.columns)
+
+
+# ---------- Ledoit-Wolf shrinkage ----------
+def ledoit_wolf_covariance(returns_df, return_shrinkage=False):
+    """
+    Ledoit-Wolf covariance: the sample covariance shrunk towards a scaled identity with
+    the intensity that minimizes the expected squared error. Stays well conditioned
+    when there are more stocks than dates.
+    Missing returns are handled pairwise: every entry and its estimation variance use the
+    dates both stocks share. Without missing data this is the standard estimator
+    (the same as sklearn.covariance.ledoit_wolf).
+
+    Parameters:
+    - returns_df: DataFrame of returns with NaN for missing values
+    - return_shrinkage: also return the shrinkage intensity
+
+    Returns:
+    - cov: DataFrame (symbols x symbols), or (cov, shrinkage)
+    """
+    centered, mask = _masked(returns_df)
+    n_features = centered.shape[1]
+    counts = mask.T @ mask
+    squares = centered * centered
+    with np.errstate(invalid='ignore', divide='ignore'):
+        sample = (centered.T @ centered) / counts
+        # Estimation variance of every sample entry: E[(x_i x_j - s_ij)^2] / n_ij
+        entry_variance = ((squares.T @ squares) / counts - sample * sample) / counts
+    sample = np.nan_to_num(sample)
+    entry_variance = np.nan_to_num(entry_variance)
+
+    target = np.trace(sample) / n_features
+    distance = ((sample - target * np.eye(n_features)) ** 2).sum() / n_features
+    error = min(entry_variance.sum() / n_features, distance)
+    shrinkage = 0.0 if distance == 0 else error / distance
+
+    cov = (1.0 - shrinkage) * sample
+    cov[np.diag_indices(n_features)] += shrinkage * target
+    cov = pd.DataFrame(cov, index=returns_df.columns, columns=returns_df.columns)
+    return (cov, shrinkage) if return_shrinkage else cov
+
+
+# ---------- Exponentially weighted covariance ----------
+class EWMCovariance:
+    """
+    Exponentially weighted covariance that is updated in place as new return rows arrive,
+    without revisiting history. Matches DataFrame.ewm(...).cov() (adjust=True) at the
+    latest row, including pairwise handling of missing values: each pair keeps its own
+    weight sums and means, so memory is a few symbols x symbols matrices.
+
+    Usage:
+        ewm = EWMCovariance(returns_df.columns, halflife=60)
+        ewm.update(returns_df)           # history
+        ewm.update(todays_returns)       # one new row (Series or 1-D array)
+        cov = ewm.covariance()
+    """
+
+    def __init__(self, columns, halflife=None, alpha=None, min_periods=0, bias=False, ignore_na=False):
+        """
+        Parameters:
+        - columns: symbols, in the order of the rows passed to update()
+        - halflife / alpha: decay, as in DataFrame.ewm (give exactly one)
+        - min_periods: minimum overlapping observations (NaN below that)
+        - bias: return the biased (weighted population) covariance
+        - ignore_na: as in DataFrame.ewm; False decays weights on dates a pair is missing
+        """
+        if (halflife is None) == (alpha is None):
+            raise ValueError("Pass exactly one of halflife or alpha.")
+        self.alpha = alpha if alpha is not None else 1.0 - np.exp(np.log(0.5) / halflife)
+        if not 0.0 < self.alpha <= 1.0:
+            raise ValueError("alpha must be in (0, 1].")
+        self.columns = pd.Index(columns)
+        self.min_periods = min_periods
+        self.bias = bias
+        self.ignore_na = ignore_na
+
+        n = len(self.columns)
+        self._weight = np.zeros((n, n))       # sum of weights per pair
+        self._weight_sq = np.zeros((n, n))    # sum of squared weights per pair
+        self._mean = np.zeros((n, n))         # [i, j]: weighted mean of i over dates shared with j
+        self._cov = np.zeros((n, n))          # weighted (biased) covariance per pair
+        self._count = np.zeros((n, n), dtype=np.int64)
+        # Work arrays reused by every update
+        self._scratch = [np.zeros((n, n)) for _ in range(4)]
+
+    def _update_row(self, row):
+        observed = ~np.isnan(row)
+        complete = observed.all()
+        decay = 1.0 - self.alpha
+        total, step, deviation, scratch = self._scratch
+        pairs = None if complete else np.outer(observed, observed).astype(np.float64)
+
+        # Weights of every pair age by one date (only on shared dates with ignore_na);
+        # pairs that have not started yet have zero weights and are unaffected
+        if self.ignore_na and not complete:
+            factor = 1.0 - self.alpha * pairs
+            self._weight *= factor
+            self._weight_sq *= factor * factor
+        else:
+            self._weight *= decay
+            self._weight_sq *= decay * decay
+
+        # Pairs not observed on this date get a zero step, which leaves them unchanged
+        x = np.where(observed, row, 0.0)[:, None]
+        np.subtract(x, self._mean, out=deviation)
+        if complete:
+            np.add(self._weight, 1.0, out=total)
+        else:
+            deviation *= pairs
+            np.add(self._weight, pairs, out=total)
+            total[total == 0.0] = 1.0
+
+        # new mean = mean + step; the covariance update uses the shift of both pair means
+        # and the deviation of the new row from the new means
+        np.divide(deviation, total, out=step)
+        self._mean += step
+        deviation -= step
+        np.multiply(step, step.T, out=scratch)
+        self._cov += scratch
+        self._cov *= self._weight
+        np.multiply(deviation, deviation.T, out=scratch)
+        self._cov += scratch
+        self._cov /= total
+
+        if complete:
+            self._weight, self._scratch[0] = total, self._weight
+            self._weight_sq += 1.0
+            self._count += 1
+        else:
+            self._weight += pairs
+            self._weight_sq += pairs
+            self._count += pairs.astype(np.int64)
+
+    def update(self, returns):
+        """
+        Add one row (Series / 1-D array) or many rows (DataFrame / 2-D array) of returns, in date order.
+        DataFrame and Series inputs are aligned to `columns` by name.
+        """
+        if isinstance(returns, pd.Series):
+            returns = returns.reindex(self.columns).to_numpy(dtype=np.float64)
+        elif isinstance(returns, pd.DataFrame):
+            returns = returns.reindex(columns=self.columns).to_numpy(dtype=np.float64)
+        rows = np.atleast_2d(np.asarray(returns, dtype=np.float64))
+        if rows.shape[1] != len(self.columns):
+            raise ValueError(f"Expected {len(self.columns)} returns per row, got {rows.shape[1]}.")
+        for row in rows:
+            self._update_row(row)
+        return self
+
+    def covariance(self):
+        """
+        Current covariance estimate.
+
+        Returns:
+        - cov: DataFrame (symbols x symbols)
+        """
+        cov = self._cov.copy()
+        if not self.bias:
+            squared = self._weight * self._weight
+            denominator = squared - self._weight_sq
+            with np.errstate(invalid='ignore', divide='ignore'):
+                cov = np.where(denominator > 0, cov * squared / denominator, np.nan)
+        cov[(self._count < max(self.min_periods, 1)) | (self._count == 0)] = np.nan
+        return pd.DataFrame(cov, index=self.columns, columns=self.columns)
+
+
+# ---------- Inputs for the optimizer ----------
+def covariance_moments(returns_df, method='ledoit_wolf', periods=TRADING_DAYS, **kwargs):
+    """
+    Annualized expected returns and covariance for MeanVarianceOptimizer.
+
+    Parameters:
+    - returns_df: DataFrame of daily returns (NaN allowed)
+    - method: 'ledoit_wolf', 'pairwise' or 'ewm' (kwargs go to EWMCovariance, e.g. halflife=60)
+    - periods: periods per year
+
+    Returns:
+    - (mu, cov): Series and DataFrame
+    """
+    mu = returns_df.mean() * periods
+    if method == 'ledoit_wolf':
+        cov = ledoit_wolf_covariance(returns_df)
+    elif method == 'pairwise':
+        cov = pairwise_covariance(returns_df, **kwargs)
+    elif method == 'ewm':
+        cov = EWMCovariance(returns_df.columns, **kwargs).update(returns_df).covariance()
+    else:
+        raise ValueError(f"Unknown covariance method {method!r}; use 'ledoit_wolf', 'pairwise' or 'ewm'.")
+    return mu, cov * periods
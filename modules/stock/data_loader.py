@@ -4,36 +4,67 @@
 import pandas as pd
 import os
 
+from .price_store import open_price_store, find_stock_file
+
 # Root-relative path to stock_data folder
 DATA_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'data', 'stock_data')
 
-def load_stock(symbol):
+def _finish_stock_frame(df):
+    # Use 'Adj Close' if present, else 'Close'
+    if 'Adj Close' in df.columns:
+        df['Price'] = df['Adj Close']
+    else:
+        df['Price'] = df['Close']
+
+    # Sort chronologically
+    df.sort_index(inplace=True)
+
+    return df
+
+
+def load_stock(symbol, use_store=True):
     """
-    Load a stock CSV from stock_data folder.
+    Load a stock from the stock_data folder.
     
     Parameters:
-    - symbol: str, stock ticker (without .csv)
+    - symbol: str, stock ticker (without .csv, any case)
+    - use_store: read from the memory-mapped price store (price_store.py), opened once
+      per session and rebuilt if the CSVs changed; set False to always parse the CSV
     
     Returns:
     - df: pandas DataFrame with Date as index and 'Price' column (Adj Close if available, else Close)
     """
+    if use_store:
+        return _finish_stock_frame(open_price_store(DATA_PATH).frame(symbol))
 
-    # Full file path
-    file_path = os.path.join(DATA_PATH, f"{symbol}.csv")
+    # Full file path (filename case is ignored)
+    file_path = find_stock_file(symbol, DATA_PATH)
 
     # Load CSV
     df = pd.read_csv(file_path, parse_dates=['Date'])
 
-    # Use 'Adj Close' if present, else 'Close'
-    if 'Adj Close' in df.columns:
-        df['Price'] = df['Adj Close']
-    else:
-        df['Price'] = df['Close']
-
     # Set Date as index
     df.set_index('Date', inplace=True)
 
-    # Sort chronologically
-    df.sort_index(inplace=True)
+    return _finish_stock_frame(df)
 
-    return df
+
+def load_stocks(symbols=None, use_store=True):
+    """
+    Load several stocks at once (every stock in the stock_data folder by default).
+    
+    Parameters:
+    - symbols: list of tickers (default None = all)
+    - use_store: see load_stock
+    
+    Returns:
+    - dict: {symbol: df} with the same frames as load_stock
+    """
+    if not use_store:
+        if symbols is None:
+            symbols = [os.path.splitext(f)[0] for f in sorted(os.listdir(DATA_PATH)) if f.endswith('.csv')]
+        return {symbol: load_stock(symbol, use_store=False) for symbol in symbols}
+
+    store = open_price_store(DATA_PATH)
+    symbols = store.symbols if symbols is None else symbols
+    return {symbol: _finish_stock_frame(store.frame(symbol)) for symbol in symbols}
@@ -2,11 +2,12 @@
 
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
 import seaborn as sns
 from statsmodels.tsa.seasonal import seasonal_decompose
 from IPython.display import display
 
+from ..rendering import new_figure, finish_figure, downsample_indices
+
 
 # Set seaborn style for nicer plots
 sns.set_theme(style="darkgrid")
@@ -72,69 +73,90 @@ def time_range(df):
     return {'start': start, 'end': end, 'approx_freq': freq}
 
 
-def correlation_matrix(df, numeric_only=True, annot=True, figsize=(8,6)):
+def _with_figure(result, fig, output):
+    # Plots that also compute something return it alone when the figure is shown,
+    # and (result, rendered figure) for any other output
+    rendered = finish_figure(fig, output)
+    return result if output is None else (result, rendered)
+
+
+def correlation_matrix(df, numeric_only=True, annot=True, figsize=(8,6), output=None):
     """
     Plot correlation matrix for numeric columns
+    output: None (show, like plt.show(), and return corr), or 'figure', 'png'/'svg'/'pdf' or a file path
+    to return (corr, rendered figure) -- see rendering.finish_figure
     """
     corr = df.corr(numeric_only=numeric_only)
-    plt.figure(figsize=figsize)
-    sns.heatmap(corr, annot=annot, fmt=".2f", cmap='vlag', center=0)
-    plt.title("Correlation Matrix")
-    plt.show()
-    return corr
+    fig, ax = new_figure(figsize)
+    sns.heatmap(corr, annot=annot, fmt=".2f", cmap='vlag', center=0, ax=ax)
+    ax.set_title("Correlation Matrix")
+    return _with_figure(corr, fig, output)
 
 
-def plot_time_series(df, columns=None, figsize=(12,5), title=None):
+def plot_time_series(df, columns=None, figsize=(12,5), title=None, downsample='minmax', output=None):
     """
     Plot selected columns over time
+    downsample: long series are reduced to about two points per pixel before drawing:
+    'minmax' (keeps every extreme), 'lttb' (keeps the shape) or None (draw every point)
+    output: None (show, like plt.show()), 'figure', 'png'/'svg'/'pdf' bytes or a file path (see rendering.finish_figure)
     """
     if columns is None:
         columns = ['Price'] if 'Price' in df.columns else df.select_dtypes(include=np.number).columns.tolist()
-    plt.figure(figsize=figsize)
-    df[columns].plot()
-    plt.title(title or "Time Series")
-    plt.xlabel("Date")
-    plt.ylabel("Value")
-    plt.legend()
-    plt.show()
-
-
-def plot_distribution(df, column='Price', bins=50, figsize=(8,4)):
+    # A single column name is accepted too (e.g. columns=get_price_column(df))
+    columns = [columns] if isinstance(columns, str) else list(columns)
+    fig, ax = new_figure(figsize)
+    data = df[columns]
+    rows = downsample_indices(ax, [data[col] for col in columns], data.index, downsample)
+    data.iloc[rows].plot(ax=ax)
+    if len(rows) < len(data):
+        # A thinned index has no frequency, so pandas adds margins; keep the full-width view
+        ax.margins(x=0)
+    ax.set_title(title or "Time Series")
+    ax.set_xlabel("Date")
+    ax.set_ylabel("Value")
+    ax.legend()
+    return finish_figure(fig, output)
+
+
+def plot_distribution(df, column='Price', bins=50, figsize=(8,4), output=None):
     """
     Plot histogram + KDE of a column
+    output: see plot_time_series
     """
-    plt.figure(figsize=figsize)
-    sns.histplot(df[column].dropna(), bins=bins, kde=True)
-    plt.title(f"Distribution of {column}")
-    plt.show()
+    fig, ax = new_figure(figsize)
+    sns.histplot(df[column].dropna(), bins=bins, kde=True, ax=ax)
+    ax.set_title(f"Distribution of {column}")
+    return finish_figure(fig, output)
 
 
-def plot_returns_distribution(df, column='Price', bins=50, figsize=(8,4)):
+def plot_returns_distribution(df, column='Price', bins=50, figsize=(8,4), output=None):
     """
     Plot percent-change (returns) distribution
+    output: see correlation_matrix (returns, or (returns, rendered figure))
     """
     returns = df[column].pct_change().dropna()
-    plt.figure(figsize=figsize)
-    sns.histplot(returns, bins=bins, kde=True)
-    plt.title(f"Returns Distribution of {column}")
-    plt.show()
-    return returns
+    fig, ax = new_figure(figsize)
+    sns.histplot(returns, bins=bins, kde=True, ax=ax)
+    ax.set_title(f"Returns Distribution of {column}")
+    return _with_figure(returns, fig, output)
 
 
-def rolling_stats(df, column='Price', window=20, figsize=(12,6)):
+def rolling_stats(df, column='Price', window=20, figsize=(12,6), downsample='minmax', output=None):
     """
     Plot rolling mean and rolling std (volatility)
+    downsample, output: see plot_time_series (statistics use every row; only drawing is reduced)
     """
     rolling_mean = df[column].rolling(window).mean()
     rolling_std = df[column].rolling(window).std()
 
-    plt.figure(figsize=figsize)
-    plt.plot(df.index, df[column], label='Price', alpha=0.6)
-    plt.plot(rolling_mean, label=f'Rolling Mean ({window})')
-    plt.plot(rolling_std, label=f'Rolling Std ({window})')
-    plt.legend()
-    plt.title(f"Rolling statistics ({window} days)")
-    plt.show()
+    fig, ax = new_figure(figsize)
+    rows = downsample_indices(ax, [df[column], rolling_mean, rolling_std], df.index, downsample)
+    ax.plot(df.index[rows], df[column].iloc[rows], label='Price', alpha=0.6)
+    ax.plot(rolling_mean.iloc[rows], label=f'Rolling Mean ({window})')
+    ax.plot(rolling_std.iloc[rows], label=f'Rolling Std ({window})')
+    ax.legend()
+    ax.set_title(f"Rolling statistics ({window} days)")
+    return finish_figure(fig, output)
 
 
 def detect_outliers_iqr(df, column='Price', multiplier=1.5):
@@ -152,16 +174,27 @@ def detect_outliers_iqr(df, column='Price', multiplier=1.5):
     return mask, df[mask]
 
 
-def seasonal_decompose_plot(df, column='Price', model='additive', period=None):
+def seasonal_decompose_plot(df, column='Price', model='additive', period=None, output=None):
     """
     Decompose time-series into trend, seasonal, residual components
     period: number of observations in a cycle (e.g., 252 for daily trading data ~1 year)
+    output: see correlation_matrix (result, or (result, rendered figure))
     """
     if period is None:
         period = 252
     clean = df[column].dropna()
     result = seasonal_decompose(clean, model=model, period=period, extrapolate_trend='freq')
-    result.plot()
-    plt.suptitle(f"Seasonal Decompose of {column} (period={period})", fontsize=14)
-    plt.show()
-    return result
+    # Same panels as DecomposeResult.plot(), drawn on our own figure instead of through pyplot
+    fig, axes = new_figure((8, 8), nrows=4, sharex=True)
+    components = [(result.observed, column), (result.trend, 'Trend'), (result.seasonal, 'Seasonal'),
+                  (result.resid, 'Resid')]
+    for ax, (series, label) in zip(axes, components):
+        if label == 'Resid':
+            ax.plot(series.index, series, marker='o', linestyle='none')
+            ax.axhline(0.0 if model.startswith('a') else 1.0, color='black')
+        else:
+            ax.plot(series.index, series)
+        ax.set_ylabel(label)
+    fig.suptitle(f"Seasonal Decompose of {column} (period={period})", fontsize=14)
+    fig.tight_layout()
+    return _with_figure(result, fig, output)
@@ -0,0 +1,383 @@
+# modules/stock/eda_report.py
+
+import numpy as np
+import pandas as pd
+
+from .price_store import PriceStore, iter_price_series
+
+# Headless counterparts of the per-DataFrame helpers in eda.py for a whole symbol panel.
+# Every symbol's rows are stacked into one array per column with segment offsets, so each
+# statistic is a handful of grouped NumPy reductions instead of one pandas call per symbol.
+# Nothing is printed or plotted.
+
+# Statistics of descriptive_stats (DataFrame.describe + skew + kurtosis)
+DESCRIBE_COLUMNS = ['count', 'mean', 'std', 'min', '25%', '50%', '75%', 'max', 'skew', 'kurtosis']
+
+# pandas treats central moment sums below this as round-off (nanops._zero_out_fperr)
+_FPERR = 1e-14
+
+
+# ---------- Panel layout ----------
+class StockPanel:
+    """
+    Columns of many symbols stacked end to end: values[offsets[i]:offsets[i + 1]] belong to symbols[i].
+
+    Usage:
+        panel = StockPanel.from_prices(load_stocks())
+        report = stock_eda_report(panel)
+    """
+
+    def __init__(self, symbols, offsets, dates, columns):
+        self.symbols = list(symbols)
+        self.offsets = np.asarray(offsets, dtype=np.int64)
+        self.dates = dates
+        self.columns = columns
+
+    @classmethod
+    def from_prices(cls, prices, columns=None):
+        """
+        Parameters:
+        - prices: dict {symbol: df} (e.g. load_stocks()) or a PriceStore
+        - columns: columns to stack (default: every numeric column; for a PriceStore the
+          store columns plus 'Price')
+        """
+        if columns is None:
+            if isinstance(prices, PriceStore):
+                columns = prices.columns + ['Price']
+            else:
+                columns = list(dict.fromkeys(
+                    col for df in prices.values() for col in df.select_dtypes(include='number').columns))
+
+        symbols, dates = [], []
+        for symbol, symbol_dates, _ in _iter_column(prices, columns[0] if columns else 'Price'):
+            symbols.append(symbol)
+            dates.append(np.asarray(symbol_dates, dtype='datetime64[ns]'))
+        stacked = {col: [np.asarray(values, dtype=np.float64) for _, _, values in _iter_column(prices, col)]
+                   for col in columns}
+
+        lengths = [len(d) for d in dates]
+        offsets = np.concatenate([[0], np.cumsum(lengths)]).astype(np.int64)
+        dates = np.concatenate(dates) if dates else np.array([], dtype='datetime64[ns]')
+        values = {col: (np.concatenate(parts) if parts else np.zeros(0)) for col, parts in stacked.items()}
+        return cls(symbols, offsets, dates, values)
+
+    @property
+    def lengths(self):
+        return np.diff(self.offsets)
+
+    @property
+    def codes(self):
+        """Symbol number of every stacked row."""
+        return np.repeat(np.arange(len(self.symbols)), self.lengths)
+
+    def segment_sum(self, values):
+        """Per-symbol sums of a stacked array (0 for symbols without rows)."""
+        sums = np.zeros(len(self.symbols))
+        rows = self.lengths > 0
+        if rows.any():
+            sums[rows] = np.add.reduceat(values, self.offsets[:-1][rows])
+        return sums
+
+    def sorted_values(self, values):
+        """
+        Copy of a stacked array with every symbol's segment sorted ascending, NaN at the
+        end of the segment. Each segment is sorted in place, so memory stays O(rows).
+        """
+        ordered = np.array(values, dtype=np.float64)
+        for start, stop in zip(self.offsets[:-1].tolist(), self.offsets[1:].tolist()):
+            if stop - start > 1:
+                ordered[start:stop].sort()
+        return ordered
+
+
+def _iter_column(prices, column):
+    """iter_price_series, with NaN for symbols that lack the column."""
+    if isinstance(prices, PriceStore) and column != 'Price':
+        for symbol in prices.symbols:
+            values = prices.array(symbol, column)
+            if column not in prices.symbol_columns(symbol):
+                values = np.full(len(values), np.nan)
+            yield symbol, prices.dates(symbol), values
+    elif not isinstance(prices, PriceStore):
+        for symbol, df in prices.items():
+            values = df[column].to_numpy() if column in df.columns else np.full(len(df), np.nan)
+            yield symbol, df.index.to_numpy(), values
+    else:
+        yield from iter_price_series(prices, column)
+
+
+def _panel(prices, columns=None):
+    return prices if isinstance(prices, StockPanel) else StockPanel.from_prices(prices, columns)
+
+
+# ---------- Grouped statistics ----------
+def _lerp(low, high, fraction):
+    # Same interpolation as numpy's 'linear' quantile method (used by pandas)
+    diff = high - low
+    return np.where(fraction >= 0.5, high - diff * (1.0 - fraction), low + diff * fraction)
+
+
+def _quantiles(panel, ordered, counts, qs):
+    """Linear-interpolated quantiles of every segment of sorted_values() with counts valid values."""
+    starts = panel.offsets[:-1]
+    empty = counts == 0
+    out = []
+    for q in qs:
+        position = (np.maximum(counts, 1) - 1) * q
+        low = np.floor(position).astype(np.int64)
+        high = np.minimum(low + 1, np.maximum(counts - 1, 0))
+        # Symbols without values would read the next symbol's first row; they are masked below
+        value = _lerp(ordered[np.minimum(starts + low, len(ordered) - 1)],
+                      ordered[np.minimum(starts + high, len(ordered) - 1)], position - low) \
+            if len(ordered) else np.full(len(counts), np.nan)
+        out.append(np.where(empty, np.nan, value))
+    return out
+
+
+def _describe(panel, values):
+    """DESCRIBE_COLUMNS for every symbol of one stacked column."""
+    valid = ~np.isnan(values)
+    complete = valid.all()
+    count = panel.lengths.astype(np.float64) if complete else panel.segment_sum(valid.astype(np.float64))
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = panel.segment_sum(values if complete else np.where(valid, values, 0.0)) / count
+        centered = values - np.repeat(mean, panel.lengths)
+        if not complete:
+            centered[~valid] = 0.0
+        # Central moment sums from one buffer raised to the 2nd, 3rd and 4th power in place
+        power = centered * centered
+        m2 = panel.segment_sum(power)
+        power *= centered
+        m3 = panel.segment_sum(power)
+        power *= centered
+        m4 = panel.segment_sum(power)
+        std = np.sqrt(m2 / (count - 1))
+
+        # Bias-corrected skewness and excess kurtosis, as pandas Series.skew / Series.kurt
+        m2 = np.where(np.abs(m2) < _FPERR, 0.0, m2)
+        m3 = np.where(np.abs(m3) < _FPERR, 0.0, m3)
+        skew = (count * (count - 1) ** 0.5 / (count - 2)) * (m3 / m2 ** 1.5)
+        skew = np.where(m2 == 0, 0.0, skew)
+        numerator = count * (count + 1) * (count - 1) * m4
+        denominator = (count - 2) * (count - 3) * m2 ** 2
+        numerator = np.where(np.abs(numerator) < _FPERR, 0.0, numerator)
+        denominator = np.where(np.abs(denominator) < _FPERR, 0.0, denominator)
+        kurtosis = numerator / denominator - 3 * (count - 1) ** 2 / ((count - 2) * (count - 3))
+        kurtosis = np.where(denominator == 0, 0.0, kurtosis)
+    std[count < 2] = np.nan
+    skew[count < 3] = np.nan
+    kurtosis[count < 4] = np.nan
+
+    minimum, q1, median, q3, maximum = _quantiles(panel, panel.sorted_values(values), count.astype(np.int64),
+                                                  [0.0, 0.25, 0.5, 0.75, 1.0])
+    return pd.DataFrame({
+        'count': count, 'mean': mean, 'std': std, 'min': minimum, '25%': q1, '50%': median,
+        '75%': q3, 'max': maximum, 'skew': skew, 'kurtosis': kurtosis,
+    }, index=pd.Index(panel.symbols, name='symbol'))
+
+
+def _returns(panel, column):
+    """Stacked percent changes of a column; the first row of every symbol is NaN."""
+    values = panel.columns[column]
+    returns = np.full(len(values), np.nan)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        returns[1:] = values[1:] / values[:-1] - 1.0
+    returns[panel.offsets[:-1][panel.lengths > 0]] = np.nan
+    return returns
+
+
+def _window_sums(panel, values, window):
+    """
+    Trailing window sums that restart at every symbol (NaN for the first window - 1 rows).
+    Running sums restart every `window` rows, so round-off stays bounded by the window.
+    """
+    length = len(values)
+    padded = -(-length // window) * window
+    blocks = np.zeros(padded)
+    blocks[:length] = values
+    blocks = blocks.reshape(-1, window)
+    prefix = np.cumsum(blocks, axis=1).ravel()
+    suffix = np.cumsum(blocks[:, ::-1], axis=1)[:, ::-1].ravel()
+
+    # The window ending at row e starts at b = e - window + 1: prefix[e] covers its part in
+    # e's block and suffix[b] the rest, in b's block, unless b starts e's block (e ends a block)
+    sums = prefix[:length].copy()
+    if length >= window:
+        whole = sums[window - 1::window].copy()
+        sums[window - 1:] += suffix[:length - window + 1]
+        sums[window - 1::window] = whole
+    # Windows reaching back into the previous symbol are incomplete
+    head = panel.offsets[:-1, None] + np.arange(window - 1)
+    sums[head[head < panel.offsets[1:, None]]] = np.nan
+    return sums
+
+
+# ---------- Report tables ----------
+def panel_descriptive_stats(prices, columns=None):
+    """
+    descriptive_stats for every symbol and column at once.
+
+    Parameters:
+    - prices: dict {symbol: df}, PriceStore or StockPanel
+    - columns: columns to describe (default: all numeric)
+
+    Returns:
+    - df: indexed by (symbol, column) with DESCRIBE_COLUMNS
+    """
+    panel = _panel(prices, columns)
+    columns = list(panel.columns) if columns is None else columns
+    tables = np.stack([_describe(panel, panel.columns[col]).to_numpy() for col in columns], axis=1) \
+        if columns else np.zeros((len(panel.symbols), 0, len(DESCRIBE_COLUMNS)))
+    index = pd.MultiIndex.from_product([panel.symbols, columns], names=['symbol', 'column'])
+    return pd.DataFrame(tables.reshape(-1, len(DESCRIBE_COLUMNS)), index=index, columns=DESCRIBE_COLUMNS)
+
+
+def panel_returns_stats(prices, column='Price'):
+    """
+    Return statistics of descriptive_stats(include_returns=True) for every symbol
+    (percent changes without forward filling gaps; missing returns are skipped).
+
+    Returns:
+    - df: indexed by symbol with DESCRIBE_COLUMNS
+    """
+    panel = _panel(prices, [column])
+    return _describe(panel, _returns(panel, column))
+
+
+def panel_missing_values(prices, columns=None):
+    """
+    missing_values for every symbol and column.
+
+    Returns:
+    - df: indexed by (symbol, column) with 'missing_count' and 'missing_pct'
+    """
+    panel = _panel(prices, columns)
+    columns = list(panel.columns) if columns is None else columns
+    lengths = panel.lengths
+    counts = np.column_stack([panel.segment_sum(np.isnan(panel.columns[col]).astype(np.float64))
+                              for col in columns]) if columns else np.zeros((len(lengths), 0))
+    with np.errstate(invalid='ignore', divide='ignore'):
+        pct = counts / lengths[:, None] * 100
+    index = pd.MultiIndex.from_product([panel.symbols, columns], names=['symbol', 'column'])
+    return pd.DataFrame({'missing_count': counts.ravel().astype(np.int64), 'missing_pct': pct.ravel()}, index=index)
+
+
+def panel_time_range(prices):
+    """
+    time_range for every symbol, plus its number of rows.
+
+    Returns:
+    - df: indexed by symbol with 'start', 'end', 'approx_freq' and 'rows'
+    """
+    panel = _panel(prices, [])
+    lengths, starts = panel.lengths, panel.offsets[:-1]
+    dates = panel.dates.view(np.int64)
+    has_rows, has_two = lengths > 0, lengths > 1
+    nat = np.iinfo(np.int64).min
+    start, end, freq = (np.full(len(lengths), nat) for _ in range(3))
+    if has_rows.any():
+        start[has_rows] = np.minimum.reduceat(dates, starts[has_rows])
+        end[has_rows] = np.maximum.reduceat(dates, starts[has_rows])
+    freq[has_two] = dates[starts[has_two] + 1] - dates[starts[has_two]]
+    return pd.DataFrame({
+        'start': start.view('datetime64[ns]'),
+        'end': end.view('datetime64[ns]'),
+        'approx_freq': freq.view('timedelta64[ns]'),
+        'rows': lengths,
+    }, index=pd.Index(panel.symbols, name='symbol'))
+
+
+def panel_outliers_iqr(prices, column='Price', multiplier=1.5):
+    """
+    detect_outliers_iqr for every symbol: IQR bounds and how many rows fall outside them.
+
+    Returns:
+    - df: indexed by symbol with 'q1', 'q3', 'iqr', 'lower', 'upper', 'n_outliers', 'outlier_pct'
+    """
+    panel = _panel(prices, [column])
+    values = panel.columns[column]
+    count = panel.segment_sum((~np.isnan(values)).astype(np.float64)).astype(np.int64)
+    q1, q3 = _quantiles(panel, panel.sorted_values(values), count, [0.25, 0.75])
+    iqr = q3 - q1
+    lower, upper = q1 - multiplier * iqr, q3 + multiplier * iqr
+    outside = (values < np.repeat(lower, panel.lengths)) | (values > np.repeat(upper, panel.lengths))
+    n_outliers = panel.segment_sum(outside.astype(np.float64)).astype(np.int64)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        pct = n_outliers / panel.lengths * 100
+    return pd.DataFrame({'q1': q1, 'q3': q3, 'iqr': iqr, 'lower': lower, 'upper': upper,
+                         'n_outliers': n_outliers, 'outlier_pct': pct},
+                        index=pd.Index(panel.symbols, name='symbol'))
+
+
+def panel_rolling_stats(prices, column='Price', window=20):
+    """
+    Summary of rolling_stats for every symbol: the latest rolling mean and std
+    (as column.rolling(window)) and the average and maximum rolling std.
+
+    Returns:
+    - df: indexed by symbol with 'rolling_mean', 'rolling_std', 'rolling_std_mean', 'rolling_std_max'
+    """
+    panel = _panel(prices, [column])
+    values = panel.columns[column]
+    valid = ~np.isnan(values)
+    complete = valid.all()
+    lengths = panel.lengths
+    last = panel.offsets[1:] - 1
+    rows = lengths > 0
+    with np.errstate(invalid='ignore', divide='ignore'):
+        # Shift every symbol by its mean so the sum of squares stays well conditioned
+        count = lengths.astype(np.float64) if complete else panel.segment_sum(valid.astype(np.float64))
+        level = panel.segment_sum(values if complete else np.where(valid, values, 0.0)) / count
+        shifted = values - np.repeat(np.nan_to_num(level), lengths)
+        if not complete:
+            shifted[~valid] = 0.0
+        total = _window_sums(panel, shifted, window)
+        total_sq = _window_sums(panel, shifted * shifted, window)
+        # Without missing values every window past the first window - 1 rows is full
+        full = ~np.isnan(total) if complete else _window_sums(panel, valid.astype(np.float64), window) == window
+        variance = np.clip((total_sq - total * total / window) / (window - 1), 0.0, None)
+        std = np.where(full & (window > 1), np.sqrt(variance), np.nan)
+
+        has_std = ~np.isnan(std)
+        n_std = panel.segment_sum(has_std.astype(np.float64))
+        std_mean = panel.segment_sum(np.where(has_std, std, 0.0)) / n_std
+        mean = np.full(len(lengths), np.nan)
+        ends = rows & full[np.maximum(last, 0)] if len(values) else rows & False
+        mean[ends] = total[last[ends]] / window + level[ends]
+    std_max = np.full(len(lengths), np.nan)
+    if rows.any():
+        std_max[rows] = np.fmax.reduceat(std, panel.offsets[:-1][rows])
+    return pd.DataFrame({
+        'rolling_mean': mean,
+        'rolling_std': np.where(rows, std[np.maximum(last, 0)] if len(values) else np.nan, np.nan),
+        'rolling_std_mean': std_mean,
+        'rolling_std_max': std_max,
+    }, index=pd.Index(panel.symbols, name='symbol'))
+
+
+def stock_eda_report(prices, columns=None, column='Price', window=20, multiplier=1.5):
+    """
+    Universe-wide data-quality report: every table above from one stacked panel.
+
+    Parameters:
+    - prices: dict {symbol: df} (e.g. load_stocks()), PriceStore or StockPanel
+    - columns: columns for the descriptive and missing-value tables (default: all numeric)
+    - column: price column for returns, outliers and rolling statistics
+    - window: rolling window
+    - multiplier: IQR multiplier for outliers
+
+    Returns:
+    - dict: {'descriptive', 'returns', 'missing', 'time_range', 'outliers', 'rolling'} DataFrames
+    """
+    if columns is not None and column not in columns:
+        columns = list(columns) + [column]
+    panel = _panel(prices, columns)
+    columns = list(panel.columns) if columns is None else columns
+    return {
+        'descriptive': panel_descriptive_stats(panel, columns),
+        'returns': panel_returns_stats(panel, column),
+        'missing': panel_missing_values(panel, columns),
+        'time_range': panel_time_range(panel),
+        'outliers': panel_outliers_iqr(panel, column, multiplier),
+        'rolling': panel_rolling_stats(panel, column, window),
+    }
@@ -1,46 +1,83 @@
 # modules/stock/indicators.py
 
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 import pandas as pd
 import numpy as np
-import talib  # Technical Analysis Library
+
+try:
+    import talib  # Technical Analysis Library
+except ImportError:  # the TA-Lib C library is not installed
+    talib = None
+
+from . import numpy_indicators
+from .price_store import iter_price_series
+
+# Indicator backends: modules exposing SMA, EMA, RSI, MACD and BBANDS with TA-Lib's signatures
+BACKENDS = {'numpy': numpy_indicators}
+if talib is not None:
+    BACKENDS['talib'] = talib
+
+_backend = 'talib' if talib is not None else 'numpy'
+
+
+# ---------- Backend selection ----------
+def get_backend(name=None):
+    """
+    Return an indicator backend module (default: the active one, TA-Lib when installed).
+    """
+    name = _backend if name is None else name
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown indicator backend {name!r}; available: {sorted(BACKENDS)}")
+    return BACKENDS[name]
+
+
+def set_backend(name):
+    """
+    Choose the backend used by the add_* functions and the batch engine ('talib' or 'numpy').
+    """
+    global _backend
+    get_backend(name)
+    _backend = name
 
 
 # ---------- Simple Moving Average (SMA) ----------
 def add_sma(df, window=20, column='Price'):
     """
-    Add Simple Moving Average (SMA) using TA-Lib.
+    Add Simple Moving Average (SMA) using the active backend (TA-Lib by default).
     """
-    df[f'SMA_{window}'] = talib.SMA(df[column].values, timeperiod=window)
+    df[f'SMA_{window}'] = get_backend().SMA(df[column].values, timeperiod=window)
     return df
 
 
 # ---------- Exponential Moving Average (EMA) ----------
 def add_ema(df, window=20, column='Price'):
     """
-    Add Exponential Moving Average (EMA) using TA-Lib.
+    Add Exponential Moving Average (EMA) using the active backend (TA-Lib by default).
     """
-    df[f'EMA_{window}'] = talib.EMA(df[column].values, timeperiod=window)
+    df[f'EMA_{window}'] = get_backend().EMA(df[column].values, timeperiod=window)
     return df
 
 
 # ---------- Relative Strength Index (RSI) ----------
 def add_rsi(df, window=14, column='Price'):
     """
-    Add RSI using TA-Lib.
+    Add RSI using the active backend (TA-Lib by default).
     """
-    df[f'RSI_{window}'] = talib.RSI(df[column].values, timeperiod=window)
+    df[f'RSI_{window}'] = get_backend().RSI(df[column].values, timeperiod=window)
     return df
 
 
 # ---------- Moving Average Convergence Divergence (MACD) ----------
 def add_macd(df, fast=12, slow=26, signal=9, column='Price'):
     """
-    Add MACD, MACD signal, and MACD histogram using TA-Lib.
+    Add MACD, MACD signal, and MACD histogram using the active backend (TA-Lib by default).
     """
-    macd, macd_signal, macd_hist = talib.MACD(df[column].values,
-                                              fastperiod=fast,
-                                              slowperiod=slow,
-                                              signalperiod=signal)
+    macd, macd_signal, macd_hist = get_backend().MACD(df[column].values,
+                                                      fastperiod=fast,
+                                                      slowperiod=slow,
+                                                      signalperiod=signal)
     df['MACD'] = macd
     df['MACD_signal'] = macd_signal
     df['MACD_hist'] = macd_hist
@@ -50,16 +87,144 @@ def add_macd(df, fast=12, slow=26, signal=9, column='Price'):
 # ---------- Bollinger Bands ----------
 def add_bollinger_bands(df, window=20, num_std=2, column='Price'):
     """
-    Add Bollinger Bands using TA-Lib.
+    Add Bollinger Bands using the active backend (TA-Lib by default).
     Returns upper, middle, lower bands.
     """
-    upper, middle, lower = talib.BBANDS(df[column].values,
-                                        timeperiod=window,
-                                        nbdevup=num_std,
-                                        nbdevdn=num_std,
-                                        matype=0)  # simple MA
+    upper, middle, lower = get_backend().BBANDS(df[column].values,
+                                                timeperiod=window,
+                                                nbdevup=num_std,
+                                                nbdevdn=num_std,
+                                                matype=0)  # simple MA
 
     df['BB_Upper'] = upper
     df['BB_Middle'] = middle
     df['BB_Lower'] = lower
     return df
+
+
+# ---------- Batch indicator engine ----------
+# name -> (default params, output columns for params, function(backend, values, params) returning
+# one array per output column).
+# Output names match the add_* functions above.
+INDICATORS = {
+    'sma': ({'window': 20},
+            lambda p: [f"SMA_{p['window']}"],
+            lambda ta, x, p: [ta.SMA(x, timeperiod=p['window'])]),
+    'ema': ({'window': 20},
+            lambda p: [f"EMA_{p['window']}"],
+            lambda ta, x, p: [ta.EMA(x, timeperiod=p['window'])]),
+    'rsi': ({'window': 14},
+            lambda p: [f"RSI_{p['window']}"],
+            lambda ta, x, p: [ta.RSI(x, timeperiod=p['window'])]),
+    'macd': ({'fast': 12, 'slow': 26, 'signal': 9},
+             lambda p: ['MACD', 'MACD_signal', 'MACD_hist'],
+             lambda ta, x, p: ta.MACD(x, fastperiod=p['fast'], slowperiod=p['slow'], signalperiod=p['signal'])),
+    'bbands': ({'window': 20, 'num_std': 2},
+               lambda p: ['BB_Upper', 'BB_Middle', 'BB_Lower'],
+               lambda ta, x, p: ta.BBANDS(x, timeperiod=p['window'], nbdevup=p['num_std'],
+                                          nbdevdn=p['num_std'], matype=0)),
+}
+
+
+def resolve_indicator_specs(specs):
+    """
+    Normalize an indicator spec list and name its output columns.
+
+    Parameters:
+    - specs: list of indicator names or (name, params) pairs,
+      e.g. ['rsi', ('sma', {'window': 50}), ('macd', {'fast': 8})]
+
+    Returns:
+    - list of (name, params, columns) with default params filled in
+    """
+    resolved, seen = [], set()
+    for spec in specs:
+        name, params = (spec, {}) if isinstance(spec, str) else spec
+        name = name.lower()
+        if name not in INDICATORS:
+            raise ValueError(f"Unknown indicator {name!r}; expected one of {sorted(INDICATORS)}")
+        defaults, columns_for, _ = INDICATORS[name]
+        unknown = set(params or {}) - set(defaults)
+        if unknown:
+            raise ValueError(f"Unknown parameters for {name}: {sorted(unknown)}")
+        params = {**defaults, **(params or {})}
+        columns = columns_for(params)
+        duplicates = seen.intersection(columns)
+        if duplicates:
+            raise ValueError(f"Indicator specs produce duplicate columns: {sorted(duplicates)}")
+        seen.update(columns)
+        resolved.append((name, params, columns))
+    return resolved
+
+
+def _fill_indicators(values, resolved, out, backend):
+    # out: (n_columns, len(values)) so every output is written to a contiguous row
+    values = np.ascontiguousarray(values, dtype=np.float64)
+    position = 0
+    for name, params, _ in resolved:
+        for output in INDICATORS[name][2](backend, values, params):
+            out[position] = output
+            position += 1
+
+
+def compute_indicators(values, specs, backend=None):
+    """
+    Run every indicator of a spec list over one price series.
+
+    Parameters:
+    - values: 1-D price array
+    - specs: indicator specs (see resolve_indicator_specs)
+    - backend: 'talib' or 'numpy' (default: the active backend)
+
+    Returns:
+    - (columns, block): output column names and a float64 array (len(values), n_columns)
+    """
+    resolved = resolve_indicator_specs(specs)
+    columns = [col for _, _, cols in resolved for col in cols]
+    out = np.empty((len(columns), len(values)), dtype=np.float64)
+    _fill_indicators(values, resolved, out, get_backend(backend))
+    return columns, out.T
+
+
+def compute_indicator_panel(prices, specs, column='Price', n_jobs=None, backend=None):
+    """
+    Compute many indicators for many symbols in one pass.
+    All results go into a single preallocated float64 array; each symbol fills its own
+    block of it (a view) on a thread pool, since TA-Lib and NumPy release the GIL, and the
+    DataFrame is built on that array without another copy.
+
+    Parameters:
+    - prices: dict {symbol: df} (e.g. load_stocks()) or a PriceStore
+    - specs: indicator specs, e.g. [('sma', {'window': 20}), ('sma', {'window': 50}), 'rsi', 'macd']
+    - column: price column to compute on ('Price' = Adj Close if available, else Close, for a PriceStore)
+    - n_jobs: worker threads (default: all CPUs)
+    - backend: 'talib' or 'numpy' (default: the active backend)
+
+    Returns:
+    - df: DataFrame indexed by (symbol, Date) with one column per indicator output
+    """
+    resolved = resolve_indicator_specs(specs)
+    ta = get_backend(backend)
+    columns = [col for _, _, cols in resolved for col in cols]
+    series = list(iter_price_series(prices, column))
+
+    lengths = np.array([len(values) for _, _, values in series], dtype=np.int64)
+    offsets = np.concatenate([[0], np.cumsum(lengths)])
+    block = np.empty((len(columns), offsets[-1]), dtype=np.float64)
+
+    def fill(i):
+        _fill_indicators(series[i][2], resolved, block[:, offsets[i]:offsets[i + 1]], ta)
+
+    workers = os.cpu_count() if n_jobs in (None, -1) else n_jobs
+    if workers == 1 or len(series) < 2:
+        for i in range(len(series)):
+            fill(i)
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(fill, range(len(series))))
+
+    symbols = np.repeat(np.array([symbol for symbol, _, _ in series], dtype=object), lengths)
+    dates = (np.concatenate([np.asarray(d, dtype='datetime64[ns]') for _, d, _ in series])
+             if series else np.array([], dtype='datetime64[ns]'))
+    index = pd.MultiIndex.from_arrays([symbols, pd.DatetimeIndex(dates)], names=['symbol', 'Date'])
+    return pd.DataFrame(block.T, index=index, columns=columns, copy=False)
@@ -0,0 +1,198 @@
+# modules/stock/numpy_indicators.py
+
+import numpy as np
+
+# Pure-NumPy versions of the TA-Lib functions used by indicators.py, with the same
+# names, arguments, warm-up NaNs and seeding rules, so the module can stand in for
+# `talib` where the C library is not installed.
+
+# TA-Lib treats values below 1e-14 in magnitude as zero (TA_IS_ZERO / TA_IS_ZERO_OR_NEG)
+TA_EPSILON = 1e-14
+
+# Blocks of the closed-form exponential filter are cut so decay ** -length stays below this
+_MAX_GROWTH = 1e100
+
+
+# ---------- Helpers ----------
+def _prepare(real):
+    """
+    Float64 copy of the input and the index of its first non-NaN value.
+    Like TA-Lib, leading NaNs are skipped and NaNs after that poison every later output.
+    """
+    x = np.array(real, dtype=np.float64, ndmin=1)
+    if x.ndim != 1:
+        raise ValueError("input must be a 1-D array")
+    valid = ~np.isnan(x)
+    begin = int(np.argmax(valid)) if valid.any() else len(x)
+    return x, begin
+
+
+def _check_periods(**periods):
+    # TA-Lib rejects periods below 2 (TA_BAD_PARAM)
+    for name, value in periods.items():
+        if int(value) != value or value < 2:
+            raise ValueError(f"{name} must be an integer >= 2, got {value!r}")
+
+
+def _poison_after_nan(x, out, begin):
+    # TA-Lib keeps running sums, so one missing value turns every later output into NaN
+    missing = np.isnan(x[begin:])
+    if missing.any():
+        first = begin + int(np.argmax(missing))
+        for values in out:
+            values[first:] = np.nan
+    return out
+
+
+def _window_sums(x, window):
+    """
+    Trailing-window sums; entry i covers x[i - window + 1 : i + 1] (valid from window - 1 on).
+    Running prefix and suffix sums inside blocks of `window` values keep round-off
+    bounded by the window instead of growing with the series.
+    """
+    length = len(x)
+    padded = -(-length // window) * window
+    blocks = np.zeros(padded)
+    blocks[:length] = x
+    blocks = blocks.reshape(-1, window)
+    prefix = np.cumsum(blocks, axis=1).ravel()
+    suffix = np.cumsum(blocks[:, ::-1], axis=1)[:, ::-1].ravel()
+
+    end = np.arange(length)
+    begin = end - window + 1
+    spans = (begin >= 0) & (begin // window != end // window)
+    sums = prefix[:length].copy()
+    sums[spans] += suffix[begin[spans]]
+    return sums
+
+
+def exponential_filter(x, alpha, previous):
+    """
+    y[t] = y[t-1] + alpha * (x[t] - y[t-1]) with y[-1] = previous, without a Python loop per value.
+    Within a block y[t] = decay**(t+1) * (previous + alpha * cumsum(x[j] * decay**-(j+1))),
+    with blocks short enough that decay**-(j+1) cannot overflow.
+
+    Parameters:
+    - x: 1-D float64 array
+    - alpha: smoothing factor in (0, 1]
+    - previous: value before x[0]
+
+    Returns:
+    - np.ndarray: filtered values, same length as x
+    """
+    x = np.asarray(x, dtype=np.float64)
+    decay = 1.0 - alpha
+    if decay <= 0.0:
+        return x.copy()
+    block = max(1, int(np.log(_MAX_GROWTH) / -np.log(decay)))
+    powers = decay ** np.arange(1, min(block, len(x)) + 1)
+
+    out = np.empty_like(x)
+    for start in range(0, len(x), block):
+        chunk = x[start:start + block]
+        grow = powers[:len(chunk)]
+        out[start:start + len(chunk)] = grow * (previous + alpha * np.cumsum(chunk / grow))
+        previous = out[start + len(chunk) - 1]
+    return out
+
+
+def _ema_from(x, period, start, k):
+    """EMA of x[start:], seeded with the mean of its first `period` values (TA-Lib's default seeding)."""
+    out = np.full(len(x), np.nan)
+    seed_end = start + period
+    if seed_end > len(x):
+        return out
+    seed = x[start:seed_end].mean()
+    out[seed_end - 1] = seed
+    out[seed_end:] = exponential_filter(x[seed_end:], k, seed)
+    return out
+
+
+# ---------- Indicators (TA-Lib compatible) ----------
+def SMA(real, timeperiod=30):
+    """Simple moving average; the first timeperiod - 1 values are NaN."""
+    _check_periods(timeperiod=timeperiod)
+    x, begin = _prepare(real)
+    out = np.full(len(x), np.nan)
+    if len(x) - begin >= timeperiod:
+        out[begin + timeperiod - 1:] = _window_sums(x[begin:], timeperiod)[timeperiod - 1:] / timeperiod
+    return _poison_after_nan(x, [out], begin)[0]
+
+
+def EMA(real, timeperiod=30):
+    """Exponential moving average with k = 2 / (timeperiod + 1), seeded with the SMA of the first window."""
+    _check_periods(timeperiod=timeperiod)
+    x, begin = _prepare(real)
+    out = _ema_from(x, timeperiod, begin, 2.0 / (timeperiod + 1))
+    return _poison_after_nan(x, [out], begin)[0]
+
+
+def RSI(real, timeperiod=14):
+    """
+    Relative Strength Index with Wilder smoothing: average gain/loss start as the mean of
+    the first timeperiod changes and are then updated with alpha = 1 / timeperiod.
+    """
+    _check_periods(timeperiod=timeperiod)
+    x, begin = _prepare(real)
+    out = np.full(len(x), np.nan)
+    if len(x) - begin > timeperiod:
+        change = np.diff(x[begin:])
+        gain, loss = np.clip(change, 0.0, None), np.clip(-change, 0.0, None)
+        seeds = gain[:timeperiod].mean(), loss[:timeperiod].mean()
+        alpha = 1.0 / timeperiod
+        avg_gain = np.r_[seeds[0], exponential_filter(gain[timeperiod:], alpha, seeds[0])]
+        avg_loss = np.r_[seeds[1], exponential_filter(loss[timeperiod:], alpha, seeds[1])]
+        total = avg_gain + avg_loss
+        with np.errstate(invalid='ignore', divide='ignore'):
+            rsi = np.where(np.abs(total) < TA_EPSILON, 0.0, 100.0 * (avg_gain / total))
+        rsi[np.isnan(total)] = np.nan
+        out[begin + timeperiod:] = rsi
+    return _poison_after_nan(x, [out], begin)[0]
+
+
+def MACD(real, fastperiod=12, slowperiod=26, signalperiod=9):
+    """
+    MACD line, signal line and histogram. As in TA-Lib, both EMAs start on the same bar
+    (the fast EMA is seeded with the fast-period mean ending at bar slowperiod - 1) and
+    every output is NaN until the signal line exists.
+    """
+    _check_periods(fastperiod=fastperiod, slowperiod=slowperiod, signalperiod=signalperiod)
+    if slowperiod < fastperiod:
+        fastperiod, slowperiod = slowperiod, fastperiod
+    x, begin = _prepare(real)
+    macd, signal = np.full(len(x), np.nan), np.full(len(x), np.nan)
+
+    first = begin + slowperiod - 1
+    if len(x) > first + signalperiod - 1:
+        fast = _ema_from(x, fastperiod, first - fastperiod + 1, 2.0 / (fastperiod + 1))
+        slow = _ema_from(x, slowperiod, begin, 2.0 / (slowperiod + 1))
+        macd = fast - slow
+        signal = _ema_from(macd, signalperiod, first, 2.0 / (signalperiod + 1))
+        macd[:first + signalperiod - 1] = np.nan
+    hist = macd - signal
+    return tuple(_poison_after_nan(x, [macd, signal, hist], begin))
+
+
+def BBANDS(real, timeperiod=5, nbdevup=2.0, nbdevdn=2.0, matype=0):
+    """
+    Bollinger Bands around a simple moving average (matype=0 only) using the
+    population standard deviation of the window; TA-Lib's near-zero variance rule applies.
+    """
+    if matype != 0:
+        raise ValueError("The NumPy indicator backend only supports matype=0 (simple moving average).")
+    _check_periods(timeperiod=timeperiod)
+    x, begin = _prepare(real)
+    upper, middle, lower = (np.full(len(x), np.nan) for _ in range(3))
+    if len(x) - begin >= timeperiod:
+        values = x[begin:]
+        # Shifting by the first value keeps the sum of squares well conditioned
+        shifted = values - values[0]
+        mean = _window_sums(shifted, timeperiod)[timeperiod - 1:] / timeperiod
+        variance = _window_sums(shifted * shifted, timeperiod)[timeperiod - 1:] / timeperiod - mean * mean
+        std = np.where(variance < TA_EPSILON, 0.0, np.sqrt(np.clip(variance, 0.0, None)))
+        std[np.isnan(variance)] = np.nan
+        ma = mean + values[0]
+        middle[begin + timeperiod - 1:] = ma
+        upper[begin + timeperiod - 1:] = ma + nbdevup * std
+        lower[begin + timeperiod - 1:] = ma - nbdevdn * std
+    return tuple(_poison_after_nan(x, [upper, middle, lower], begin))
@@ -0,0 +1,251 @@
+# modules/stock/optimizer.py
+
+import numpy as np
+import pandas as pd
+from scipy.linalg import cho_factor, cho_solve, eigvalsh
+
+# Daily returns are annualized with this many trading days
+TRADING_DAYS = 252
+
+
+# ---------- Inputs ----------
+def annualized_moments(returns_df, periods=TRADING_DAYS):
+    """
+    Annualized mean returns and covariance of a returns DataFrame.
+
+    Parameters:
+    - returns_df: DataFrame of periodic (daily) returns, one column per asset
+    - periods: periods per year
+
+    Returns:
+    - (mu, cov): Series of expected returns and covariance DataFrame
+    """
+    mu = returns_df.mean() * periods
+    cov = returns_df.cov() * periods
+    return mu, cov
+
+
+def portfolio_performance(weights, mu, cov, risk_free_rate=0.0):
+    """
+    Expected return, volatility and Sharpe ratio of one portfolio.
+
+    Returns:
+    - dict: 'expected_return', 'volatility', 'sharpe_ratio'
+    """
+    weights, mu, cov = np.asarray(weights, dtype=np.float64), np.asarray(mu), np.asarray(cov)
+    expected = float(weights @ mu)
+    volatility = float(np.sqrt(max(weights @ cov @ weights, 0.0)))
+    sharpe = (expected - risk_free_rate) / volatility if volatility > 0 else np.nan
+    return {'expected_return': expected, 'volatility': volatility, 'sharpe_ratio': sharpe}
+
+
+def project_simplex(points):
+    """
+    Euclidean projection of every column onto the probability simplex (w >= 0, sum(w) = 1).
+    """
+    n = points.shape[0]
+    ordered = -np.sort(-points, axis=0)
+    excess = np.cumsum(ordered, axis=0) - 1.0
+    ranks = np.arange(1, n + 1)[:, None]
+    # Number of positive entries: last rank where the sorted value exceeds the running threshold
+    count = np.count_nonzero(ordered * ranks > excess, axis=0)
+    threshold = excess[count - 1, np.arange(points.shape[1])] / count
+    return np.clip(points - threshold, 0.0, None)
+
+
+# ---------- Optimizer ----------
+class MeanVarianceOptimizer:
+    """
+    Markowitz optimizer for fully invested portfolios (weights sum to 1).
+
+    Frontier portfolios minimize 1/2 w'Cw - t mu'w for a range of risk tilts t >= 0
+    (t = 0 is the minimum-variance portfolio). The covariance is factorized once:
+    - long_only=False: one Cholesky factorization; every frontier point is a combination
+      of the two solves C^-1 1 and C^-1 mu, so the whole frontier is one matrix product.
+    - long_only=True: the top eigenvalue of C sets the step of an accelerated projected
+      gradient method that solves all frontier points together, one C @ W product per step.
+      The maximum Sharpe portfolio is a single non-negative solve of the same kind.
+
+    Usage:
+        opt = MeanVarianceOptimizer.from_returns(returns_df)
+        best = opt.max_sharpe(risk_free_rate=0.01)
+        weights, summary = opt.frontier(n_points=50)
+    """
+
+    def __init__(self, mu, cov, long_only=True, tol=1e-10, max_iter=50_000):
+        """
+        Parameters:
+        - mu: Series (or array) of annualized expected returns
+        - cov: DataFrame (or array) of the annualized covariance
+        - long_only: forbid short positions
+        - tol: convergence tolerance on the weights (long-only solver)
+        - max_iter: iteration cap of the long-only solver
+        """
+        self.assets = pd.Index(mu.index if isinstance(mu, pd.Series) else range(len(mu)), name='asset')
+        self.mu = np.asarray(mu, dtype=np.float64)
+        self.cov = np.asarray(cov, dtype=np.float64)
+        if self.cov.shape != (len(self.mu), len(self.mu)):
+            raise ValueError("cov must be a square matrix matching mu.")
+        if not (np.isfinite(self.mu).all() and np.isfinite(self.cov).all()):
+            raise ValueError("mu and cov must not contain NaN; drop or fill assets with missing returns first.")
+        self.cov = (self.cov + self.cov.T) / 2.0
+        self.long_only = long_only
+        self.tol = tol
+        self.max_iter = max_iter
+
+        if long_only:
+            self._step = 1.0 / max(eigvalsh(self.cov, subset_by_index=[len(self.mu) - 1] * 2)[0], 1e-300)
+        else:
+            try:
+                factor = cho_factor(self.cov)
+            except np.linalg.LinAlgError:
+                raise ValueError("Covariance matrix is not positive definite; use a shrinkage estimate.") from None
+            self._inv_ones, self._inv_mu = cho_solve(factor, np.column_stack([np.ones(len(self.mu)), self.mu])).T
+
+    @classmethod
+    def from_returns(cls, returns_df, periods=TRADING_DAYS, **kwargs):
+        """Optimizer for the annualized sample moments of a returns DataFrame."""
+        mu, cov = annualized_moments(returns_df, periods)
+        return cls(mu, cov, **kwargs)
+
+    # Solvers
+    def _accelerated(self, linear, project, start):
+        """
+        Minimize 1/2 w'Cw - linear'w column by column over a convex set given by `project`,
+        with FISTA steps (1 / largest eigenvalue of C) and per-column momentum restarts.
+        """
+        weights = project(np.array(start, dtype=np.float64))
+        search = weights.copy()
+        momentum = np.ones(weights.shape[1])
+        for _ in range(self.max_iter):
+            updated = project(search - self._step * (self.cov @ search - linear))
+            change = updated - weights
+            # Restart the momentum of columns that started moving backwards
+            restart = np.einsum('ij,ij->j', search - updated, change) > 0
+            momentum[restart] = 1.0
+            next_momentum = (1.0 + np.sqrt(1.0 + 4.0 * momentum ** 2)) / 2.0
+            search = updated + change * ((momentum - 1.0) / next_momentum)
+            weights, momentum = updated, next_momentum
+            if np.abs(change).max() <= self.tol * max(1.0, np.abs(weights).max()):
+                break
+        return weights
+
+    def _solve(self, tilts, start=None):
+        """
+        Weights (n_assets, len(tilts)) minimizing 1/2 w'Cw - t mu'w with sum(w) = 1 for every tilt t.
+        """
+        tilts = np.asarray(tilts, dtype=np.float64)
+        if not self.long_only:
+            ones, mu_part = self._inv_ones, self._inv_mu
+            a, b = ones.sum(), mu_part.sum()
+            # Stationary point with sum(w) = 1: w = C^-1 1 / a + t (C^-1 mu - (b / a) C^-1 1)
+            return (ones / a)[:, None] + np.outer(mu_part - (b / a) * ones, tilts)
+
+        n = len(self.mu)
+        start = np.full((n, len(tilts)), 1.0 / n) if start is None else start
+        return self._accelerated(self.mu[:, None] * tilts[None, :], project_simplex, start)
+
+    def _max_tilt(self):
+        """Smallest tilt at which the long-only frontier ends in the single highest-return asset."""
+        best = int(np.argmax(self.mu))
+        gap = self.mu[best] - self.mu
+        lower = gap > 0
+        if not lower.any():
+            return 0.0
+        return float(np.max((self.cov[best, best] - self.cov[best, lower]) / gap[lower], initial=0.0))
+
+    def _series(self, weights):
+        return pd.Series(weights, index=self.assets, name='weight')
+
+    # Portfolios
+    def performance(self, weights, risk_free_rate=0.0):
+        """See portfolio_performance."""
+        return portfolio_performance(weights, self.mu, self.cov, risk_free_rate)
+
+    def min_variance(self):
+        """
+        Minimum-variance portfolio.
+
+        Returns:
+        - weights: Series indexed by asset
+        """
+        return self._series(self._solve([0.0])[:, 0])
+
+    def max_sharpe(self, risk_free_rate=0.0):
+        """
+        Maximum Sharpe ratio (tangency) portfolio.
+        Long-only, it is the normalized solution of min 1/2 y'Cy - (mu - rf)'y over y >= 0,
+        a single projected solve.
+
+        Returns:
+        - weights: Series indexed by asset
+        """
+        excess = self.mu - risk_free_rate
+        if not self.long_only:
+            tangent = self._inv_mu - risk_free_rate * self._inv_ones
+            if tangent.sum() <= 0:
+                raise ValueError("No tangency portfolio: the risk-free rate is above the minimum-variance return.")
+            return self._series(tangent / tangent.sum())
+
+        if not (excess > 0).any():
+            raise ValueError("No asset has an expected return above the risk-free rate.")
+        start = np.clip(excess, 0.0, None)[:, None] * self._step
+        scaled = self._accelerated(excess[:, None], lambda y: np.clip(y, 0.0, None), start)[:, 0]
+        return self._series(scaled / scaled.sum())
+
+    def frontier(self, n_points=50, risk_free_rate=0.0):
+        """
+        Efficient frontier of n_points portfolios, from minimum variance to maximum return,
+        solved in one batch.
+
+        Returns:
+        - (weights, summary): DataFrame (point x asset) of weights and DataFrame with
+          'expected_return', 'volatility', 'sharpe_ratio' and the risk 'tilt' per point
+        """
+        if self.long_only:
+            # Returns rise fastest at small tilts: solve a grid dense there, then re-solve
+            # (warm-started) at the tilts interpolated for evenly spaced returns
+            coarse_tilts = self._max_tilt() * 1.01 * np.linspace(0.0, 1.0, n_points) ** 2
+            coarse = self._solve(coarse_tilts)
+            coarse_returns = np.maximum.accumulate(self.mu @ coarse)
+            targets = np.linspace(coarse_returns[0], coarse_returns[-1], n_points)
+            tilts = np.interp(targets, coarse_returns, coarse_tilts)
+            nearest = np.clip(np.searchsorted(coarse_tilts, tilts), 0, n_points - 1)
+            weights = self._solve(tilts, start=coarse[:, nearest])
+        else:
+            # Tilts that reach returns from the minimum-variance portfolio up to the best single asset
+            ones, mu_part = self._inv_ones, self._inv_mu
+            a, b, c = ones.sum(), mu_part.sum(), self.mu @ mu_part
+            spread = c - b * b / a
+            top = max(self.mu.max() - b / a, 0.0)
+            tilts = np.linspace(0.0, top / spread if spread > 0 else 0.0, n_points)
+            weights = self._solve(tilts)
+
+        expected = self.mu @ weights
+        volatility = np.sqrt(np.clip(np.einsum('ij,ij->j', weights, self.cov @ weights), 0.0, None))
+        with np.errstate(invalid='ignore', divide='ignore'):
+            sharpe = (expected - risk_free_rate) / volatility
+        index = pd.RangeIndex(n_points, name='point')
+        summary = pd.DataFrame({'expected_return': expected, 'volatility': volatility,
+                                'sharpe_ratio': sharpe, 'tilt': tilts}, index=index)
+        return pd.DataFrame(weights.T, index=index, columns=self.assets), summary
+
+
+# ---------- Result ----------
+class OptimizedPortfolio:
+    """
+    Maximum Sharpe portfolio of a returns DataFrame with its performance, plus the
+    minimum-variance portfolio; optimizer.frontier() gives the efficient frontier.
+    """
+
+    def __init__(self, returns_df, risk_free_rate=0.0, long_only=True, periods=TRADING_DAYS):
+        self.optimizer = MeanVarianceOptimizer.from_returns(returns_df, periods=periods, long_only=long_only)
+        self.risk_free_rate = risk_free_rate
+        self.weights = self.optimizer.max_sharpe(risk_free_rate)
+        self.performance = self.optimizer.performance(self.weights, risk_free_rate)
+        self.min_variance_weights = self.optimizer.min_variance()
+        self.min_variance_performance = self.optimizer.performance(self.min_variance_weights, risk_free_rate)
+
+    def frontier(self, n_points=50):
+        """See MeanVarianceOptimizer.frontier."""
+        return self.optimizer.frontier(n_points, self.risk_free_rate)
@@ -1,16 +1,17 @@
 # modules/stock/plotting.py
 
-import matplotlib.pyplot as plt
 import seaborn as sns
 import pandas as pd
 import numpy as np
 
+from ..rendering import new_figure, finish_figure
+
 # Modern seaborn theme
 sns.set_theme(style="darkgrid")
 
 
 # ---------- Price + SMA/EMA ----------
-def plot_price_with_ma(df, price_col='Price', ma_cols=None, figsize=(12,6), title=None):
+def plot_price_with_ma(df, price_col='Price', ma_cols=None, figsize=(12,6), title=None, output=None):
     """
     Plot stock price with moving averages (SMA/EMA)
     
@@ -20,70 +21,74 @@ def plot_price_with_ma(df, price_col='Price', ma_cols=None, figsize=(12,6), titl
     - ma_cols: list of columns for moving averages
     - figsize: figure size
     - title: plot title
+    - output: None (show, like plt.show()), 'figure', 'png'/'svg'/'pdf' bytes or a file path (see rendering.finish_figure)
     """
-    plt.figure(figsize=figsize)
-    plt.plot(df.index, df[price_col], label=price_col, linewidth=2, color='black')
+    fig, ax = new_figure(figsize)
+    ax.plot(df.index, df[price_col], label=price_col, linewidth=2, color='black')
     
     if ma_cols:
         for col in ma_cols:
-            plt.plot(df.index, df[col], label=col, linewidth=1.5)
+            ax.plot(df.index, df[col], label=col, linewidth=1.5)
     
-    plt.title(title or f"{price_col} with Moving Averages")
-    plt.xlabel("Date")
-    plt.ylabel("Price")
-    plt.legend()
-    plt.show()
+    ax.set_title(title or f"{price_col} with Moving Averages")
+    ax.set_xlabel("Date")
+    ax.set_ylabel("Price")
+    ax.legend()
+    return finish_figure(fig, output)
 
 
 # ---------- RSI ----------
-def plot_rsi(df, rsi_col='RSI_14', overbought=70, oversold=30, figsize=(12,4), title=None):
+def plot_rsi(df, rsi_col='RSI_14', overbought=70, oversold=30, figsize=(12,4), title=None, output=None):
     """
     Plot RSI with overbought and oversold levels
+    output: see plot_price_with_ma
     """
-    plt.figure(figsize=figsize)
-    plt.plot(df.index, df[rsi_col], label=rsi_col, color='blue', linewidth=1.5)
-    plt.axhline(overbought, color='red', linestyle='--', label='Overbought (70)')
-    plt.axhline(oversold, color='green', linestyle='--', label='Oversold (30)')
-    plt.title(title or f"RSI ({rsi_col})")
-    plt.xlabel("Date")
-    plt.ylabel("RSI")
-    plt.legend()
-    plt.show()
+    fig, ax = new_figure(figsize)
+    ax.plot(df.index, df[rsi_col], label=rsi_col, color='blue', linewidth=1.5)
+    ax.axhline(overbought, color='red', linestyle='--', label='Overbought (70)')
+    ax.axhline(oversold, color='green', linestyle='--', label='Oversold (30)')
+    ax.set_title(title or f"RSI ({rsi_col})")
+    ax.set_xlabel("Date")
+    ax.set_ylabel("RSI")
+    ax.legend()
+    return finish_figure(fig, output)
 
 
 # ---------- MACD ----------
-def plot_macd(df, macd_col='MACD', signal_col='MACD_signal', hist_col='MACD_hist', figsize=(12,5), title=None):
+def plot_macd(df, macd_col='MACD', signal_col='MACD_signal', hist_col='MACD_hist', figsize=(12,5), title=None, output=None):
     """
     Plot MACD line, signal line, and histogram
+    output: see plot_price_with_ma
     """
-    plt.figure(figsize=figsize)
-    plt.plot(df.index, df[macd_col], label='MACD', color='blue')
-    plt.plot(df.index, df[signal_col], label='Signal', color='red')
-    plt.bar(df.index, df[hist_col], label='Histogram', color='gray', alpha=0.5)
-    plt.title(title or "MACD")
-    plt.xlabel("Date")
-    plt.ylabel("Value")
-    plt.legend()
-    plt.show()
+    fig, ax = new_figure(figsize)
+    ax.plot(df.index, df[macd_col], label='MACD', color='blue')
+    ax.plot(df.index, df[signal_col], label='Signal', color='red')
+    ax.bar(df.index, df[hist_col], label='Histogram', color='gray', alpha=0.5)
+    ax.set_title(title or "MACD")
+    ax.set_xlabel("Date")
+    ax.set_ylabel("Value")
+    ax.legend()
+    return finish_figure(fig, output)
 
 
 # ---------- Bollinger Bands ----------
 def plot_bollinger_bands(df, price_col='Price', upper_col='BB_Upper', middle_col='BB_Middle', lower_col='BB_Lower',
-                         figsize=(12,6), title=None):
+                         figsize=(12,6), title=None, output=None):
     """
     Plot Price with Bollinger Bands
+    output: see plot_price_with_ma
     """
-    plt.figure(figsize=figsize)
-    plt.plot(df.index, df[price_col], label=price_col, color='black')
-    plt.plot(df.index, df[upper_col], label='Upper Band', color='red', linestyle='--')
-    plt.plot(df.index, df[middle_col], label='Middle Band', color='blue', linestyle='--')
-    plt.plot(df.index, df[lower_col], label='Lower Band', color='green', linestyle='--')
+    fig, ax = new_figure(figsize)
+    ax.plot(df.index, df[price_col], label=price_col, color='black')
+    ax.plot(df.index, df[upper_col], label='Upper Band', color='red', linestyle='--')
+    ax.plot(df.index, df[middle_col], label='Middle Band', color='blue', linestyle='--')
+    ax.plot(df.index, df[lower_col], label='Lower Band', color='green', linestyle='--')
     
-    plt.fill_between(df.index, df[lower_col], df[upper_col], color='gray', alpha=0.1)
+    ax.fill_between(df.index, df[lower_col], df[upper_col], color='gray', alpha=0.1)
     
-    plt.title(title or f"{price_col} with Bollinger Bands")
-    plt.xlabel("Date")
-    plt.ylabel("Price")
-    plt.legend()
-    plt.show()
+    ax.set_title(title or f"{price_col} with Bollinger Bands")
+    ax.set_xlabel("Date")
+    ax.set_ylabel("Price")
+    ax.legend()
+    return finish_figure(fig, output)
 
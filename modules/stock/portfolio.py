@@ -2,44 +2,46 @@
 
 import pandas as pd
 import numpy as np
-from pynance.pf import PortfolioCalculations
+
+from .optimizer import OptimizedPortfolio
 
 # ---------- Prepare stock data for portfolio ----------
-def prepare_portfolio_data(df_dict, price_col='Price'):
+def prepare_portfolio_data(df_dict, price_col='Price', dropna=True):
     """
     Combine multiple stock DataFrames into a single DataFrame of returns.
     
     Parameters:
     - df_dict: dictionary of {symbol: df} where df contains Price column
     - price_col: column used for returns calculation
+    - dropna: drop every date where any stock has no return (default). Set False to keep
+      all dates with NaN for missing returns, for the pairwise estimators in covariance.py
     
     Returns:
     - returns_df: DataFrame where each column is daily returns of a stock
     """
-    price_data = pd.DataFrame()
-    
-    for symbol, df in df_dict.items():
-        # Use 'Adj Close' if available, otherwise 'Price'
-        col = 'Adj Close' if 'Adj Close' in df.columns else price_col
-        price_data[symbol] = df[col]
+    # Use 'Adj Close' if available, otherwise 'Price'; one concat aligns all dates at once
+    price_data = pd.concat(
+        {symbol: df['Adj Close' if 'Adj Close' in df.columns else price_col] for symbol, df in df_dict.items()},
+        axis=1,
+    ) if df_dict else pd.DataFrame()
     
-    # Calculate daily returns
-    returns_df = price_data.pct_change().dropna()
-    return returns_df
+    # Calculate daily returns without forward filling, so a gap never turns into a fake 0% return
+    returns = price_data.pct_change(fill_method=None)
+    return returns.dropna() if dropna else returns.dropna(how='all')
 
 
 # ---------- Optimize Portfolio ----------
-def optimize_portfolio(returns_df, risk_free_rate=0.0):
+def optimize_portfolio(returns_df, risk_free_rate=0.0, long_only=True):
     """
-    Create an optimized portfolio using Pynance.
+    Create a maximum Sharpe ratio portfolio (see optimizer.py).
     
     Parameters:
     - returns_df: DataFrame of daily returns
-    - risk_free_rate: risk-free rate for Sharpe ratio optimization
+    - risk_free_rate: annual risk-free rate for Sharpe ratio optimization
+    - long_only: forbid short positions
     
     Returns:
-    - portfolio: Pynance Portfolio object with optimization results
+    - portfolio: OptimizedPortfolio with .weights, .performance, the minimum-variance
+      portfolio and .frontier(n_points)
     """
-    portfolio = po.PortfolioCalculations(returns_df)
-    portfolio.optimal_portfolio(risk_free_rate=risk_free_rate)
-    return portfolio
+    return OptimizedPortfolio(returns_df, risk_free_rate=risk_free_rate, long_only=long_only)
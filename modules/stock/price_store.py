@@ -0,0 +1,338 @@
+# modules/stock/price_store.py
+
+import json
+import os
+import shutil
+
+import numpy as np
+import pandas as pd
+
+# Packed copy of the stock_data folder, written next to it as <folder>.npstore/
+STORE_SUFFIX = '.npstore'
+
+INDEX_FILE = 'index.json'
+DATES_FILE = 'Date.npy'
+STORE_VERSION = 1
+
+# Stores opened through open_price_store: {abs data path: (folder stamp, PriceStore)}
+_OPEN_STORES = {}
+
+
+# ---------- Locate stock files ----------
+def find_stock_file(symbol, data_path):
+    """
+    Find the CSV for a symbol, ignoring filename case (AAPL.csv, aapl.csv, ...).
+
+    Parameters:
+    - symbol: str, stock ticker
+    - data_path: path to stock_data folder
+
+    Returns:
+    - str: path of the CSV file
+    """
+    exact = os.path.join(data_path, f"{symbol}.csv")
+    if os.path.exists(exact):
+        return exact
+    wanted = f"{symbol}.csv".lower()
+    if os.path.isdir(data_path):
+        for name in sorted(os.listdir(data_path)):
+            if name.lower() == wanted:
+                return os.path.join(data_path, name)
+    raise FileNotFoundError(f"Stock file for {symbol} not found in {data_path}")
+
+
+def price_store_path(data_path):
+    """
+    Store location for a stock_data folder (data/stock_data -> data/stock_data.npstore/).
+    """
+    return os.path.normpath(data_path) + STORE_SUFFIX
+
+
+def _source_files(data_path):
+    return sorted(f for f in os.listdir(data_path) if f.lower().endswith('.csv'))
+
+
+def _source_stamps(data_path):
+    return {f: os.stat(os.path.join(data_path, f)).st_mtime_ns for f in _source_files(data_path)}
+
+
+def _column_file(column):
+    return column.replace(' ', '_') + '.npy'
+
+
+# ---------- Build store ----------
+def read_price_csv(file_path):
+    """
+    Parse one stock CSV into sorted UTC dates and its numeric columns.
+
+    Parameters:
+    - file_path: path to the CSV
+
+    Returns:
+    - df: DataFrame with a UTC 'Date' column followed by the numeric columns in file order
+    """
+    df = pd.read_csv(file_path)
+    dates = pd.to_datetime(df['Date'], utc=True)
+    values = df.drop(columns='Date').select_dtypes(include='number')
+    df = pd.concat([dates.rename('Date'), values], axis=1)
+    return df.sort_values('Date', kind='stable').reset_index(drop=True)
+
+
+def build_price_store(data_path, store_path=None):
+    """
+    Pack every stock CSV into one contiguous array per column plus an offset index per symbol.
+    The store is written to a temporary directory and swapped in when complete.
+
+    Parameters:
+    - data_path: path to stock_data folder
+    - store_path: output directory (default: next to data_path)
+
+    Returns:
+    - str: path of the written store
+    """
+    store_path = store_path or price_store_path(data_path)
+    stamps = _source_stamps(data_path)
+
+    frames, symbols, offset = [], {}, 0
+    for file_name in stamps:
+        df = read_price_csv(os.path.join(data_path, file_name))
+        symbol = os.path.splitext(file_name)[0].upper()
+        if symbol in symbols:
+            raise ValueError(f"Duplicate stock files for {symbol} in {data_path}")
+        columns = [c for c in df.columns if c != 'Date']
+        symbols[symbol] = {'file': file_name, 'start': offset, 'stop': offset + len(df), 'columns': columns}
+        frames.append(df)
+        offset += len(df)
+
+    # Column union keeps first-seen order; symbols lacking a column get NaN there
+    packed = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame({'Date': pd.Series(dtype='datetime64[ns, UTC]')})
+    columns = [c for c in packed.columns if c != 'Date']
+
+    tmp_path = store_path + '.tmp'
+    shutil.rmtree(tmp_path, ignore_errors=True)
+    os.makedirs(tmp_path)
+    dates = packed['Date'].dt.tz_convert(None).to_numpy(dtype='datetime64[ns]').view(np.int64)
+    np.save(os.path.join(tmp_path, DATES_FILE), dates)
+    for col in columns:
+        np.save(os.path.join(tmp_path, _column_file(col)), np.ascontiguousarray(packed[col].to_numpy()))
+
+    index = {
+        'version': STORE_VERSION,
+        'rows': offset,
+        'columns': {col: _column_file(col) for col in columns},
+        'symbols': symbols,
+        'sources': stamps,
+    }
+    with open(os.path.join(tmp_path, INDEX_FILE), 'w') as f:
+        json.dump(index, f, indent=1)
+
+    shutil.rmtree(store_path, ignore_errors=True)
+    os.replace(tmp_path, store_path)
+    return store_path
+
+
+def is_price_store_fresh(data_path, store_path=None):
+    """
+    True if the store exists and was built from exactly the CSVs currently in data_path
+    (same file names and modification times).
+    """
+    store_path = store_path or price_store_path(data_path)
+    index_file = os.path.join(store_path, INDEX_FILE)
+    if not os.path.exists(index_file):
+        return False
+    with open(index_file) as f:
+        index = json.load(f)
+    if index.get('version') != STORE_VERSION:
+        return False
+    if not os.path.isdir(data_path):
+        return True
+    return index['sources'] == _source_stamps(data_path)
+
+
+# ---------- Memory-mapped store ----------
+class PriceStore:
+    """
+    Read-only view of a packed price store. Column arrays are memory-mapped,
+    so opening the store and slicing a symbol copy no data.
+
+    Usage:
+        store = PriceStore.open(DATA_PATH)
+        dates, close = store.dates('AAPL'), store.array('AAPL', 'Close')
+        df = store.frame('AAPL')
+    """
+
+    def __init__(self, store_path):
+        with open(os.path.join(store_path, INDEX_FILE)) as f:
+            index = json.load(f)
+        self.store_path = store_path
+        self._symbols = index['symbols']
+        self._column_files = index['columns']
+        self._dates = np.load(os.path.join(store_path, DATES_FILE), mmap_mode='r')
+        self._arrays = {}
+
+    @classmethod
+    def open(cls, data_path, rebuild=True):
+        """
+        Open the store for a stock_data folder, (re)building it first if it is missing or stale.
+
+        Parameters:
+        - data_path: path to stock_data folder
+        - rebuild: set False to raise instead of rebuilding a stale store
+        """
+        store_path = price_store_path(data_path)
+        if not is_price_store_fresh(data_path, store_path):
+            if not rebuild:
+                raise FileNotFoundError(f"Price store {store_path} is missing or out of date")
+            build_price_store(data_path, store_path)
+        return cls(store_path)
+
+    @property
+    def symbols(self):
+        """Symbols in the store (upper case, sorted)."""
+        return sorted(self._symbols)
+
+    @property
+    def columns(self):
+        """All price columns in the store."""
+        return list(self._column_files)
+
+    def _entry(self, symbol):
+        try:
+            return self._symbols[str(symbol).upper()]
+        except KeyError:
+            raise KeyError(f"Symbol {symbol} not found in price store {self.store_path}") from None
+
+    def _column(self, column):
+        if column not in self._arrays:
+            if column not in self._column_files:
+                raise KeyError(f"Column {column} not found in price store {self.store_path}")
+            path = os.path.join(self.store_path, self._column_files[column])
+            self._arrays[column] = np.load(path, mmap_mode='r')
+        return self._arrays[column]
+
+    def symbol_columns(self, symbol):
+        """Columns present in the symbol's source CSV, in file order."""
+        return list(self._entry(symbol)['columns'])
+
+    def dates(self, symbol):
+        """Zero-copy datetime64[ns] (UTC, naive) view of the symbol's dates, sorted ascending."""
+        entry = self._entry(symbol)
+        return self._dates[entry['start']:entry['stop']].view('datetime64[ns]')
+
+    def array(self, symbol, column):
+        """Zero-copy read-only view of one column for a symbol."""
+        entry = self._entry(symbol)
+        return self._column(column)[entry['start']:entry['stop']]
+
+    def arrays(self, symbol, columns=None):
+        """
+        Zero-copy views of several columns for a symbol.
+
+        Returns:
+        - dict: {column: np.ndarray}
+        """
+        columns = self.symbol_columns(symbol) if columns is None else columns
+        return {col: self.array(symbol, col) for col in columns}
+
+    def frame(self, symbol, columns=None):
+        """
+        Writable DataFrame for a symbol with a naive 'Date' index, like load_stock without 'Price'.
+
+        Parameters:
+        - symbol: str, stock ticker (case-insensitive)
+        - columns: list of columns (default: the columns of the source CSV)
+
+        Returns:
+        - df: pandas DataFrame
+        """
+        data = {col: np.array(values) for col, values in self.arrays(symbol, columns).items()}
+        index = pd.DatetimeIndex(np.array(self.dates(symbol)), name='Date')
+        return pd.DataFrame(data, index=index)
+
+    def frames(self, symbols=None, columns=None):
+        """
+        DataFrames for many symbols at once.
+
+        Returns:
+        - dict: {symbol: df}
+        """
+        symbols = self.symbols if symbols is None else [str(s).upper() for s in symbols]
+        return {symbol: self.frame(symbol, columns) for symbol in symbols}
+
+    def panel(self, column='Close', symbols=None):
+        """
+        Wide DataFrame of one column: dates as rows, symbols as columns (outer-joined on date).
+        """
+        symbols = self.symbols if symbols is None else [str(s).upper() for s in symbols]
+        series = {
+            symbol: pd.Series(np.array(self.array(symbol, column)),
+                              index=pd.DatetimeIndex(np.array(self.dates(symbol)), name='Date'))
+            for symbol in symbols
+        }
+        return pd.DataFrame(series)
+
+    def __contains__(self, symbol):
+        return str(symbol).upper() in self._symbols
+
+    def __len__(self):
+        return len(self._symbols)
+
+
+def _folder_stamp(data_path, store_path):
+    # Adding, removing or replacing a CSV changes the folder's mtime; a rebuild (here or in
+    # another process) rewrites the index
+    stamps = []
+    for path in (data_path, os.path.join(store_path, INDEX_FILE)):
+        try:
+            stamps.append(os.stat(path).st_mtime_ns)
+        except FileNotFoundError:
+            stamps.append(None)
+    return tuple(stamps)
+
+
+def open_price_store(data_path, refresh=False):
+    """
+    PriceStore.open, cached per stock_data folder for repeated per-symbol loads.
+    The cached store is reused while the folder and the store index keep their modification
+    times (two stats), instead of re-checking every CSV and reloading the index on each call.
+
+    Parameters:
+    - data_path: path to stock_data folder
+    - refresh: re-check every CSV (e.g. after editing a file in place, which leaves the
+      folder's mtime unchanged) and reopen the store
+
+    Returns:
+    - PriceStore
+    """
+    key = os.path.abspath(data_path)
+    store_path = price_store_path(data_path)
+    cached = _OPEN_STORES.get(key)
+    if cached is not None and not refresh and cached[0] == _folder_stamp(data_path, store_path):
+        return cached[1]
+    store = PriceStore.open(data_path)
+    _OPEN_STORES[key] = (_folder_stamp(data_path, store_path), store)
+    return store
+
+
+# ---------- Symbol panels ----------
+def iter_price_series(prices, column='Price'):
+    """
+    Iterate over one column of every symbol in a panel.
+
+    Parameters:
+    - prices: dict {symbol: df} (e.g. load_stocks()) or a PriceStore
+    - column: column name; for a PriceStore 'Price' means Adj Close if present, else Close
+      (as in load_stock)
+
+    Yields:
+    - (symbol, dates, values): dates as datetime64[ns], values as an array (zero-copy for a store)
+    """
+    if isinstance(prices, PriceStore):
+        for symbol in prices.symbols:
+            source = column
+            if column == 'Price':
+                source = 'Adj Close' if 'Adj Close' in prices.symbol_columns(symbol) else 'Close'
+            yield symbol, prices.dates(symbol), prices.array(symbol, source)
+    else:
+        for symbol, df in prices.items():
+            yield symbol, df.index.to_numpy(), df[column].to_numpy()
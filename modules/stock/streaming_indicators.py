@@ -0,0 +1,402 @@
+# modules/stock/streaming_indicators.py
+
+import copy
+import math
+from collections import deque
+
+import numpy as np
+
+from .indicators import resolve_indicator_specs
+from .numpy_indicators import TA_EPSILON
+
+# Incremental versions of the indicators in indicators.py. Each state object keeps only
+# what the next bar needs (a window ring buffer, running sums, EMA / Wilder averages)
+# and repeats TA-Lib's arithmetic step by step, so feeding a price history bar by bar
+# gives exactly the values of a full recompute with the TA-Lib backend.
+
+NAN = float('nan')
+
+
+# ---------- Base class ----------
+class IndicatorState:
+    """
+    Base class for streaming indicators.
+
+    Usage:
+        rsi = RSIState(window=14)
+        rsi.update_many(history)          # warm up on past closes
+        value = rsi.update(new_close)     # O(1) per new bar
+        saved = rsi.snapshot()
+        rsi = restore_state(saved)
+    """
+
+    name = None
+    defaults = {}
+
+    def __init__(self, **params):
+        unknown = set(params) - set(self.defaults)
+        if unknown:
+            raise ValueError(f"Unknown parameters for {self.name}: {sorted(unknown)}")
+        self.params = {**self.defaults, **params}
+        for key, value in self.params.items():
+            if key != 'num_std' and (int(value) != value or value < 2):
+                raise ValueError(f"{key} must be an integer >= 2, got {value!r}")
+        # Output column names, the same as the add_* functions
+        self.columns = resolve_indicator_specs([(self.name, self.params)])[0][2]
+        self.started = False
+        self.value = self._empty()
+
+    def _empty(self):
+        return NAN if len(self.columns) == 1 else (NAN,) * len(self.columns)
+
+    def update(self, price):
+        """
+        Add one bar and return the indicator value for it (NaN during warm-up).
+        Leading NaN prices are skipped; a NaN after the first price makes every
+        later value NaN, as in TA-Lib.
+        """
+        price = float(price)
+        if not self.started:
+            if math.isnan(price):
+                return self._empty()
+            self.started = True
+        self.value = self._step(price)
+        return self.value
+
+    def update_many(self, prices):
+        """
+        Add a batch of bars in order.
+
+        Returns:
+        - np.ndarray: one value per bar, shape (n,) or (n, n_outputs)
+        """
+        values = [self.update(price) for price in np.asarray(prices, dtype=np.float64)]
+        width = len(self.columns)
+        return np.array(values, dtype=np.float64).reshape(-1, width) if width > 1 else np.array(values, dtype=np.float64)
+
+    def _step(self, price):
+        raise NotImplementedError
+
+    # Snapshots are plain dicts of numbers and lists, so they can be stored as JSON
+    def _state(self):
+        return {}
+
+    def _load(self, state):
+        pass
+
+    def snapshot(self):
+        """
+        Copy of the full state.
+
+        Returns:
+        - dict: {'indicator', 'params', 'started', 'value', 'state'}
+        """
+        value = list(self.value) if isinstance(self.value, tuple) else self.value
+        return copy.deepcopy({'indicator': self.name, 'params': self.params, 'started': self.started,
+                              'value': value, 'state': self._state()})
+
+    @classmethod
+    def restore(cls, snapshot):
+        """Rebuild a state object from snapshot()."""
+        if snapshot['indicator'] != cls.name:
+            raise ValueError(f"Snapshot of {snapshot['indicator']!r} cannot restore a {cls.name!r} state")
+        obj = cls(**snapshot['params'])
+        obj.started = snapshot['started']
+        value = snapshot['value']
+        obj.value = tuple(value) if isinstance(value, list) else value
+        obj._load(copy.deepcopy(snapshot['state']))
+        return obj
+
+
+# ---------- Window ring buffer (SMA) ----------
+class SMAState(IndicatorState):
+    """
+    Simple moving average from a ring buffer of the last `window` prices and a running sum.
+    """
+
+    name = 'sma'
+    defaults = {'window': 20}
+
+    def __init__(self, **params):
+        super().__init__(**params)
+        self._buffer = deque(maxlen=self.params['window'])
+        self._total = 0.0
+
+    def _step(self, price):
+        window = self.params['window']
+        self._buffer.append(price)
+        self._total += price
+        if len(self._buffer) < window:
+            return NAN
+        value = self._total / window
+        # Drop the oldest price now, as TA-Lib does right after each output
+        self._total -= self._buffer[0]
+        return value
+
+    def _state(self):
+        return {'buffer': list(self._buffer), 'total': self._total}
+
+    def _load(self, state):
+        self._buffer.extend(state['buffer'])
+        self._total = state['total']
+
+
+# ---------- Exponential moving average ----------
+class EMAState(IndicatorState):
+    """
+    EMA with k = 2 / (window + 1), seeded with the mean of the first `window` prices.
+    """
+
+    name = 'ema'
+    defaults = {'window': 20}
+
+    def __init__(self, **params):
+        super().__init__(**params)
+        self._k = 2.0 / (self.params['window'] + 1)
+        self._count = 0
+        self._seed_total = 0.0
+        self._ema = NAN
+
+    def _step(self, price):
+        window = self.params['window']
+        if self._count < window:
+            self._count += 1
+            self._seed_total += price
+            if self._count < window:
+                return NAN
+            self._ema = self._seed_total / window
+        else:
+            self._ema = ((price - self._ema) * self._k) + self._ema
+        return self._ema
+
+    def _state(self):
+        return {'count': self._count, 'seed_total': self._seed_total, 'ema': self._ema}
+
+    def _load(self, state):
+        self._count = state['count']
+        self._seed_total = state['seed_total']
+        self._ema = state['ema']
+
+
+# ---------- Wilder smoothing (RSI) ----------
+class RSIState(IndicatorState):
+    """
+    RSI from the previous price and Wilder-smoothed average gain and loss.
+    """
+
+    name = 'rsi'
+    defaults = {'window': 14}
+
+    def __init__(self, **params):
+        super().__init__(**params)
+        self._previous = NAN
+        self._changes = 0
+        self._gain = 0.0
+        self._loss = 0.0
+
+    def _rsi(self):
+        total = self._loss + self._gain
+        if -TA_EPSILON < total < TA_EPSILON:
+            return 0.0
+        return 100.0 * (self._gain / total)
+
+    def _step(self, price):
+        window = self.params['window']
+        if self._changes == 0 and math.isnan(self._previous):
+            self._previous = price
+            return NAN
+        change = price - self._previous
+        self._previous = price
+        self._changes += 1
+
+        if self._changes <= window:
+            # First averages are plain means of the first `window` changes
+            if change < 0:
+                self._loss -= change
+            else:
+                self._gain += change
+            if self._changes < window:
+                return NAN
+            self._loss /= window
+            self._gain /= window
+        else:
+            self._loss *= (window - 1)
+            self._gain *= (window - 1)
+            if change < 0:
+                self._loss -= change
+            else:
+                self._gain += change
+            self._loss /= window
+            self._gain /= window
+
+        return self._rsi()
+
+    def _state(self):
+        return {'previous': self._previous, 'changes': self._changes, 'gain': self._gain, 'loss': self._loss}
+
+    def _load(self, state):
+        self._previous = state['previous']
+        self._changes = state['changes']
+        self._gain = state['gain']
+        self._loss = state['loss']
+
+
+# ---------- MACD ----------
+class MACDState(IndicatorState):
+    """
+    MACD from a fast and a slow EMA plus a signal EMA of their difference.
+    As in TA-Lib the fast EMA starts on bar slow - fast, so both EMAs begin on the same bar,
+    and nothing is output until the signal line exists.
+    """
+
+    name = 'macd'
+    defaults = {'fast': 12, 'slow': 26, 'signal': 9}
+
+    def __init__(self, **params):
+        super().__init__(**params)
+        fast, slow = sorted((self.params['fast'], self.params['slow']))
+        self._skip_fast = slow - fast
+        self._bars = 0
+        self._fast = EMAState(window=fast)
+        self._slow = EMAState(window=slow)
+        self._signal = EMAState(window=self.params['signal'])
+
+    def _step(self, price):
+        self._bars += 1
+        slow = self._slow._step(price)
+        if self._bars <= self._skip_fast:
+            return self._empty()
+        fast = self._fast._step(price)
+        if self._bars < self._slow.params['window']:
+            return self._empty()
+        macd = fast - slow
+        signal = self._signal._step(macd)
+        if self._bars < self._slow.params['window'] + self.params['signal'] - 1:
+            return self._empty()
+        return (macd, signal, macd - signal)
+
+    def _state(self):
+        return {'bars': self._bars, 'fast': self._fast.snapshot(), 'slow': self._slow.snapshot(),
+                'signal': self._signal.snapshot()}
+
+    def _load(self, state):
+        self._bars = state['bars']
+        self._fast = EMAState.restore(state['fast'])
+        self._slow = EMAState.restore(state['slow'])
+        self._signal = EMAState.restore(state['signal'])
+
+
+# ---------- Bollinger Bands ----------
+class BollingerState(IndicatorState):
+    """
+    Bollinger Bands from a ring buffer with running sums of prices and squared prices
+    (population standard deviation around the SMA).
+    """
+
+    name = 'bbands'
+    defaults = {'window': 20, 'num_std': 2}
+
+    def __init__(self, **params):
+        super().__init__(**params)
+        self._buffer = deque(maxlen=self.params['window'])
+        self._total = 0.0
+        self._total_sq = 0.0
+
+    def _step(self, price):
+        window = self.params['window']
+        self._buffer.append(price)
+        self._total += price
+        self._total_sq += price * price
+        if len(self._buffer) < window:
+            return self._empty()
+        oldest = self._buffer[0]
+        middle = self._total / window
+        self._total -= oldest
+        variance = self._total_sq / window
+        self._total_sq -= oldest * oldest
+        variance -= middle * middle
+        std = 0.0 if variance < TA_EPSILON else math.sqrt(variance)
+        width = std * self.params['num_std']
+        return (middle + width, middle, middle - width)
+
+    def _state(self):
+        return {'buffer': list(self._buffer), 'total': self._total, 'total_sq': self._total_sq}
+
+    def _load(self, state):
+        self._buffer.extend(state['buffer'])
+        self._total = state['total']
+        self._total_sq = state['total_sq']
+
+
+# ---------- Several indicators on one price series ----------
+STATES = {state.name: state for state in (SMAState, EMAState, RSIState, MACDState, BollingerState)}
+
+
+def restore_state(snapshot):
+    """
+    Rebuild any indicator state (or IndicatorStream) from its snapshot().
+    """
+    if snapshot.get('indicator') == IndicatorStream.name:
+        return IndicatorStream.restore(snapshot)
+    if snapshot.get('indicator') not in STATES:
+        raise ValueError(f"Unknown indicator in snapshot: {snapshot.get('indicator')!r}")
+    return STATES[snapshot['indicator']].restore(snapshot)
+
+
+class IndicatorStream:
+    """
+    Streaming counterpart of compute_indicators: one state per indicator spec,
+    all fed from the same price series.
+
+    Usage:
+        stream = IndicatorStream(['rsi', ('sma', {'window': 50}), 'macd'])
+        stream.update_many(df['Price'])          # history
+        latest = stream.update(new_price)        # {'RSI_14': ..., 'SMA_50': ..., 'MACD': ..., ...}
+    """
+
+    name = 'stream'
+
+    def __init__(self, specs):
+        """
+        Parameters:
+        - specs: indicator specs (see indicators.resolve_indicator_specs)
+        """
+        self.states = [STATES[name](**params) for name, params, _ in resolve_indicator_specs(specs)]
+        self.columns = [col for state in self.states for col in state.columns]
+
+    def update(self, price):
+        """
+        Add one bar to every indicator.
+
+        Returns:
+        - dict: {column: value}
+        """
+        values = []
+        for state in self.states:
+            value = state.update(price)
+            values.extend(value if isinstance(value, tuple) else (value,))
+        return dict(zip(self.columns, values))
+
+    def update_many(self, prices):
+        """
+        Add a batch of bars to every indicator.
+
+        Returns:
+        - np.ndarray: (len(prices), len(columns)) values in column order
+        """
+        blocks = [state.update_many(prices) for state in self.states]
+        if not blocks:
+            return np.empty((len(prices), 0))
+        return np.column_stack(blocks)
+
+    def snapshot(self):
+        """Snapshots of every indicator state."""
+        return {'indicator': self.name, 'states': [state.snapshot() for state in self.states]}
+
+    @classmethod
+    def restore(cls, snapshot):
+        """Rebuild a stream from snapshot()."""
+        obj = cls([])
+        obj.states = [restore_state(state) for state in snapshot['states']]
+        obj.columns = [col for state in obj.states for col in state.columns]
+        return obj